@@ -0,0 +1,331 @@
+#!/usr/bin/python3
+
+import getopt
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dcos_context.context as context  # noqa: E402
+import dcos_context.group as group  # noqa: E402
+import dcos_context.lazy as lazy  # noqa: E402
+import dcos_context.session as session  # noqa: E402
+import dcos_context.tokencache as tokencache  # noqa: E402
+
+from bench.emulator import Emulator  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
+CLUSTER = "bench"
+OPERATIONS = ("create", "group_add", "delete")
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0],
+          '[--contexts=1,10,100] [--latency=SECONDS] [--jitter=SECONDS] [--concurrency=N] [--workers=N] ' +
+          '[--jobs=N] [--batch] [--parallel] [--dag] [--output=FILE] [--baseline=FILE] [--tolerance=RATE]')
+    print("\nEnd-to-End Benchmark fuer Context anlegen/loeschen und User Gruppen gegen den lokalen Emulator")
+    print("\nArguments:")
+    print(" %-15s %-30s" % ("--contexts", "Optional, Anzahl Contexte pro Lauf (Default: 1,10,100)"))
+    print(" %-15s %-30s" % ("--latency", "Optional, Antwortzeit des Emulators in Sekunden (Default: 0.01)"))
+    print(" %-15s %-30s" % ("--jitter", "Optional, zufaellige zusaetzliche Antwortzeit (Default: 0.005)"))
+    print(" %-15s %-30s" % ("--concurrency", "Optional, max. gleichzeitige Requests im Emulator (Default: 0)"))
+    print(" %-15s %-30s" % ("--workers", "Optional, wie mgt-context.py --workers (Default: 1)"))
+    print(" %-15s %-30s" % ("--jobs", "Optional, Anzahl parallel bearbeiteter Contexte (Default: 1)"))
+    print(" %-15s %-30s" % ("--batch", "Optional, wie mgt-context.py --batch"))
+    print(" %-15s %-30s" % ("--parallel", "Optional, wie mgt-context.py --parallel"))
+    print(" %-15s %-30s" % ("--dag", "Optional, wie mgt-context.py --dag"))
+    print(" %-15s %-30s" % ("--output", "Optional, Ergebnis als JSON schreiben (z.B. als Baseline)"))
+    print(" %-15s %-30s" % ("--baseline", "Optional, mit gespeichertem Ergebnis vergleichen, Exit 1 bei Regression"))
+    print(" %-15s %-30s" % ("--tolerance", "Optional, erlaubte Abweichung zur Baseline (Default: 0.2)"))
+    print("\nExamples:")
+    print(" ", sys.argv[0], '--contexts=1,10,100,1000 --workers=8 --jobs=4 --output=baseline.json')
+    print(" ", sys.argv[0], '--contexts=1,10,100,1000 --workers=8 --jobs=4 --baseline=baseline.json')
+    print("\n")
+    sys.exit(2)
+
+
+def percentile(values, quantile):
+    """
+    Quantil nach Nearest-Rank
+
+    Args:
+        values = Messwerte (list)
+        quantile = Quantil zwischen 0 und 1 (float)
+
+    Returns:
+        Messwert (float) oder None
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    # Rundung gegen Float Fehler, z.B. 0.07 * 100 = 7.000000000000001
+    index = max(0, math.ceil(round(quantile * len(values), 9)) - 1)
+    return values[index]
+
+
+def run_operation(emulator, func, names, jobs):
+    """
+    Operation fuer alle Contexte ausfuehren und messen
+
+    Args:
+        emulator = Emulator
+        func = Funktion mit Context Name als Argument, liefert True/False (function)
+        names = Context Namen (list)
+        jobs = Anzahl parallel bearbeiteter Contexte (int)
+
+    Returns:
+        Messergebnis (dict)
+    """
+    durations = []
+
+    def timed(name):
+        start = time.perf_counter()
+        result = func(name)
+        durations.append(time.perf_counter() - start)
+        return result
+
+    calls = emulator.stats()["total"]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="bench") as executor:
+        results = list(executor.map(timed, names))
+    seconds = time.perf_counter() - start
+
+    return {
+        "count": len(names),
+        "failed": results.count(False),
+        "seconds": round(seconds, 4),
+        "throughput": round(len(names) / seconds * 60, 2),
+        "p50": round(percentile(durations, 0.50), 4),
+        "p95": round(percentile(durations, 0.95), 4),
+        "p99": round(percentile(durations, 0.99), 4),
+        "http_calls": emulator.stats()["total"] - calls
+    }
+
+
+def run_scale(emulator, count, workers, jobs, options):
+    """
+    Contexte anlegen, je eine User Gruppe hinzufuegen und Contexte loeschen
+
+    Args:
+        emulator = Emulator
+        count = Anzahl Contexte (int)
+        workers = Anzahl paralleler Requests pro Context (int)
+        jobs = Anzahl parallel bearbeiteter Contexte (int)
+        options = batch, parallel, use_dag fuer context_tasks (dict)
+
+    Returns:
+        Messergebnis pro Operation (dict)
+    """
+    emulator.reset()
+    cfg_dcos = {CLUSTER: {"url": emulator.url, "user": "bench", "password": "bench"}}
+    cfg_nexus = {CLUSTER: {"url": [emulator.url], "user": "bench", "password": "bench"}}
+    names = ["bench%05d" % index for index in range(count)]
+
+    def context_run(name, create):
+        return context.context_tasks(
+            context_name=name,
+            port_nexus=str(20000 + int(name[len("bench"):])),
+            cluster=CLUSTER,
+            cfg_dcos=cfg_dcos,
+            cfg_nexus=cfg_nexus,
+            create=create,
+            delete=not create,
+            workers=workers,
+            **options
+        )
+
+    def group_add(name):
+        return group.dcos_user_group(
+            remove=False,
+            add=True,
+            gid="grp_" + name,
+            role="dev",
+            context_name=name,
+            api_user="bench",
+            api_pass="bench",
+            api_url=emulator.url,
+            workers=workers
+        )
+
+    return {
+        "create": run_operation(emulator, lambda name: context_run(name, True), names, jobs),
+        "group_add": run_operation(emulator, group_add, names, jobs),
+        "delete": run_operation(emulator, lambda name: context_run(name, False), names, jobs)
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Ergebnisse mit einer Baseline vergleichen
+
+    Regression: Durchsatz um mehr als tolerance niedriger, p95 um mehr
+    als tolerance hoeher oder mehr HTTP Calls als in der Baseline.
+
+    Args:
+        results = Ergebnisse pro Anzahl Contexte (dict)
+        baseline = Gespeicherte Ergebnisse (dict)
+        tolerance = Erlaubte Abweichung (float)
+
+    Returns:
+        Regressionen (list of string)
+    """
+    regressions = []
+    for count, operations in sorted(results.items(), key=lambda item: int(item[0])):
+        for operation, result in operations.items():
+            base = baseline.get(count, {}).get(operation)
+            if base is None:
+                continue
+            label = count + " Contexte " + operation + ": "
+            if result["throughput"] < base["throughput"] * (1 - tolerance):
+                regressions.append(label + "Durchsatz " + str(result["throughput"]) + "/min statt " +
+                                   str(base["throughput"]) + "/min")
+            if result["p95"] > base["p95"] * (1 + tolerance):
+                regressions.append(label + "p95 " + str(result["p95"]) + "s statt " + str(base["p95"]) + "s")
+            if result["http_calls"] > base["http_calls"]:
+                regressions.append(label + str(result["http_calls"]) + " HTTP Calls statt " +
+                                   str(base["http_calls"]))
+
+    return regressions
+
+
+def report(results):
+    """
+    Ergebnisse als Tabelle ausgeben
+
+    Args:
+        results = Ergebnisse pro Anzahl Contexte (dict)
+    """
+    print(" %8s %-10s %12s %8s %8s %8s %10s %7s" %
+          ("Contexte", "Operation", "Contexte/min", "p50", "p95", "p99", "HTTP Calls", "Fehler"))
+    for count, operations in sorted(results.items(), key=lambda item: int(item[0])):
+        for operation in OPERATIONS:
+            result = operations[operation]
+            print(" %8s %-10s %12.1f %7.3fs %7.3fs %7.3fs %10d %7d" %
+                  (count, operation, result["throughput"], result["p50"], result["p95"], result["p99"],
+                   result["http_calls"], result["failed"]))
+
+
+def main():
+    """
+    MAIN
+    """
+    arg_contexts = [1, 10, 100]
+    arg_latency = 0.01
+    arg_jitter = 0.005
+    arg_concurrency = 0
+    arg_workers = 1
+    arg_jobs = 1
+    arg_output = False
+    arg_baseline = False
+    arg_tolerance = 0.2
+    options = {"batch": False, "parallel": False, "use_dag": False}
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:],
+            "",
+            ["help", "contexts=", "latency=", "jitter=", "concurrency=", "workers=", "jobs=", "batch", "parallel",
+             "dag", "output=", "baseline=", "tolerance="]
+        )
+    except getopt.GetoptError:
+        usage()
+
+    for opt, arg in opts:
+        if opt == '--help':
+            usage()
+        elif opt == '--contexts':
+            try:
+                arg_contexts = [int(count) for count in arg.split(",")]
+            except ValueError:
+                usage()
+        elif opt == '--latency':
+            try:
+                arg_latency = float(arg)
+            except ValueError:
+                usage()
+        elif opt == '--jitter':
+            try:
+                arg_jitter = float(arg)
+            except ValueError:
+                usage()
+        elif opt == '--concurrency':
+            try:
+                arg_concurrency = int(arg)
+            except ValueError:
+                usage()
+        elif opt == '--workers':
+            try:
+                arg_workers = int(arg)
+            except ValueError:
+                usage()
+        elif opt == '--jobs':
+            try:
+                arg_jobs = int(arg)
+            except ValueError:
+                usage()
+        elif opt == '--batch':
+            options["batch"] = True
+        elif opt == '--parallel':
+            options["parallel"] = True
+        elif opt == '--dag':
+            options["use_dag"] = True
+        elif opt == '--output':
+            arg_output = arg
+        elif opt == '--baseline':
+            arg_baseline = arg
+        elif opt == '--tolerance':
+            try:
+                arg_tolerance = float(arg)
+            except ValueError:
+                usage()
+
+    if arg_workers < 1 or arg_jobs < 1:
+        usage()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s %(levelname)s : %(message)s')
+    tokencache.path = ""
+    session.pool_maxsize = max(session.pool_maxsize, arg_workers * arg_jobs * 2)
+    lazy.resolve(context.dcos, context.nexus, group.dcos)
+
+    results = {}
+    with Emulator(latency=arg_latency, jitter=arg_jitter, concurrency=arg_concurrency) as emulator:
+        for count in arg_contexts:
+            results[str(count)] = run_scale(emulator, count, arg_workers, arg_jobs, options)
+    session.close()
+
+    report(results)
+    data = {
+        "options": dict(options, latency=arg_latency, jitter=arg_jitter, concurrency=arg_concurrency,
+                        workers=arg_workers, jobs=arg_jobs),
+        "results": results
+    }
+    if arg_output:
+        with open(arg_output, 'w') as output_file:
+            json.dump(data, output_file, indent=2, sort_keys=True)
+
+    failed = sum(result["failed"] for operations in results.values() for result in operations.values())
+    if failed:
+        print("\nFehlgeschlagene Operationen: " + str(failed))
+
+    if arg_baseline:
+        with open(arg_baseline, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("options") != data["options"]:
+            print("\nWarnung: Baseline mit anderen Optionen gemessen: " + json.dumps(baseline.get("options")))
+        regressions = compare(results, baseline["results"], arg_tolerance)
+        for regression in regressions:
+            print("Regression: " + regression)
+        if regressions:
+            sys.exit(1)
+        print("\nKeine Regression gegenueber " + arg_baseline)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
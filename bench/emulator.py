@@ -0,0 +1,471 @@
+#!/usr/bin/python3
+
+import base64
+import getopt
+import json
+import random
+import sys
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, unquote
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0],
+          '[--host=HOST] [--port=PORT] [--latency=SECONDS] [--jitter=SECONDS] [--error_rate=RATE] ' +
+          '[--concurrency=N] [--visibility_delay=SECONDS]')
+    print("\nLokaler DC/OS und Nexus Emulator fuer Tests und Benchmarks")
+    print("\nArguments:")
+    print(" %-20s %-30s" % ("--host", "Optional, Listen Adresse (Default: 127.0.0.1)"))
+    print(" %-20s %-30s" % ("--port", "Optional, Port (Default: 8080)"))
+    print(" %-20s %-30s" % ("--latency", "Optional, Antwortzeit pro Request in Sekunden (Default: 0)"))
+    print(" %-20s %-30s" % ("--jitter", "Optional, zufaellige zusaetzliche Antwortzeit bis zu Sekunden"))
+    print(" %-20s %-30s" % ("--error_rate", "Optional, Anteil der Requests mit HTTP 503 (0 bis 1)"))
+    print(" %-20s %-30s" % ("--concurrency", "Optional, max. gleichzeitig bearbeitete Requests, Rest wartet"))
+    print(" %-20s %-30s" % ("--visibility_delay", "Optional, Nexus Objekte erst nach Sekunden lesbar"))
+    print("\nExamples:")
+    print(" ", sys.argv[0], '--port=18080 --latency=0.05 --jitter=0.02 --concurrency=16')
+    print("\n")
+    sys.exit(2)
+
+
+class State(object):
+    """
+    Zustand der emulierten DC/OS und Nexus Objekte
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = set()
+        self.service_groups = set()
+        self.groups = set()
+        self.acls = {}
+        self.nexus = {
+            "coreui_Repository": {},
+            "coreui_Role": {},
+            "coreui_User": {}
+        }
+
+
+class Emulator(object):
+    """
+    DC/OS (Login, IAM Gruppen und ACLs, Marathon Gruppen) und Nexus
+    (ExtDirect) Endpoints in einem lokalen HTTP Server
+
+    Die Objekte werden im Speicher gehalten, Anlegen liefert 201 bzw.
+    409, Grants 204 bzw. 409, Loeschen 204 (Marathon 200) bzw. 404.
+
+    Args:
+        host = Listen Adresse (string)
+        port = Port, 0 = frei waehlen (int)
+        latency = Antwortzeit pro Request in Sekunden (float)
+        jitter = Zufaellige zusaetzliche Antwortzeit bis zu Sekunden (float)
+        error_rate = Anteil der Requests mit HTTP 503 (float)
+        concurrency = Max. gleichzeitig bearbeitete Requests, 0 = unbegrenzt (int)
+        visibility_delay = Nexus Objekte erst nach Sekunden lesbar (float)
+        token_ttl = Gueltigkeit der DC/OS Tokens in Sekunden (int)
+        user = DC/OS und Nexus User, None = jeder User (string)
+        password = DC/OS und Nexus Passwort (string)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, concurrency=0,
+                 visibility_delay=0.0, token_ttl=3600, user=None, password=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.visibility_delay = visibility_delay
+        self.token_ttl = token_ttl
+        self.user = user
+        self.password = password
+        self.state = State()
+        self.requests = {}
+        self.active = 0
+        self.max_active = 0
+        self._slots = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self._stats_lock = threading.Lock()
+        self._random = random.Random()
+        self._thread = None
+
+        emulator = self
+
+        class Handler(_Handler):
+            pass
+
+        Handler.emulator = emulator
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        """ Basis URL des Emulators """
+        host, port = self.server.server_address[:2]
+        return "http://" + host + ":" + str(port)
+
+    def start(self):
+        """
+        Server in einem Hintergrund Thread starten
+
+        Returns:
+            Emulator
+        """
+        self._thread = threading.Thread(target=self.server.serve_forever, name="emulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Server stoppen
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def reset(self):
+        """
+        Objekte und Statistik loeschen, Tokens bleiben gueltig
+        """
+        tokens = self.state.tokens
+        self.state = State()
+        self.state.tokens = tokens
+        with self._stats_lock:
+            self.requests = {}
+            self.max_active = 0
+
+    def stats(self):
+        """
+        Anzahl Requests pro Endpoint und max. gleichzeitige Requests
+
+        Returns:
+            Statistik (dict)
+        """
+        with self._stats_lock:
+            return {
+                "requests": dict(self.requests),
+                "total": sum(self.requests.values()),
+                "max_active": self.max_active
+            }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.stop()
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Request Handler, emulator wird pro Server gesetzt
+    """
+    protocol_version = "HTTP/1.1"
+    # Header und Body gehen getrennt raus, mit Nagle wartet der Body sonst auf das verzoegerte ACK (~40 ms)
+    disable_nagle_algorithm = True
+    emulator = None
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        emulator = self.emulator
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+        segments = [unquote(segment) for segment in path.strip("/").split("/")]
+
+        if emulator._slots is not None:
+            emulator._slots.acquire()
+        try:
+            with emulator._stats_lock:
+                key = self.command + " " + _template(segments)
+                emulator.requests[key] = emulator.requests.get(key, 0) + 1
+                emulator.active += 1
+                emulator.max_active = max(emulator.max_active, emulator.active)
+
+            delay = emulator.latency
+            if emulator.jitter:
+                delay += emulator._random.uniform(0, emulator.jitter)
+            if delay:
+                time.sleep(delay)
+
+            if emulator.error_rate and emulator._random.random() < emulator.error_rate:
+                status, output = 503, {"message": "Service Unavailable (emuliert)"}
+            else:
+                try:
+                    data = json.loads(body) if body else None
+                except ValueError:
+                    data = None
+                status, output = _dispatch(emulator, self.command, segments, data, self.headers)
+        finally:
+            with emulator._stats_lock:
+                emulator.active -= 1
+            if emulator._slots is not None:
+                emulator._slots.release()
+
+        payload = b"" if output is None else json.dumps(output).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _template(segments):
+    """ Endpoint Pfad mit Platzhaltern fuer die Statistik """
+    path = "/" + "/".join(segments)
+    if segments[:4] == ["acs", "api", "v1", "acls"] and len(segments) == 8:
+        return "/acs/api/v1/acls/{rid}/groups/{gid}/{action}"
+    if segments[:4] == ["acs", "api", "v1", "acls"] and len(segments) == 5:
+        return "/acs/api/v1/acls/{rid}"
+    if segments[:4] == ["acs", "api", "v1", "groups"] and len(segments) == 6:
+        return "/acs/api/v1/groups/{gid}/" + segments[5]
+    if segments[:4] == ["acs", "api", "v1", "groups"] and len(segments) == 5:
+        return "/acs/api/v1/groups/{gid}"
+    if segments[:4] == ["service", "marathon", "v2", "groups"] and len(segments) > 4:
+        return "/service/marathon/v2/groups/{id}"
+    return path
+
+
+def _dispatch(emulator, method, segments, data, headers):
+    """
+    Request auf den Zustand anwenden
+
+    Returns:
+        HTTP-Statuscode und JSON Antwort (tuple)
+    """
+    state = emulator.state
+    if segments == ["acs", "api", "v1", "auth", "login"] and method == "POST":
+        return _login(emulator, data)
+    if segments == ["service", "extdirect"] and method == "POST":
+        if not _basic_auth(emulator, headers):
+            return 401, {"message": "Unauthorized"}
+        return 200, _extdirect(emulator, data)
+
+    if segments[:1] == ["acs"] or segments[:2] == ["service", "marathon"]:
+        if headers.get("Authorization", "")[len("token="):] not in state.tokens:
+            return 401, {"code": "ERR_INVALID_AUTHORIZATION", "title": "Unauthorized"}
+
+    with state.lock:
+        # Marathon Service Gruppen
+        if segments == ["service", "marathon", "v2", "groups"] and method == "POST":
+            group_id = "/" + str((data or {}).get("id", "")).strip("/")
+            if group_id in state.service_groups:
+                return 409, {"message": "Group is already created"}
+            state.service_groups.add(group_id)
+            return 201, {"version": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"), "deploymentId": group_id}
+        if segments[:4] == ["service", "marathon", "v2", "groups"] and method == "DELETE":
+            group_id = "/" + "/".join(segments[4:]).strip("/")
+            if group_id not in state.service_groups:
+                return 404, {"message": "Group " + group_id + " does not exist"}
+            state.service_groups.discard(group_id)
+            return 200, {"version": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"), "deploymentId": group_id}
+
+        # IAM Gruppen
+        if segments[:4] == ["acs", "api", "v1", "groups"] and len(segments) == 5:
+            gid = segments[4]
+            if method == "PUT":
+                if gid in state.groups:
+                    return 409, {"code": "ERR_GROUP_ALREADY_EXISTS"}
+                state.groups.add(gid)
+                return 201, None
+            if method == "DELETE":
+                if gid not in state.groups:
+                    return 404, {"code": "ERR_UNKNOWN_GROUP_ID"}
+                state.groups.discard(gid)
+                for grants in state.acls.values():
+                    grants.pop(gid, None)
+                return 204, None
+        if segments[:4] == ["acs", "api", "v1", "groups"] and segments[5:] == ["permissions"] and method == "GET":
+            gid = segments[4]
+            if gid not in state.groups:
+                return 404, {"code": "ERR_UNKNOWN_GROUP_ID"}
+            return 200, {"array": [
+                {"rid": rid, "actions": [{"name": action, "implied": False} for action in sorted(grants[gid])]}
+                for rid, grants in sorted(state.acls.items()) if grants.get(gid)
+            ]}
+
+        # ACLs, die Resource ID wird wie bei DC/OS doppelt dekodiert
+        if segments == ["acs", "api", "v1", "acls"] and method == "GET":
+            return 200, {"array": [{"rid": rid, "description": rid} for rid in sorted(state.acls)]}
+        if segments[:4] == ["acs", "api", "v1", "acls"] and len(segments) == 5 and method == "PUT":
+            rid = unquote(segments[4])
+            if rid in state.acls:
+                return 409, {"code": "ERR_ACL_ALREADY_EXISTS"}
+            state.acls[rid] = {}
+            return 201, None
+        if segments[:4] == ["acs", "api", "v1", "acls"] and len(segments) == 8 and segments[5] == "groups":
+            rid, gid, action = unquote(segments[4]), segments[6], segments[7]
+            if rid not in state.acls or gid not in state.groups:
+                return 404, {"code": "ERR_UNKNOWN_RESOURCE_ID" if rid not in state.acls else "ERR_UNKNOWN_GROUP_ID"}
+            actions = state.acls[rid].setdefault(gid, set())
+            if method == "PUT":
+                if action in actions:
+                    return 409, {"code": "ERR_PERMISSION_ALREADY_EXISTS"}
+                actions.add(action)
+                return 204, None
+            if method == "DELETE":
+                if action not in actions:
+                    return 404, {"code": "ERR_UNKNOWN_PERMISSION"}
+                actions.discard(action)
+                return 204, None
+
+    return 404, {"message": "Not Found (emuliert)"}
+
+
+def _login(emulator, data):
+    """ DC/OS Login, liefert ein JWT mit exp Claim """
+    data = data or {}
+    if emulator.user is not None and (data.get("uid") != emulator.user or data.get("password") != emulator.password):
+        return 401, {"code": "ERR_INVALID_CREDENTIALS"}
+
+    claims = {"uid": data.get("uid"), "exp": int(time.time()) + emulator.token_ttl}
+    token = ".".join(
+        base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+        for part in ({"alg": "none", "typ": "JWT"}, claims, str(random.random()))
+    )
+    with emulator.state.lock:
+        emulator.state.tokens.add(token)
+    return 200, {"token": token}
+
+
+def _missing_references(emulator, action, item, now):
+    """
+    Noch nicht sichtbare Repositories bzw. Rollen, auf die eine neue Rolle
+    (Privileges, enthaltene Rollen) oder ein neuer User verweist
+    """
+    nexus_state = emulator.state.nexus
+    visible_roles = set(name for name, (role, since) in nexus_state["coreui_Role"].items() if since <= now)
+    if action == "coreui_User":
+        return sorted(set(item.get("roles") or []) - visible_roles)
+    if action != "coreui_Role":
+        return []
+
+    visible_repos = set(name for name, (repo, since) in nexus_state["coreui_Repository"].items() if since <= now)
+    missing = set(item.get("roles") or []) - visible_roles
+    for privilege in item.get("privileges") or []:
+        # nx-repository-<view|admin>-<format>-<repo>-<action>
+        parts = privilege.rsplit("-", 1)[0].split("-", 4)
+        if parts[:2] == ["nx", "repository"] and len(parts) == 5 and parts[4] not in visible_repos:
+            missing.add(parts[4])
+    return sorted(missing)
+
+
+def _basic_auth(emulator, headers):
+    """ Nexus Basic Auth pruefen """
+    if emulator.user is None:
+        return True
+    expected = base64.b64encode((emulator.user + ":" + (emulator.password or "")).encode()).decode()
+    return headers.get("Authorization", "") == "Basic " + expected
+
+
+def _extdirect(emulator, data):
+    """ Einzelnen oder Batch ExtDirect Request bearbeiten """
+    if isinstance(data, list):
+        return [_extdirect_call(emulator, api_call) for api_call in data]
+    return _extdirect_call(emulator, data or {})
+
+
+def _extdirect_call(emulator, api_call):
+    """ Einen ExtDirect Call auf die Nexus Objekte anwenden """
+    action = api_call.get("action")
+    method = api_call.get("method")
+    rsp = {"tid": api_call.get("tid"), "action": action, "method": method, "type": "rpc"}
+    objects = emulator.state.nexus.get(action)
+    if objects is None:
+        rsp["result"] = {"success": False, "message": "Unbekannte Action " + str(action)}
+        return rsp
+
+    key = {"coreui_Repository": "name", "coreui_Role": "id", "coreui_User": "userId"}[action]
+    now = time.monotonic()
+    with emulator.state.lock:
+        if method in ("read", "readReferences"):
+            visible = [item for item, since in objects.values() if since <= now]
+            rsp["result"] = {"success": True, "data": visible}
+        elif method == "create":
+            item = dict(api_call["data"][0])
+            missing = _missing_references(emulator, action, item, now)
+            if item[key] in objects:
+                rsp["result"] = {"success": False, "message": item[key] + " existiert bereits"}
+            elif missing:
+                rsp["result"] = {"success": False, "message": "Nicht gefunden: " + ", ".join(missing)}
+            else:
+                item["version"] = "1"
+                objects[item[key]] = (item, now + emulator.visibility_delay)
+                rsp["result"] = {"success": True, "data": item}
+        elif method == "update":
+            item = dict(api_call["data"][0])
+            if item[key] not in objects:
+                rsp["result"] = {"success": False, "message": item[key] + " nicht gefunden"}
+            else:
+                objects[item[key]] = (item, objects[item[key]][1])
+                rsp["result"] = {"success": True, "data": item}
+        elif method == "remove":
+            name = api_call["data"][0]
+            if objects.pop(name, None) is None:
+                rsp["result"] = {"success": False, "message": str(name) + " nicht gefunden"}
+            else:
+                rsp["result"] = {"success": True}
+        else:
+            rsp["result"] = {"success": False, "message": "Unbekannte Methode " + str(method)}
+
+    return rsp
+
+
+def main():
+    """
+    MAIN
+    """
+    options = {"host": "127.0.0.1", "port": 8080}
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:],
+            "",
+            ["help", "host=", "port=", "latency=", "jitter=", "error_rate=", "concurrency=", "visibility_delay="]
+        )
+    except getopt.GetoptError:
+        usage()
+
+    for opt, arg in opts:
+        if opt == '--help':
+            usage()
+        elif opt == '--host':
+            options["host"] = arg
+        elif opt in ('--port', '--concurrency'):
+            try:
+                options[opt[2:]] = int(arg)
+            except ValueError:
+                usage()
+        else:
+            try:
+                options[opt[2:]] = float(arg)
+            except ValueError:
+                usage()
+
+    emulator = Emulator(**options)
+    print("Emulator laeuft auf " + emulator.url)
+    try:
+        emulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
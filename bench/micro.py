@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+
+import getopt
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dcos_context.fleet as fleet  # noqa: E402
+import dcos_context.nexus as nexus  # noqa: E402
+import dcos_context.plan as plan  # noqa: E402
+import dcos_context.schema as schema  # noqa: E402
+
+ENVS = ("prod", "nprod")
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0],
+          '[--names=N] [--repeat=N] [--only=BENCHMARK,...] [--output=FILE] [--baseline=FILE] [--tolerance=RATE]')
+    print("\nCPU und Speicher Microbenchmarks fuer Schema, ACL Plan und Payloads (ohne Netzwerk)")
+    print("\nArguments:")
+    print(" %-15s %-30s" % ("--names", "Optional, Anzahl synthetischer Context Namen (Default: 10000)"))
+    print(" %-15s %-30s" % ("--repeat", "Optional, Wiederholungen, gewertet wird die schnellste (Default: 3)"))
+    print(" %-15s %-30s" % ("--only", "Optional, nur diese Benchmarks: " +
+                            ", ".join(name for name, setup, func in BENCHMARKS)))
+    print(" %-15s %-30s" % ("--output", "Optional, Ergebnis als JSON schreiben (z.B. als Baseline)"))
+    print(" %-15s %-30s" % ("--baseline", "Optional, mit gespeichertem Ergebnis vergleichen, Exit 1 bei Regression"))
+    print(" %-15s %-30s" % ("--tolerance", "Optional, erlaubte Abweichung zur Baseline (Default: 0.2)"))
+    print("\nExamples:")
+    print(" ", sys.argv[0], '--output=micro_baseline.json')
+    print(" ", sys.argv[0], '--baseline=micro_baseline.json')
+    print("\n")
+    sys.exit(2)
+
+
+def setup_names(names):
+    """ Keine Vorbereitung, Caches leeren """
+    schema.dcos.cache_clear()
+    schema.dcos_acl.cache_clear()
+    return names
+
+
+def bench_schema_dcos(names):
+    """ DCOS Schema inkl. aller User Gruppen ACLs rendern """
+    for name in names:
+        param = schema.dcos(name)
+        for env in ENVS:
+            for gid in param["user_group"]:
+                param["user_group_acl"][env][param["user_group"][gid]["role"]]
+
+
+def bench_schema_nexus(names):
+    """ Nexus Schema rendern """
+    for index, name in enumerate(names):
+        schema.nexus(name, str(20000 + index))
+
+
+def bench_acl_state_dicts(names):
+    """ Soll-ACLs aller Contexte als gerenderte dicts halten und alle Tripel durchlaufen """
+    state = [(role + "_" + name, schema.dcos_acl(name, "prod", role)) for name in names for role in ("dev", "devops")]
+    for gid, acl in state:
+        for rid, actions in acl.items():
+            for action in actions:
+                pass
+
+
+def bench_acl_state_fleet(names):
+    """ Soll-ACLs aller Contexte als Flyweight halten und alle Tripel streamen """
+    state = fleet.Fleet()
+    for name in names:
+        state.add(name, "prod")
+    for context, rid, action in state.triples():
+        pass
+
+
+def setup_acls(names):
+    """ ACL Schemas pro Context vorab rendern """
+    result = []
+    for name in names:
+        user_groups = schema.dcos_user_group(name)
+        result.append([(gid, schema.dcos_acl(name, "prod", user_groups[gid]["role"])) for gid in user_groups])
+    return result
+
+
+def bench_plan_build(acls):
+    """ ACL Plan pro Context erstellen (Deduplizierung und rid Maskierung) """
+    for context_acls in acls:
+        plan.compile_acls(context_acls)
+
+
+def setup_plans(names):
+    """ Service Gruppen und ACL Plans pro Context vorab erstellen """
+    return [(schema.dcos_service_group(name), plan.compile_acls(context_acls))
+            for name, context_acls in zip(names, setup_acls(names))]
+
+
+def bench_payload_dcos(plans):
+    """ DCOS Request Bodies serialisieren und ACL URLs bauen """
+    url = "https://dcos.example/acs/api/v1/acls"
+    for service_group, acl_plan in plans:
+        json.dumps(service_group)
+        for resource in acl_plan.resources:
+            url + resource.path
+            json.dumps({"description": "string"})
+        for grant in acl_plan.grants:
+            url + grant.path
+
+
+def setup_nexus(names):
+    """ Nexus Schemas vorab rendern """
+    return [schema.nexus(name, str(20000 + index)) for index, name in enumerate(names)]
+
+
+def bench_payload_nexus(params):
+    """ Nexus ExtDirect Calls bauen und serialisieren """
+    for param in params:
+        calls = [nexus.repo_create_call(repo_name, repo) for repo_name, repo in param["repo"].items()]
+        calls += [nexus.role_create_call(role_name, role) for role_name, role in param["role"].items()]
+        calls += [nexus.user_create_call(user_name, nexus_user) for user_name, nexus_user in param["user"].items()]
+        json.dumps(calls)
+
+
+# Name, Vorbereitung (nicht gemessen) und gemessene Funktion
+BENCHMARKS = [
+    ("schema_dcos", setup_names, bench_schema_dcos),
+    ("schema_nexus", setup_names, bench_schema_nexus),
+    ("acl_state_dicts", setup_names, bench_acl_state_dicts),
+    ("acl_state_fleet", setup_names, bench_acl_state_fleet),
+    ("plan_build", setup_acls, bench_plan_build),
+    ("payload_dcos", setup_plans, bench_payload_dcos),
+    ("payload_nexus", setup_nexus, bench_payload_nexus)
+]
+
+
+def measure(setup, func, names, repeat):
+    """
+    Benchmark messen: schnellster Lauf und Speicher Peak (tracemalloc)
+
+    Args:
+        setup = Vorbereitung mit names als Argument (function)
+        func = Gemessene Funktion mit dem Ergebnis von setup (function)
+        names = Context Namen (list)
+        repeat = Anzahl Wiederholungen (int)
+
+    Returns:
+        Messergebnis (dict)
+    """
+    seconds = None
+    for run in range(repeat):
+        arg = setup(names)
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    # Eigener Lauf, tracemalloc verlangsamt die Ausfuehrung
+    arg = setup(names)
+    tracemalloc.start()
+    func(arg)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": round(seconds, 4),
+        "us_per_name": round(seconds / len(names) * 1000000, 2),
+        "peak_kib": round(peak / 1024.0, 1),
+        "retained_kib": round(current / 1024.0, 1)
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Ergebnisse mit einer Baseline vergleichen
+
+    Regression: Laufzeit oder Speicher Peak um mehr als tolerance hoeher.
+
+    Args:
+        results = Ergebnisse pro Benchmark (dict)
+        baseline = Gespeicherte Ergebnisse pro Benchmark (dict)
+        tolerance = Erlaubte Abweichung (float)
+
+    Returns:
+        Regressionen (list of string)
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["us_per_name"] > base["us_per_name"] * (1 + tolerance):
+            regressions.append(name + ": " + str(result["us_per_name"]) + "us/Name statt " +
+                               str(base["us_per_name"]) + "us/Name")
+        if result["peak_kib"] > base["peak_kib"] * (1 + tolerance):
+            regressions.append(name + ": Peak " + str(result["peak_kib"]) + "KiB statt " +
+                               str(base["peak_kib"]) + "KiB")
+
+    return regressions
+
+
+def main():
+    """
+    MAIN
+    """
+    arg_names = 10000
+    arg_repeat = 3
+    arg_only = False
+    arg_output = False
+    arg_baseline = False
+    arg_tolerance = 0.2
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:],
+            "",
+            ["help", "names=", "repeat=", "only=", "output=", "baseline=", "tolerance="]
+        )
+    except getopt.GetoptError:
+        usage()
+
+    for opt, arg in opts:
+        if opt == '--help':
+            usage()
+        elif opt == '--names':
+            arg_names = int(arg)
+        elif opt == '--repeat':
+            arg_repeat = int(arg)
+        elif opt == '--only':
+            arg_only = arg.split(",")
+        elif opt == '--output':
+            arg_output = arg
+        elif opt == '--baseline':
+            arg_baseline = arg
+        elif opt == '--tolerance':
+            arg_tolerance = float(arg)
+
+    if arg_names < 1 or arg_repeat < 1:
+        usage()
+
+    names = ["context%05d" % index for index in range(arg_names)]
+    results = {}
+    print(" %-15s %10s %12s %12s %12s" % ("Benchmark", "Sekunden", "us/Name", "Peak KiB", "Rest KiB"))
+    for name, setup, func in BENCHMARKS:
+        if arg_only and name not in arg_only:
+            continue
+        result = results[name] = measure(setup, func, names, arg_repeat)
+        print(" %-15s %10.4f %12.2f %12.1f %12.1f" %
+              (name, result["seconds"], result["us_per_name"], result["peak_kib"], result["retained_kib"]))
+
+    data = {"names": arg_names, "results": results}
+    if arg_output:
+        with open(arg_output, 'w') as output_file:
+            json.dump(data, output_file, indent=2, sort_keys=True)
+
+    if arg_baseline:
+        with open(arg_baseline, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("names") != arg_names:
+            print("\nWarnung: Baseline mit " + str(baseline.get("names")) + " Namen gemessen")
+        regressions = compare(results, baseline["results"], arg_tolerance)
+        for regression in regressions:
+            print("Regression: " + regression)
+        if regressions:
+            sys.exit(1)
+        print("\nKeine Regression gegenueber " + arg_baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+
+import getopt
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipapp
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEPENDENCIES = ("requests", "PyYAML")
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0], '[--output=FILE] [--with-deps] [--python=INTERPRETER]')
+    print("\ndcos_context/ als ausfuehrbares Zipapp (python3 dcos-context.pyz context create ...) bauen")
+    print("\nArguments:")
+    print(" %-15s %-30s" % ("--output", "Optional, Zipapp File (Default: dcos-context.pyz)"))
+    print(" %-15s %-30s" % ("--with-deps", "Optional, " + ", ".join(DEPENDENCIES) + " per pip mit einpacken"))
+    print(" %-15s %-30s" % ("--python", "Optional, Interpreter im Shebang (Default: /usr/bin/env python3)"))
+    print("\nExamples:")
+    print(" ", sys.argv[0], '--output=dcos-context.pyz --with-deps')
+    print("\n")
+    sys.exit(2)
+
+
+def build(output, with_deps, interpreter):
+    """
+    Zipapp bauen
+
+    Args:
+        output = Zipapp File (string)
+        with_deps = Abhaengigkeiten mit einpacken (bool)
+        interpreter = Interpreter im Shebang (string)
+    """
+    staging = tempfile.mkdtemp(prefix="dcos-context-")
+    try:
+        shutil.copytree(os.path.join(ROOT, "dcos_context"), os.path.join(staging, "dcos_context"),
+                        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+        if with_deps:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "--target", staging] +
+                                  list(DEPENDENCIES))
+        zipapp.create_archive(staging, target=output, interpreter=interpreter, main="dcos_context.cli:main",
+                              compressed=True)
+    finally:
+        shutil.rmtree(staging)
+
+
+def main():
+    """
+    MAIN
+    """
+    arg_output = "dcos-context.pyz"
+    arg_with_deps = False
+    arg_python = "/usr/bin/env python3"
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:],
+            "",
+            ["help", "output=", "with-deps", "python="]
+        )
+    except getopt.GetoptError:
+        usage()
+
+    for opt, arg in opts:
+        if opt == '--help':
+            usage()
+        elif opt == '--output':
+            arg_output = arg
+        elif opt == '--with-deps':
+            arg_with_deps = True
+        elif opt == '--python':
+            arg_python = arg
+
+    build(arg_output, arg_with_deps, arg_python)
+    print("Zipapp geschrieben: " + arg_output)
+
+
+if __name__ == "__main__":
+    main()
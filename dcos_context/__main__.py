@@ -0,0 +1,5 @@
+import dcos_context.cli as cli
+
+
+if __name__ == "__main__":
+    cli.main()
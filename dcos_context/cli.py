@@ -0,0 +1,48 @@
+import importlib
+import sys
+
+# Subcommand: (Modul, {Aktion: Option})
+COMMANDS = {
+    "context": ("dcos_context.context", {"create": "--create", "delete": "--delete"}),
+    "group": ("dcos_context.group", {"add": "--add", "remove": "--remove"})
+}
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0], 'context create|delete [OPTIONS] | group add|remove [OPTIONS]')
+    print("\nDCOS Contexte und User Gruppen verwalten")
+    print("\nCommands:")
+    print(" %-15s %-30s" % ("context create", "DCOS Context anlegen (wie mgt-context.py --create)"))
+    print(" %-15s %-30s" % ("context delete", "DCOS Context entfernen (wie mgt-context.py --delete)"))
+    print(" %-15s %-30s" % ("group add", "DCOS User Gruppe anlegen (wie mgt-group.py --add)"))
+    print(" %-15s %-30s" % ("group remove", "DCOS User Gruppe entfernen (wie mgt-group.py --remove)"))
+    print("\nOptionen pro Command mit --help, z.B.:")
+    print(" ", sys.argv[0], 'context create --help')
+    print("\nExamples:")
+    print(" ", sys.argv[0], 'context create --name="demo_context" --port_nexus=50001 --cluster="dcos_tru"')
+    print(" ", sys.argv[0], 'group add --gid="z000-demogruppe" --role="devops" --cluster="dcos_tru"')
+    print("\n")
+    sys.exit(2)
+
+
+def main(argv=None):
+    """
+    MAIN, Subcommand an dcos_context.context bzw. dcos_context.group weitergeben
+
+    Das Modul wird erst hier importiert, requests und yaml laedt es
+    erst bei Bedarf (siehe dcos_context/lazy.py).
+
+    Args:
+        argv = Argumente ohne Programmname, None = sys.argv (list)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2 or argv[0] not in COMMANDS:
+        usage()
+
+    module_name, actions = COMMANDS[argv[0]]
+    if argv[1] not in actions:
+        usage()
+
+    module = importlib.import_module(module_name)
+    module.main([actions[argv[1]]] + argv[2:])
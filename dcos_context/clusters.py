@@ -0,0 +1,95 @@
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def resolve(cluster, cfg):
+    """
+    Cluster Argument in eine Liste von Clustern aufloesen
+
+    Erlaubt sind ein Cluster Name, eine kommagetrennte Liste oder der
+    Name einer Cluster Gruppe. Eine Cluster Gruppe ist ein Eintrag im
+    Konfigurationsfile, dessen Wert eine Liste von Cluster Namen ist.
+
+    Args:
+        cluster = Cluster Argument (string)
+        cfg = DCOS Konfiguration (dict)
+
+    Returns:
+        Cluster Namen (list)
+    """
+    clusters = []
+    for name in cluster.split(","):
+        name = name.strip()
+        if isinstance(cfg.get(name), list):
+            members = cfg[name]
+        else:
+            members = [name]
+        for member in members:
+            if member not in clusters:
+                clusters.append(member)
+
+    return clusters
+
+
+def workers(cfg, cluster, default):
+    """
+    Parallelitaet fuer einen Cluster ermitteln
+
+    Args:
+        cfg = DCOS Konfiguration (dict)
+        cluster = Cluster Name (string)
+        default = Wert aus der Kommandozeile (int)
+
+    Returns:
+        Anzahl paralleler Requests (int)
+    """
+    return int(cfg.get(cluster, {}).get("workers", default))
+
+
+def run(clusters, func):
+    """
+    Funktion fuer alle Cluster parallel ausfuehren und Ergebnisse berichten
+
+    Args:
+        clusters = Cluster Namen (list)
+        func = Funktion mit dem Cluster Namen als Argument, liefert True/False (function)
+
+    Returns:
+        True/False
+    """
+    if len(clusters) == 1:
+        return func(clusters[0])
+
+    with ThreadPoolExecutor(max_workers=len(clusters)) as executor:
+        futures = [(cluster, executor.submit(_call, cluster, func)) for cluster in clusters]
+    results = [(cluster, future.result()) for cluster, future in futures]
+
+    logging.info("Ergebnis pro Cluster:")
+    for cluster, result in results:
+        if result:
+            logging.info(" %-30s %s" % (cluster, "erfolgreich"))
+        else:
+            logging.error(" %-30s %s" % (cluster, "fehlgeschlagen"))
+
+    return all(result for cluster, result in results)
+
+
+def _call(cluster, func):
+    """
+    Funktion im Thread mit dem Cluster Namen ausfuehren
+
+    Args:
+        cluster = Cluster Name (string)
+        func = Funktion (function)
+
+    Returns:
+        True/False
+    """
+    threading.current_thread().name = cluster
+    try:
+        return func(cluster)
+    except Exception:
+        logging.exception("Cluster " + cluster + " fehlgeschlagen")
+        return False
@@ -0,0 +1,165 @@
+import datetime
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+import threading
+import dcos_context.lazy as lazy
+
+from collections.abc import Mapping
+
+yaml = lazy.load("yaml")
+
+# Cache Verzeichnis fuer geparste Konfigurationsfiles, leer = Cache deaktiviert
+path = os.environ.get(
+    "DCOS_CONTEXT_CONFIG_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "dcos_context", "config")
+)
+
+# Wird bei inkompatiblen Aenderungen am Cache Format erhoeht
+_VERSION = 2
+
+
+def load(config_path):
+    """
+    YAML Konfigurationsfile lesen
+
+    Geparst wird mit dem C Loader von libyaml (sonst SafeLoader). Das
+    Ergebnis wird pro Eintrag (Cluster) als marshal Blob gecached, der
+    Cache gilt solange Pfad, mtime und Groesse des Files gleich sind.
+    Ein Eintrag wird erst beim Zugriff ausgepackt. YAML Timestamps (z.B.
+    ein unquotiertes Passwort 2024-01-01) werden als ISO String geliefert,
+    mit und ohne Cache gleich.
+
+    Args:
+        config_path = Konfigurationsfile (string)
+
+    Returns:
+        Konfiguration (Config)
+    """
+    stat = os.stat(config_path)
+    signature = (_VERSION, os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    cache_path = _cache_path(config_path)
+
+    if cache_path:
+        entries = _load(cache_path, signature)
+        if entries is not None:
+            return Config(entries)
+
+    with open(config_path, 'r') as config_file:
+        data = yaml.load(config_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    if not isinstance(data, dict):
+        raise ValueError("Konfigurationsfile " + config_path + " enthaelt kein Mapping")
+
+    entries = {}
+    for key, value in data.items():
+        try:
+            entries[_isoformat(key)] = marshal.dumps(value)
+        except ValueError:
+            logging.debug("Config " + config_path + ": Timestamps in " + str(key) + " als String gespeichert")
+            entries[_isoformat(key)] = marshal.dumps(_isoformat(value))
+
+    if cache_path:
+        _save(cache_path, signature, entries)
+    return Config(entries)
+
+
+class Config(Mapping):
+    """
+    Konfiguration mit Eintraegen, die erst beim Zugriff ausgepackt werden
+    """
+
+    def __init__(self, entries):
+        self._entries = entries
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = marshal.loads(self._entries[key])
+            return self._values[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _isoformat(value):
+    """
+    Timestamps fuer marshal in ISO Strings umwandeln
+
+    Args:
+        value = Wert aus dem Konfigurationsfile
+
+    Returns:
+        Wert ohne date/datetime
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return dict((_isoformat(key), _isoformat(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [_isoformat(item) for item in value]
+    return value
+
+
+def _cache_path(config_path):
+    """
+    Cache File fuer ein Konfigurationsfile
+
+    Args:
+        config_path = Konfigurationsfile (string)
+
+    Returns:
+        Cache File (string) oder None
+    """
+    if not path:
+        return None
+    digest = hashlib.sha1(os.path.abspath(config_path).encode("utf-8")).hexdigest()
+    return os.path.join(path, digest + ".marshal")
+
+
+def _load(cache_path, signature):
+    """
+    Cache File lesen
+
+    Args:
+        cache_path = Cache File (string)
+        signature = Version, Pfad, mtime und Groesse (tuple)
+
+    Returns:
+        marshal Blob pro Eintrag (dict) oder None
+    """
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_signature, entries = marshal.load(cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if cached_signature != signature:
+        return None
+    return entries
+
+
+def _save(cache_path, signature, entries):
+    """
+    Cache File atomar und nur fuer den Owner lesbar schreiben
+
+    Args:
+        cache_path = Cache File (string)
+        signature = Version, Pfad, mtime und Groesse (tuple)
+        entries = marshal Blob pro Eintrag (dict)
+    """
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".config")
+        with os.fdopen(fd, 'wb') as cache_file:
+            marshal.dump((signature, entries), cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        logging.warning("Config Cache nicht schreibbar: " + str(err))
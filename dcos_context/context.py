@@ -0,0 +1,968 @@
+import atexit
+import getopt
+import sys
+import re
+import dcos_context.lazy as lazy
+import dcos_context.config as config
+import dcos_context.schema as schema
+import dcos_context.dag as dag
+import dcos_context.plan as plan
+import dcos_context.fleet as fleet
+import dcos_context.manifest as manifest_reader
+import dcos_context.clusters as clusters
+import dcos_context.estimate as estimate
+import dcos_context.metrics as metrics
+import dcos_context.trace as trace
+import dcos_context.profiler as profiler
+import logging
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+
+# Netzwerk Module erst bei Bedarf laden (siehe dcos_context/lazy.py)
+nexus = lazy.load("dcos_context.nexus")
+dcos = lazy.load("dcos_context.dcos")
+session = lazy.load("dcos_context.session")
+
+
+def usage():
+    """ Usage Message """
+    print('Usage: ', sys.argv[0],
+          '[--verbose] [--create|delete] [--cluster=DCOS_CLUSTER] [--name=CONTEXT_NAME] ' +
+          '[--port_nexus=NEXUS_REPO_PORT] [--cfg_nexus=CFG_FILE_NEXUS] [--cfg_dcos=CFG_FILE_DCOS] ' +
+          '[--workers=N] [--batch] [--parallel] [--dag] [--reconcile] [--manifest=FILE] [--jobs=N] ' +
+          '[--plan] [--latency=FILE] [--metrics=FILE] [--metrics_prom=FILE] [--trace=FILE] ' +
+          '[--profile=FILE]')
+    print("\nDCOS Context anlegen oder loeschen")
+    print("\nArguments:")
+    print(" %-15s %-30s" % ("--verbose", "Verbose Modus"))
+    print(" %-15s %-30s" % ("--create", "DCOS Context anlegen"))
+    print(" %-15s %-30s" % ("--delete", "DCOS Context entfernen"))
+    print(" %-15s %-30s" % ("--name", "DCOS Context Name"))
+    print(" %-15s %-30s" % ("--cluster", "DCOS Cluster Name, Liste a,b oder Cluster Gruppe (siehe --cfg_dcos)"))
+    print(" %-15s %-30s" % ("--port_nexus", "Port des Nexus Docker Repos"))
+    print(" %-15s %-30s" % ("--cfg_nexus", "Optional, Nexus Konfigurationsfile"))
+    print(" %-15s %-30s" % ("--cfg_dcos", "Optional, DCOS Konfigurationsfile"))
+    print(" %-15s %-30s" % ("--workers", "Optional, Anzahl paralleler DCOS ACL Requests (Default: 1)"))
+    print(" %-15s %-30s" % ("--batch", "Optional, Nexus Calls pro Abhaengigkeitsstufe in einem Request senden"))
+    print(" %-15s %-30s" % ("--parallel", "Optional, Nexus Instanzen und DCOS parallel bearbeiten"))
+    print(" %-15s %-30s" % ("--dag", "Optional, alle Schritte nach Abhaengigkeiten parallel (max. --workers)"))
+    print(" %-15s %-30s" % ("--reconcile", "Optional, nur fehlende/abweichende Objekte anlegen/entfernen"))
+    print(" %-15s %-30s" % ("--manifest", "Optional, Contexte aus YAML/JSON Manifest statt --name"))
+    print(" %-15s %-30s" % ("--jobs", "Optional, Anzahl parallel bearbeiteter Manifest Contexte (Default: 1)"))
+    print(" %-15s %-30s" % ("--plan", "Optional, nur API Calls und Dauer abschaetzen, keine Aenderungen"))
+    print(" %-15s %-30s" % ("--latency", "Optional, Latenzen pro Endpoint fuer --plan (YAML/JSON, --metrics File)"))
+    print(" %-15s %-30s" % ("--metrics", "Optional, Latenz, Status, Bytes pro Endpoint am Ende als JSON schreiben"))
+    print(" %-15s %-30s" % ("--metrics_prom", "Optional, dieselben Metriken als Prometheus Textfile (.prom)"))
+    print(" %-15s %-30s" % ("--trace", "Optional, Timeline der Schritte und HTTP Calls als Chrome Trace JSON"))
+    print(" %-15s %-30s" % ("--profile", "Optional, cProfile Daten als pstats File schreiben (.txt: Text Report)"))
+    print("\nExamples:")
+    print(" Anlegen:")
+    print(" ", sys.argv[0], '--create --name="demo_context" --port_nexus=50001 --cluster="dcos_tru"')
+    print(" Loeschen:")
+    print(" ", sys.argv[0], '--delete --name="demo_context" --cluster="dcos_tru"')
+    print(" Manifest:")
+    print(" ", sys.argv[0], '--create --manifest="contexts.yml" --cluster="dcos_tru" --jobs=8')
+    print(" Abschaetzen:")
+    print(" ", sys.argv[0], '--create --manifest="contexts.yml" --cluster="dcos_tru" --jobs=8 --plan')
+    print("\n")
+    sys.exit(2)
+
+
+def main(argv=None):
+    """
+    MAIN
+
+    Args:
+        argv = Argumente, Default sys.argv[1:] (list)
+
+    Returns:
+        True/False
+    """
+
+    # Argument Handling
+    arg_cfg_dcos = '/tmp/con.yml'
+    arg_cfg_nexus = '/tmp/nexus.yml'
+    arg_verbose = False
+    arg_create = False
+    arg_delete = False
+    arg_cluster = False
+    arg_context_name = False
+    arg_port_nexus = False
+    arg_workers = 1
+    arg_batch = False
+    arg_parallel = False
+    arg_dag = False
+    arg_reconcile = False
+    arg_manifest = False
+    arg_jobs = 1
+    arg_plan = False
+    arg_latency = False
+    arg_metrics = False
+    arg_metrics_prom = False
+    arg_trace = False
+    arg_profile = False
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:] if argv is None else argv,
+            "",
+            ["help", "create", "delete", "cluster=", "name=", "port_nexus=", "verbose", "cfg_nexus=", "cfg_dcos=",
+             "workers=", "batch", "parallel", "dag", "reconcile",
+             "manifest=", "jobs=", "plan", "latency=", "metrics=", "metrics_prom=", "trace=", "profile="]
+        )
+    except getopt.GetoptError as err:
+        str(err)
+        usage()
+
+    for opt, arg in opts:
+        if opt in '--help':
+            usage()
+        elif opt in '--verbose':
+            arg_verbose = True
+        elif opt in '--create':
+            arg_create = True
+        elif opt in '--delete':
+            arg_delete = True
+        elif opt in '--cluster':
+            arg_cluster = arg
+        elif opt in '--name':
+            arg_context_name = arg
+        elif opt in '--port_nexus':
+            arg_port_nexus = arg
+        elif opt in '--cfg_nexus':
+            arg_cfg_nexus = arg
+        elif opt in '--cfg_dcos':
+            arg_cfg_dcos = arg
+        elif opt in '--workers':
+            try:
+                arg_workers = int(arg)
+            except ValueError:
+                usage()
+        elif opt in '--batch':
+            arg_batch = True
+        elif opt in '--parallel':
+            arg_parallel = True
+        elif opt in '--dag':
+            arg_dag = True
+        elif opt in '--reconcile':
+            arg_reconcile = True
+        elif opt in '--manifest':
+            arg_manifest = arg
+        elif opt in '--jobs':
+            try:
+                arg_jobs = int(arg)
+            except ValueError:
+                usage()
+        elif opt in '--plan':
+            arg_plan = True
+        elif opt in '--latency':
+            arg_latency = arg
+        elif opt in '--metrics':
+            arg_metrics = arg
+        elif opt in '--metrics_prom':
+            arg_metrics_prom = arg
+        elif opt in '--trace':
+            arg_trace = arg
+        elif opt in '--profile':
+            arg_profile = arg
+        else:
+            usage()
+
+    # Argument Parsing
+    if arg_manifest:
+        if arg_context_name or arg_jobs < 1:
+            usage()
+    elif not arg_cluster:
+        usage()
+    elif not arg_context_name:
+        usage()
+    elif not arg_port_nexus and arg_create:
+        usage()
+
+    if (arg_create and arg_delete) or (not arg_create and not arg_delete):
+        usage()
+    if arg_workers < 1:
+        usage()
+    elif arg_dag and arg_reconcile:
+        usage()
+
+    # Profiling, Sampling ueber DCOS_CONTEXT_PROFILE_SAMPLE=FILE
+    profiler.start(arg_profile)
+
+    # Configuration Files
+    cfg_dcos = config.load(arg_cfg_dcos)
+    cfg_nexus = config.load(arg_cfg_nexus)
+
+    if arg_cluster:
+        cluster_list = clusters.resolve(arg_cluster, cfg_dcos)
+    else:
+        cluster_list = [arg_cluster]
+
+    # Plan
+    if arg_plan:
+        latency = estimate.load_latency(arg_latency)
+        total = estimate.Estimate(latency)
+        for cluster in cluster_list:
+            # Die Cluster laufen parallel
+            total.join(plan_cluster(
+                manifest=arg_manifest,
+                context_name=arg_context_name,
+                port_nexus=arg_port_nexus,
+                cluster=cluster,
+                cluster_list=cluster_list,
+                cfg_dcos=cfg_dcos,
+                cfg_nexus=cfg_nexus,
+                create=arg_create,
+                delete=arg_delete,
+                latency=latency,
+                jobs=arg_jobs,
+                workers=clusters.workers(cfg_dcos, cluster, arg_workers),
+                batch=arg_batch,
+                parallel=arg_parallel,
+                use_dag=arg_dag,
+                reconcile=arg_reconcile
+            ))
+        print("Plan fuer Cluster: " + ", ".join(str(cluster) for cluster in cluster_list))
+        total.report()
+        sys.exit(0)
+
+    # Logging
+    if arg_parallel or arg_dag or arg_jobs > 1 or len(cluster_list) > 1:
+        log_format = '%(asctime)s %(levelname)s [%(threadName)s] : %(message)s'
+    else:
+        log_format = '%(asctime)s %(levelname)s : %(message)s'
+
+    if arg_verbose:
+        logging.basicConfig(level=logging.DEBUG, format=log_format, datefmt='%d-%b-%y %H:%M:%S')
+    else:
+        logging.getLogger('requests.packages.urllib3.connectionpool').setLevel(logging.WARN)
+        logging.basicConfig(level=logging.INFO, format=log_format, datefmt='%d-%b-%y %H:%M:%S')
+
+    # Metrics
+    if arg_metrics or arg_metrics_prom:
+        metrics.enabled = True
+        atexit.register(metrics.dump, arg_metrics, arg_metrics_prom)
+
+    # Trace
+    if arg_trace:
+        trace.enabled = True
+        atexit.register(trace.dump, arg_trace)
+
+    # Connection Pools, Netzwerk Module vor dem Start der Threads laden
+    lazy.resolve(session, dcos, nexus, manifest_reader.yaml)
+    session.pool_maxsize = max(session.pool_maxsize, arg_workers * arg_jobs)
+    for cluster in cluster_list:
+        if cluster:
+            cluster_workers = clusters.workers(cfg_dcos, cluster, arg_workers)
+            session.pool_maxsize = max(session.pool_maxsize, cluster_workers * arg_jobs)
+
+    # Tasks
+    def cluster_tasks(cluster):
+        options = dict(
+            workers=clusters.workers(cfg_dcos, cluster, arg_workers),
+            batch=arg_batch,
+            parallel=arg_parallel,
+            use_dag=arg_dag,
+            reconcile=arg_reconcile
+        )
+
+        if arg_manifest:
+            return manifest_tasks(
+                manifest=arg_manifest,
+                cluster=cluster,
+                cluster_list=cluster_list,
+                cfg_dcos=cfg_dcos,
+                cfg_nexus=cfg_nexus,
+                create=arg_create,
+                delete=arg_delete,
+                jobs=arg_jobs,
+                **options
+            )
+        else:
+            return context_tasks(
+                context_name=arg_context_name,
+                port_nexus=arg_port_nexus,
+                cluster=cluster,
+                cfg_dcos=cfg_dcos,
+                cfg_nexus=cfg_nexus,
+                create=arg_create,
+                delete=arg_delete,
+                **options
+            )
+
+    rsp = clusters.run(cluster_list, cluster_tasks)
+
+    if not rsp:
+        logging.error("Es ist ein Fehler aufgetreten!")
+        sys.exit(1)
+    else:
+        logging.info("Erfolgreich beendet")
+        sys.exit(0)
+
+
+def context_tasks(context_name, port_nexus, cluster, cfg_dcos, cfg_nexus, create, delete,
+                  workers=1, batch=False, parallel=False, use_dag=False, reconcile=False):
+    """
+    Einen Context auf einem Cluster anlegen oder loeschen
+
+    Args:
+        context_name: DCOS Context Name (string)
+        port_nexus: Port des Nexus Docker Repos (string)
+        cluster: DCOS Cluster Name (string)
+        cfg_dcos: DCOS Konfiguration (dict)
+        cfg_nexus: Nexus Konfiguration (dict)
+        create: Context anlegen (bool)
+        delete: Context loeschen (bool)
+        workers: Anzahl paralleler ACL Requests bzw. DAG Schritte (int)
+        batch: Nexus Calls pro Abhaengigkeitsstufe in einem Request senden (bool)
+        parallel: Nexus Instanzen und DCOS parallel bearbeiten (bool)
+        use_dag: Alle Schritte nach Abhaengigkeiten parallel ausfuehren (bool)
+        reconcile: Objekte mit dem aktuellen Zustand abgleichen (bool)
+
+    Returns:
+        True/False
+    """
+    # Configuration File Variables
+    dcos_url = cfg_dcos[cluster]["url"]
+    dcos_api_user = cfg_dcos[cluster]["user"]
+    dcos_api_pass = cfg_dcos[cluster]["password"]
+    nexus_url = cfg_nexus[cluster]["url"]
+    nexus_docker_port = port_nexus
+    nexus_api_user = cfg_nexus[cluster]["user"]
+    nexus_api_pass = cfg_nexus[cluster]["password"]
+
+    logging.info("Parameter Context-Name: " + context_name)
+    logging.info("Parameter Cluster-Name: " + cluster)
+    logging.info("Parameter Nexus-Port: " + str(port_nexus))
+
+    nexus_args = dict(
+        param=schema.nexus(context_name, nexus_docker_port),
+        create=create,
+        delete=delete,
+        api_url=nexus_url,
+        api_user=nexus_api_user,
+        api_pass=nexus_api_pass,
+        batch=batch,
+        parallel=parallel,
+        reconcile=reconcile
+    )
+
+    dcos_args = dict(
+        param=schema.dcos(context_name),
+        create=create,
+        delete=delete,
+        api_url=dcos_url,
+        api_user=dcos_api_user,
+        api_pass=dcos_api_pass,
+        workers=workers,
+        reconcile=reconcile
+    )
+
+    with trace.span("context:" + context_name, "context", cluster=cluster):
+        if use_dag:
+            results = dag.run(
+                context_steps(
+                    nexus_param=nexus_args["param"],
+                    dcos_param=dcos_args["param"],
+                    create=create,
+                    delete=delete,
+                    nexus_url=nexus_url,
+                    nexus_user=nexus_api_user,
+                    nexus_pass=nexus_api_pass,
+                    dcos_url=dcos_url,
+                    dcos_user=dcos_api_user,
+                    dcos_pass=dcos_api_pass
+                ),
+                workers=workers
+            )
+            nexus_rsp = all(result for name, result in results.items() if name.startswith("nexus:"))
+            dcos_rsp = all(result for name, result in results.items() if name.startswith("dcos:"))
+        elif parallel:
+            # Nexus und DCOS sind unabhaengig und laufen gleichzeitig
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="nexus") as nexus_executor, \
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="dcos") as dcos_executor:
+                nexus_future = nexus_executor.submit(nexus_tasks, **nexus_args)
+                dcos_future = dcos_executor.submit(dcos_tasks, **dcos_args)
+            nexus_rsp = nexus_future.result()
+            dcos_rsp = dcos_future.result()
+        else:
+            nexus_rsp = nexus_tasks(**nexus_args)
+            dcos_rsp = dcos_tasks(**dcos_args)
+
+    return nexus_rsp and dcos_rsp
+
+
+def manifest_tasks(manifest, cluster, cfg_dcos, cfg_nexus, create, delete, jobs=1, cluster_list=None, **options):
+    """
+    Alle Contexte eines Manifests anlegen oder loeschen
+
+    Die Eintraege werden gestreamt gelesen und von einem Worker Pool
+    bearbeitet, es sind hoechstens 2 * jobs Eintraege gleichzeitig im
+    Speicher. Sessions und Tokens werden zwischen den Contexten geteilt.
+    Bei mehreren Clustern bearbeitet jeder Cluster nur seine Eintraege
+    (siehe _manifest_owner).
+
+    Args:
+        manifest: Manifest File (string: siehe dcos_context/manifest.py)
+        cluster: Default DCOS Cluster Name fuer Eintraege ohne cluster (string)
+        cfg_dcos: DCOS Konfiguration (dict)
+        cfg_nexus: Nexus Konfiguration (dict)
+        create: Contexte anlegen (bool)
+        delete: Contexte loeschen (bool)
+        jobs: Anzahl parallel bearbeiteter Contexte (int)
+        cluster_list: Alle Cluster des Laufs, None = nur cluster (list)
+        options: Weitere Optionen fuer context_tasks
+
+    Returns:
+        True/False
+    """
+    total = 0
+    failed = []
+
+    def collect(futures):
+        for future in futures:
+            name, entry_cluster, result = future.result()
+            if result:
+                logging.info("Manifest Context " + name + " auf " + entry_cluster + ": erfolgreich")
+            else:
+                logging.error("Manifest Context " + name + " auf " + entry_cluster + ": fehlgeschlagen")
+                failed.append(name + "@" + entry_cluster)
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="context") as executor:
+        running = set()
+        for entry in manifest_reader.read(manifest):
+            if not _manifest_owner(entry, cluster, cluster_list):
+                continue
+            if len(running) >= 2 * jobs:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                collect(done)
+            total += 1
+            running.add(executor.submit(_manifest_entry, entry, cluster, cfg_dcos, cfg_nexus, create, delete,
+                                        options))
+        collect(running)
+
+    logging.info("Manifest: " + str(total) + " Contexte, " + str(len(failed)) + " fehlgeschlagen")
+    if failed:
+        logging.error("Manifest fehlgeschlagen: " + ", ".join(failed))
+
+    return total > 0 and not failed
+
+
+def _manifest_owner(entry, cluster, cluster_list):
+    """
+    Pruefen, ob der Lauf fuer cluster einen Manifest Eintrag bearbeitet
+
+    Ein Eintrag mit eigenem cluster gehoert zum Lauf dieses Clusters. Ist
+    der Cluster nicht in cluster_list, bearbeitet ihn der erste Lauf, damit
+    jeder Eintrag genau einmal angelegt bzw. geloescht wird.
+
+    Args:
+        entry: Manifest Eintrag (dict)
+        cluster: Cluster dieses Laufs (string)
+        cluster_list: Alle Cluster des Laufs, None = nur cluster (list)
+
+    Returns:
+        True/False
+    """
+    entry_cluster = entry.get("cluster", cluster)
+    if not cluster_list or entry_cluster == cluster:
+        return True
+    if entry_cluster in cluster_list:
+        return False
+    return cluster == cluster_list[0]
+
+
+def _manifest_entry(entry, cluster, cfg_dcos, cfg_nexus, create, delete, options):
+    """
+    Einen Manifest Eintrag bearbeiten
+
+    Returns:
+        Context Name, Cluster Name und Ergebnis (tuple)
+    """
+    name = str(entry.get("name"))
+    entry_cluster = entry.get("cluster", cluster)
+    if not entry.get("name") or not entry_cluster or (create and not entry.get("port")):
+        logging.error("Manifest Eintrag unvollstaendig: " + str(entry))
+        return name, str(entry_cluster), False
+
+    try:
+        result = context_tasks(
+            context_name=name,
+            port_nexus=entry.get("port"),
+            cluster=entry_cluster,
+            cfg_dcos=cfg_dcos,
+            cfg_nexus=cfg_nexus,
+            create=create,
+            delete=delete,
+            **options
+        )
+    except Exception:
+        logging.exception("Manifest Context " + name + " fehlgeschlagen")
+        result = False
+
+    return name, str(entry_cluster), result
+
+
+def plan_cluster(manifest, context_name, port_nexus, cluster, cfg_dcos, cfg_nexus, create, delete, latency,
+                 jobs=1, cluster_list=None, **options):
+    """
+    API Calls und Dauer fuer einen Cluster ohne Netzwerkzugriff abschaetzen
+
+    Mit Manifest werden die Contexte auf jobs Worker verteilt, der Token
+    wird pro Cluster einmal geholt (siehe manifest_tasks).
+
+    Args:
+        manifest: Manifest File oder False (string)
+        context_name: DCOS Context Name ohne Manifest (string)
+        port_nexus: Port des Nexus Docker Repos ohne Manifest (string)
+        cluster: DCOS Cluster Name (string)
+        cfg_dcos: DCOS Konfiguration (dict)
+        cfg_nexus: Nexus Konfiguration (dict)
+        create: Contexte anlegen (bool)
+        delete: Contexte loeschen (bool)
+        latency: Latenz pro Endpoint (dict: siehe estimate.load_latency)
+        jobs: Anzahl parallel bearbeiteter Manifest Contexte (int)
+        cluster_list: Alle Cluster des Laufs, None = nur cluster (list)
+        options: Weitere Optionen fuer plan_context
+
+    Returns:
+        estimate.Estimate
+    """
+    if not manifest:
+        cluster_estimate = estimate.Estimate(latency).sequential(estimate.DCOS_LOGIN)
+        return cluster_estimate.add(plan_context(context_name, port_nexus, cluster, cfg_dcos, cfg_nexus,
+                                                 create, delete, latency, **options))
+
+    contexts = estimate.Estimate(latency)
+    logins = set()
+    longest = 0.0
+    for entry in manifest_reader.read(manifest):
+        if not _manifest_owner(entry, cluster, cluster_list):
+            continue
+        entry_cluster = entry.get("cluster", cluster)
+        if not entry.get("name") or not entry_cluster:
+            print("Manifest Eintrag unvollstaendig: " + str(entry))
+            continue
+        if entry_cluster not in logins:
+            logins.add(entry_cluster)
+            contexts.sequential(estimate.DCOS_LOGIN)
+        context = plan_context(str(entry.get("name")), entry.get("port"), entry_cluster, cfg_dcos, cfg_nexus,
+                               create, delete, latency, **options)
+        longest = max(longest, context.seconds)
+        contexts.add(context)
+
+    # Die Contexte verteilen sich auf jobs Worker
+    contexts.seconds = max(contexts.seconds / jobs, longest)
+    return contexts
+
+
+def plan_context(context_name, port_nexus, cluster, cfg_dcos, cfg_nexus, create, delete, latency,
+                 workers=1, batch=False, parallel=False, use_dag=False, reconcile=False):
+    """
+    API Calls und Dauer eines Contexts ohne Netzwerkzugriff abschaetzen
+
+    Die Calls werden aus dcos_context/schema abgeleitet wie in context_tasks. Mit
+    reconcile wird angenommen, dass alle Objekte fehlen (obere Grenze).
+
+    Args:
+        context_name: DCOS Context Name (string)
+        port_nexus: Port des Nexus Docker Repos (string)
+        cluster: DCOS Cluster Name (string)
+        cfg_dcos: DCOS Konfiguration (dict)
+        cfg_nexus: Nexus Konfiguration (dict)
+        create: Context anlegen (bool)
+        delete: Context loeschen (bool)
+        latency: Latenz pro Endpoint (dict: siehe estimate.load_latency)
+        workers: Anzahl paralleler ACL Requests bzw. DAG Schritte (int)
+        batch: Nexus Calls pro Abhaengigkeitsstufe in einem Request senden (bool)
+        parallel: Nexus Instanzen und DCOS parallel bearbeiten (bool)
+        use_dag: Alle Schritte nach Abhaengigkeiten parallel ausfuehren (bool)
+        reconcile: Objekte mit dem aktuellen Zustand abgleichen (bool)
+
+    Returns:
+        estimate.Estimate
+    """
+    nexus_param = schema.nexus(context_name, port_nexus)
+    dcos_param = schema.dcos(context_name)
+    user_groups = dcos_param["user_group"]
+
+    nexus_estimate = estimate.Estimate(latency)
+    for url in cfg_nexus[cluster]["url"]:
+        instance = estimate.Estimate(latency)
+        repos = len(nexus_param["repo"])
+        roles = len(nexus_param["role"])
+        users = len(nexus_param["user"])
+        if reconcile:
+            instance.sequential(estimate.NEXUS_EXTDIRECT, 3)
+        if batch and not reconcile and create:
+            # Ein Request und ein Lesezugriff pro Stufe (Repositories, Rollen), danach die User
+            levels = 1 + len(schema.nexus_role_levels(nexus_param["role"]))
+            instance.sequential(estimate.NEXUS_EXTDIRECT, 2 * levels + 1)
+        elif batch and not reconcile:
+            instance.sequential(estimate.NEXUS_EXTDIRECT)
+        elif create:
+            # Je ein Lesezugriff beim Warten auf Repositories und Rollen
+            waits = 2 + sum(1 for role in nexus_param["role"].values() if role["contained_roles"])
+            instance.sequential(estimate.NEXUS_EXTDIRECT, repos + roles + users + waits)
+        elif delete:
+            instance.sequential(estimate.NEXUS_EXTDIRECT, repos + roles + users)
+
+        if parallel or use_dag:
+            nexus_estimate.join(instance)
+        else:
+            nexus_estimate.add(instance)
+
+    dcos_estimate = estimate.Estimate(latency)
+    if create:
+        dcos_estimate.sequential(estimate.DCOS_SERVICE_GROUP_CREATE)
+        dcos_estimate.sequential(estimate.DCOS_USER_GROUP_CREATE, len(user_groups))
+        ba_env = get_ba_env(url=cfg_dcos[cluster]["url"])
+        # Die ACLs werden nicht gerendert, die Anzahl haengt nur von Umgebung und Rollen ab
+        resources, grants = fleet.acl_counts(ba_env, tuple(sorted(group["role"] for group in user_groups.values())))
+        if reconcile:
+            dcos_estimate.sequential(estimate.DCOS_ACLS)
+            dcos_estimate.sequential(estimate.DCOS_USER_GROUP_PERMISSIONS, len(user_groups))
+        dcos_estimate.parallel(estimate.DCOS_ACL_CREATE, resources, workers)
+        dcos_estimate.parallel(estimate.DCOS_GRANT, grants, workers)
+    elif delete:
+        dcos_estimate.sequential(estimate.DCOS_SERVICE_GROUP_DELETE)
+        dcos_estimate.sequential(estimate.DCOS_USER_GROUP_DELETE, len(user_groups))
+
+    if use_dag:
+        # Untere Grenzen: alle Calls auf workers verteilt bzw. laengste Kette aus Abhaengigkeiten
+        context = estimate.Estimate(latency).add(nexus_estimate).add(dcos_estimate)
+        if create:
+            chain = max(latency[estimate.DCOS_USER_GROUP_CREATE], latency[estimate.DCOS_ACL_CREATE]) + \
+                latency[estimate.DCOS_GRANT]
+            chain = max(chain, 5 * latency[estimate.NEXUS_EXTDIRECT])
+        else:
+            chain = max(latency[estimate.DCOS_SERVICE_GROUP_DELETE], latency[estimate.NEXUS_EXTDIRECT])
+        context.seconds = max(context.total_latency() / workers, chain)
+        return context
+    elif parallel:
+        return nexus_estimate.join(dcos_estimate)
+    else:
+        return nexus_estimate.add(dcos_estimate)
+
+
+def nexus_tasks(param, create, delete, api_url, api_user, api_pass, batch=False, parallel=False, reconcile=False):
+    """
+    NEXUS Tasks realisieren
+
+    Args:
+        param: REST Call Schema (dict: siehe schema.py)
+        create: Nexus Objekt anlegen (bool)
+        delete: Nexus Objekt loeschen (bool)
+        api_url: Nexus URLs (list)
+        api_user: Nexus User (string)
+        api_pass: Nexus Passwort (string)
+        batch: Nexus Calls pro Abhaengigkeitsstufe in einem Request senden (bool)
+        parallel: Alle Nexus Instanzen parallel bearbeiten (bool)
+        reconcile: Nexus Objekte mit dem aktuellen Zustand abgleichen (bool)
+
+    Returns:
+        True/False
+    """
+    success = True
+    if parallel and len(api_url) > 1:
+        with ThreadPoolExecutor(max_workers=len(api_url), thread_name_prefix="nexus-instance") as executor:
+            results = {
+                url: executor.submit(nexus_instance_tasks, param, create, delete, url, api_user, api_pass, batch,
+                                     reconcile)
+                for url in api_url
+            }
+        for url, result in results.items():
+            if not result.result():
+                success = False
+    else:
+        for url in api_url:
+            if not nexus_instance_tasks(param, create, delete, url, api_user, api_pass, batch, reconcile):
+                success = False
+
+    return success
+
+
+def nexus_instance_tasks(param, create, delete, url, api_user, api_pass, batch=False, reconcile=False):
+    """
+    NEXUS Tasks fuer eine Nexus Instanz realisieren
+
+    Args:
+        param: REST Call Schema (dict: siehe schema.py)
+        create: Nexus Objekt anlegen (bool)
+        delete: Nexus Objekt loeschen (bool)
+        url: Nexus URL (string)
+        api_user: Nexus User (string)
+        api_pass: Nexus Passwort (string)
+        batch: Nexus Calls pro Abhaengigkeitsstufe in einem Request senden (bool)
+        reconcile: Nexus Objekte mit dem aktuellen Zustand abgleichen (bool)
+
+    Returns:
+        True/False
+    """
+    success = True
+    if reconcile:
+        with trace.span("nexus:reconcile", "nexus", url=url):
+            if not nexus.reconcile(param=param, user=api_user, password=api_pass, url=url, create=create):
+                success = False
+
+    elif batch:
+        with trace.span("nexus:batch", "nexus", url=url):
+            if create and not nexus.create_batch(params=[param], user=api_user, password=api_pass, url=url):
+                success = False
+            elif delete and not nexus.delete_batch(params=[param], user=api_user, password=api_pass, url=url):
+                success = False
+
+    elif create:
+        # Context anlegen, die Schritte bauen aufeinander auf und enden beim ersten Fehler
+        with trace.span("nexus:create_repo", "nexus", url=url):
+            success = nexus.create_repo(param=param["repo"], user=api_user, password=api_pass, url=url)
+        if success:
+            with trace.span("nexus:wait_for_repos", "nexus", url=url):
+                success = nexus.wait_for_repos(param=param["repo"], user=api_user, password=api_pass, url=url)
+        if success:
+            with trace.span("nexus:create_role", "nexus", url=url):
+                success = nexus.create_role(param=param["role"], user=api_user, password=api_pass, url=url)
+        if success:
+            with trace.span("nexus:wait_for_roles", "nexus", url=url):
+                success = nexus.wait_for_roles(param=param["role"], user=api_user, password=api_pass, url=url)
+        if success:
+            with trace.span("nexus:create_user", "nexus", url=url):
+                success = nexus.create_user(users=param["user"], user=api_user, password=api_pass, url=url)
+
+    elif delete:
+        # Context loeschen
+        with trace.span("nexus:delete_repo", "nexus", url=url):
+            if not nexus.delete_repo(param=param["repo"], user=api_user, password=api_pass, url=url):
+                success = False
+        with trace.span("nexus:delete_role", "nexus", url=url):
+            if not nexus.delete_role(param=param["role"], user=api_user, password=api_pass, url=url):
+                success = False
+        with trace.span("nexus:delete_user", "nexus", url=url):
+            if not nexus.delete_user(users=param["user"], user=api_user, password=api_pass, url=url):
+                success = False
+
+    if success:
+        logging.info("NEXUS " + url + " erfolgreich")
+    else:
+        logging.error("NEXUS " + url + " fehlgeschlagen")
+
+    return success
+
+
+def dcos_tasks(param, create, delete, api_url, api_user, api_pass, workers=1, reconcile=False):
+    """
+    DCOS Tasks realisiseren
+
+    Args:
+        param: REST Call Schema (dict: siehe schema.py)
+        create: DCOS Objekt anlegen (bool)
+        delete: DCOS Objekt loeschen (bool)
+        api_url: DCOS URL (string)
+        api_user: DCOS User (string)
+        api_pass: DCOS Passwort (string)
+        workers: Anzahl paralleler ACL Requests (int)
+        reconcile: ACLs mit dem aktuellen Zustand abgleichen (bool)
+
+    Returns:
+        True/False
+    """
+    success = True
+    with trace.span("dcos:token", "dcos"):
+        token = dcos.get_token(url=api_url, user=api_user, password=api_pass)
+    ba_env = get_ba_env(url=api_url)
+
+    if create:
+        # Context anlegen
+        with trace.span("dcos:create_service_group", "dcos"):
+            if not dcos.create_service_group(param=param["service_group"], url=api_url, token=token):
+                success = False
+        with trace.span("dcos:create_user_group", "dcos"):
+            if not dcos.create_user_group(param=param["user_group"], url=api_url, token=token):
+                success = False
+        acls = [(group, param["user_group_acl"][ba_env][param["user_group"][group]["role"]])
+                for group in param["user_group"]]
+        if reconcile:
+            # Die Context Gruppen gehoeren nur zu diesem Context, ueberzaehlige Grants werden entzogen
+            with trace.span("dcos:reconcile_user_group_acl", "dcos", workers=workers):
+                rids = dcos.read_acl_rids(url=api_url, token=token)
+                for group, acl in acls:
+                    if not dcos.reconcile_user_group_acl(
+                            param=acl,
+                            gid=group, url=api_url,
+                            token=token, workers=workers,
+                            rids=rids, prune=True):
+                        success = False
+        else:
+            # Von beiden Gruppen genutzte Resourcen werden nur einmal angelegt
+            with trace.span("dcos:create_user_group_acls", "dcos", workers=workers):
+                if not dcos.create_user_group_acls(param=acls, url=api_url, token=token, workers=workers):
+                    success = False
+    elif delete:
+        # Context loeschen
+        with trace.span("dcos:delete_service_group", "dcos"):
+            if not dcos.delete_service_group(param=param["service_group"]["id"], url=api_url, token=token):
+                success = False
+        with trace.span("dcos:delete_user_group", "dcos"):
+            if not dcos.delete_user_group(param=param["user_group"], url=api_url, token=token):
+                success = False
+
+    return success
+
+
+def context_steps(nexus_param, dcos_param, create, delete, nexus_url, nexus_user, nexus_pass,
+                  dcos_url, dcos_user, dcos_pass):
+    """
+    Context Operation als Ablaufgraph modellieren
+
+    Abhaengigkeiten beim Anlegen: Nexus User -> Rollen -> Repositories,
+    DCOS Grants -> User Gruppe und ACL Resource, alle DCOS Schritte ->
+    Token. Die Service Gruppe und das Loeschen haben keine Abhaengigkeiten
+    untereinander.
+
+    Args:
+        nexus_param: Nexus Schema (dict: siehe schema.nexus)
+        dcos_param: DCOS Schema (dict: siehe schema.dcos)
+        create: Objekte anlegen (bool)
+        delete: Objekte loeschen (bool)
+        nexus_url: Nexus URLs (list)
+        nexus_user: Nexus User (string)
+        nexus_pass: Nexus Passwort (string)
+        dcos_url: DCOS URL (string)
+        dcos_user: DCOS User (string)
+        dcos_pass: DCOS Passwort (string)
+
+    Returns:
+        Schritte (list of dag.Step)
+    """
+    steps = []
+    auth = {}
+
+    def token():
+        auth["token"] = dcos.get_token(url=dcos_url, user=dcos_user, password=dcos_pass)
+        return auth["token"] is not None
+
+    steps.append(dag.Step("dcos:token", "dcos_token", token, ()))
+
+    for url in nexus_url:
+        repos = nexus_param["repo"]
+        roles = nexus_param["role"]
+        users = nexus_param["user"]
+        if create:
+            for repo_name in repos:
+                steps.append(dag.Step(
+                    "nexus:" + url + ":repo:" + repo_name, "nexus_repo",
+                    partial(_nexus_create, nexus.create_repo, nexus.wait_for_repos,
+                            {repo_name: repos[repo_name]}, nexus_user, nexus_pass, url),
+                    ()
+                ))
+            for role_name in roles:
+                deps = ["nexus:" + url + ":repo:" + repo_name for repo_name in repos]
+                deps += ["nexus:" + url + ":role:" + role for role in roles[role_name]["contained_roles"]]
+                steps.append(dag.Step(
+                    "nexus:" + url + ":role:" + role_name, "nexus_role",
+                    partial(_nexus_create, nexus.create_role, nexus.wait_for_roles,
+                            {role_name: roles[role_name]}, nexus_user, nexus_pass, url),
+                    tuple(deps)
+                ))
+            for user_name in users:
+                steps.append(dag.Step(
+                    "nexus:" + url + ":user:" + user_name, "nexus_user",
+                    partial(nexus.create_user, {user_name: users[user_name]}, nexus_user, nexus_pass, url),
+                    tuple("nexus:" + url + ":role:" + role for role in users[user_name]["role"])
+                ))
+        elif delete:
+            for repo_name in repos:
+                steps.append(dag.Step(
+                    "nexus:" + url + ":repo:" + repo_name, "nexus_repo_delete",
+                    partial(nexus.delete_repo, {repo_name: repos[repo_name]}, nexus_user, nexus_pass, url),
+                    ()
+                ))
+            for role_name in roles:
+                steps.append(dag.Step(
+                    "nexus:" + url + ":role:" + role_name, "nexus_role_delete",
+                    partial(nexus.delete_role, {role_name: roles[role_name]}, nexus_user, nexus_pass, url),
+                    ()
+                ))
+            for user_name in users:
+                steps.append(dag.Step(
+                    "nexus:" + url + ":user:" + user_name, "nexus_user_delete",
+                    partial(nexus.delete_user, {user_name: users[user_name]}, nexus_user, nexus_pass, url),
+                    ()
+                ))
+
+    service_group = dcos_param["service_group"]
+    user_groups = dcos_param["user_group"]
+    if create:
+        steps.append(dag.Step(
+            "dcos:service_group", "dcos_service_group",
+            lambda: dcos.create_service_group(param=service_group, url=dcos_url, token=auth["token"]),
+            ("dcos:token",)
+        ))
+        ba_env = get_ba_env(url=dcos_url)
+        for gid in user_groups:
+            steps.append(dag.Step(
+                "dcos:user_group:" + gid, "dcos_user_group",
+                partial(_dcos_call, dcos.create_user_group, auth, {gid: user_groups[gid]}, dcos_url),
+                ("dcos:token",)
+            ))
+        acl_plan = plan.compile_acls(
+            (gid, dcos_param["user_group_acl"][ba_env][user_groups[gid]["role"]]) for gid in user_groups
+        )
+        for resource in acl_plan.resources:
+            steps.append(dag.Step(
+                "dcos:acl:" + resource.rid, "dcos_acl",
+                partial(_dcos_call, dcos.put_resource, auth, resource, dcos_url),
+                ("dcos:token",)
+            ))
+        for grant in acl_plan.grants:
+            steps.append(dag.Step(
+                "dcos:grant:" + grant.gid + ":" + grant.rid + ":" + grant.action, "dcos_grant",
+                partial(_dcos_call, dcos.put_grant, auth, grant, dcos_url),
+                ("dcos:user_group:" + grant.gid, "dcos:acl:" + grant.rid)
+            ))
+    elif delete:
+        steps.append(dag.Step(
+            "dcos:service_group", "dcos_service_group_delete",
+            lambda: dcos.delete_service_group(param=service_group["id"], url=dcos_url, token=auth["token"]),
+            ("dcos:token",)
+        ))
+        for gid in user_groups:
+            steps.append(dag.Step(
+                "dcos:user_group:" + gid, "dcos_user_group_delete",
+                partial(_dcos_call, dcos.delete_user_group, auth, {gid: user_groups[gid]}, dcos_url),
+                ("dcos:token",)
+            ))
+
+    return steps
+
+
+def _nexus_create(create_func, wait_func, param, user, password, url):
+    """ Nexus Objekt anlegen und warten bis es sichtbar ist """
+    if not create_func(param, user, password, url):
+        return False
+    return wait_func(param=param, user=user, password=password, url=url)
+
+
+def _dcos_call(func, auth, param, url):
+    """ DCOS Funktion mit dem Token aus dem Token Schritt aufrufen """
+    return func(param, url, auth["token"])
+
+
+def get_ba_env(url):
+    """
+    BA Environment ermitteln
+
+    Args:
+        url: URL (string)
+
+    Returns:
+        prod, nprod
+    """
+    if re.match(r".+[eis]dst\.[eis]baintern\.de.*", url) \
+            or re.match(r".+iirzi\.de.*", url):
+        ba_env = "nprod"
+    else:
+        ba_env = "prod"
+
+    return ba_env
@@ -0,0 +1,110 @@
+import logging
+import dcos_context.trace as trace
+
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Schritt im Ablaufgraph
+#   name = Eindeutiger Name (string)
+#   kind = Typ, z.B. nexus_repo oder dcos_grant (string)
+#   func = Funktion ohne Argumente, liefert True/False (function)
+#   deps = Namen der Schritte, die vorher erfolgreich sein muessen (tuple)
+Step = namedtuple("Step", ["name", "kind", "func", "deps"])
+
+
+def run(steps, workers=1):
+    """
+    Schritte in Abhaengigkeitsreihenfolge mit maximaler Parallelitaet ausfuehren
+
+    Ein Schritt startet sobald alle Abhaengigkeiten erfolgreich waren.
+    Schlaegt ein Schritt fehl, werden alle abhaengigen Schritte
+    uebersprungen und als fehlgeschlagen gewertet.
+
+    Args:
+        steps = Schritte (list of Step)
+        workers = Maximale Anzahl gleichzeitig laufender Schritte (int)
+
+    Returns:
+        Ergebnis pro Schrittname (dict: name -> True/False)
+    """
+    by_name = {}
+    for step in steps:
+        if step.name in by_name:
+            raise Exception("DAG Schritt doppelt: " + step.name)
+        by_name[step.name] = step
+
+    waiting = {}
+    dependents = defaultdict(list)
+    ready = deque()
+    for step in steps:
+        for dep in step.deps:
+            if dep not in by_name:
+                raise Exception("DAG Abhaengigkeit unbekannt: " + step.name + " -> " + dep)
+            dependents[dep].append(step.name)
+        waiting[step.name] = set(step.deps)
+        if not step.deps:
+            ready.append(step.name)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dag") as executor:
+        running = {}
+        while ready or running:
+            while ready and len(running) < workers:
+                name = ready.popleft()
+                running[executor.submit(_call, by_name[name])] = name
+
+            done = wait(running, return_when=FIRST_COMPLETED)[0]
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                if not results[name]:
+                    _skip(name, dependents, results)
+                    continue
+                for dependent in dependents[name]:
+                    waiting[dependent].discard(name)
+                    if not waiting[dependent] and dependent not in results:
+                        ready.append(dependent)
+
+    for name in by_name:
+        if name not in results:
+            logging.error("DAG Schritt " + name + " nicht ausfuehrbar (Zyklus)")
+            results[name] = False
+
+    return results
+
+
+def _call(step):
+    """
+    Schritt ausfuehren, Exceptions werden als Fehler gewertet
+
+    Args:
+        step = Schritt (Step)
+
+    Returns:
+        True/False
+    """
+    try:
+        with trace.span(step.name, step.kind):
+            return bool(step.func())
+    except Exception:
+        logging.exception("DAG Schritt " + step.name + " fehlgeschlagen")
+        return False
+
+
+def _skip(name, dependents, results):
+    """
+    Alle von einem fehlgeschlagenen Schritt abhaengigen Schritte ueberspringen
+
+    Args:
+        name = Name des fehlgeschlagenen Schritts (string)
+        dependents = Abhaengige Schritte pro Schrittname (dict)
+        results = Ergebnisse (dict)
+    """
+    pending = list(dependents[name])
+    while pending:
+        dependent = pending.pop()
+        if dependent in results:
+            continue
+        logging.error("DAG Schritt " + dependent + " uebersprungen (" + name + " fehlgeschlagen)")
+        results[dependent] = False
+        pending.extend(dependents[dependent])
@@ -0,0 +1,604 @@
+#!/usr/bin/python
+
+import logging
+import threading
+import dcos_context.session as session
+import dcos_context.tokencache as tokencache
+import dcos_context.schema as schema
+import dcos_context.plan as plan
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+ssl_verify = False
+
+# Ein Login Lock pro Cluster und User, Logins fuer verschiedene Cluster laufen parallel
+_token_locks = {}
+_token_locks_lock = threading.Lock()
+
+# Zugangsdaten pro ausgegebenem Token und Ersatz fuer abgelehnte Tokens (siehe renew_token)
+_credentials = {}
+_renewed = {}
+
+
+def request(method, url, token, **kwargs):
+    """
+    HTTP Request mit DCOS Token
+
+    Lehnt DC/OS den Token ab (401, z.B. widerrufen oder Passwort
+    geaendert), wird einmal neu eingeloggt und der Request wiederholt.
+
+    Args:
+        method = HTTP Methode (string: GET, POST, PUT, DELETE)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+        kwargs = Weitere Argumente fuer requests, z.B. json
+
+    Returns:
+        requests.Response
+    """
+    while token in _renewed:
+        token = _renewed[token]
+
+    response = _send(method, url, token, **kwargs)
+    if response.status_code == 401 and token in _credentials:
+        new_token = renew_token(token)
+        if new_token:
+            response = _send(method, url, new_token, **kwargs)
+
+    return response
+
+
+def _send(method, url, token, **kwargs):
+    """ HTTP Request ueber die gepoolte Session senden """
+    auth_header = {"Authorization": "token=" + token}
+    return session.get(url).request(method, url, headers=auth_header, verify=ssl_verify, proxies="", **kwargs)
+
+
+def renew_token(token):
+    """
+    Abgelehnten Token aus dem Cache entfernen und neu einloggen
+
+    Parallele Requests mit demselben Token loggen nur einmal neu ein.
+
+    Args:
+        token = Abgelehnter DCOS Token (string)
+
+    Returns:
+        Neuer Token oder None
+    """
+    url, user, password = _credentials[token]
+    with _token_lock(url, user):
+        if token in _renewed:
+            return _renewed[token]
+
+        logging.warning("DC/OS API Token abgelehnt, melde neu an")
+        tokencache.delete(url, user)
+        new_token = get_token(url, user, password, cache=False)
+        if new_token:
+            tokencache.put(url, user, new_token)
+            _credentials[new_token] = (url, user, password)
+            _renewed[token] = new_token
+        return new_token
+
+
+def _token_lock(url, user):
+    """ Login Lock fuer einen Cluster und User """
+    with _token_locks_lock:
+        return _token_locks.setdefault((url, user), threading.Lock())
+
+
+def post(param, url, token):
+    """
+    HTTP-Post Request
+
+    Args:
+        param = DCOS Native API Request (dict)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    response = request("POST", url, token, json=param)
+    response_status = str(response.status_code)
+    return response_status
+
+
+def put(param, url, token):
+    """
+    HTTP-Put Request
+
+    Args:
+        param = DCOS Native API Request (dict)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    response = request("PUT", url, token, json=param)
+    response_status = str(response.status_code)
+    return response_status
+
+
+def delete(param, url, token):
+    """
+    HTTP-Delete Request
+
+    Args:
+        param = DCOS Native API Request (dict)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    response = request("DELETE", url, token, json=param)
+    response_status = str(response.status_code)
+    return response_status
+
+
+def get(url, token):
+    """
+    HTTP-Get Request
+
+    Args:
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode und JSON Antwort des Request (tuple)
+    """
+    response = request("GET", url, token)
+    response_status = str(response.status_code)
+    try:
+        response_output = response.json()
+    except ValueError:
+        response_output = None
+    return response_status, response_output
+
+
+def get_token(url, user, password, cache=True):
+    """
+    DCOS Access Token Anfordern
+
+    Ein gecachter Token wird verwendet, solange er nicht kurz vor dem
+    Ablauf steht (siehe dcos_context/tokencache.py).
+
+    Args:
+        url = DCOS URL (string)
+        user = DCOS User (string)
+        password = DCOS Password (string)
+        cache = Token Cache verwenden (bool)
+
+    Returns:
+        Access Token
+    """
+    if cache:
+        # Parallele Aufrufe fuer denselben Cluster sollen nur einmal einloggen
+        with _token_lock(url, user):
+            token = tokencache.get(url, user)
+            if token:
+                logging.debug("DC/OS Verwende gecachten API Token")
+            else:
+                token = get_token(url, user, password, cache=False)
+                if token:
+                    tokencache.put(url, user, token)
+            if token:
+                _credentials[token] = (url, user, password)
+        return token
+
+    api_call = {
+        "uid": user,
+        "password": password
+    }
+    msg = "DC/OS Generiere API Token"
+    logging.info(msg)
+    api_auth = (user, password)
+    api_url = url + "/acs/api/v1/auth/login"
+
+    try:
+        response = session.get(api_url).post(url=api_url, json=api_call, auth=api_auth, verify=ssl_verify)
+        response_output = response.json()
+        token = str(response_output["token"])
+        return token
+    except:
+        logging.error("DC/OS Unable to obtain API token from " + api_url)
+
+
+def create_service_group(param, url, token):
+    """
+    DCOS Service Gruppe anlegen
+
+    Args:
+        param = DCOS Native API Request (dict: siehe dcos_context/schema.py)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    success = True
+    api_url = url + "/service/marathon/v2/groups"
+    msg = "DC/OS Anlegen Service Group " + param['id']
+    logging.info(msg)
+    status = post(param=param, url=api_url, token=token)
+    if status not in ["201", "409"]:
+        logging.error(msg)
+        success = False
+
+    return success
+
+
+def delete_service_group(param, url, token):
+    """
+    DCOS Service Gruppe loeschen
+
+    Args:
+        param = DCOS Native API Request (dict: siehe dcos_context/schema.py)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    success = True
+    api_url = url + "/service/marathon/v2/groups/" + param
+    msg = "DC/OS Loesche Service Group " + param
+    logging.info(msg)
+    status = delete(param=param, url=api_url, token=token)
+
+    if status not in ["200"]:
+        logging.error(msg)
+        success = False
+
+    return success
+
+
+def create_user_group(param, url, token):
+    """
+    DCOS User Gruppe anlegen
+
+    Args:
+        param = DCOS Native API Request (dict: siehe dcos_context/schema.py)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    success = True
+    api_url = url + "/acs/api/v1/groups"
+    for gid in param:
+        msg = "DC/OS Anlegen User Group " + gid
+        logging.info(msg)
+        status = put(param={"description": gid}, url=api_url + "/" + gid, token=token)
+
+        if status not in ["201", "409"]:
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def delete_user_group(param, url, token):
+    """
+    DCOS Service Gruppe loeschen
+
+    Args:
+        param = DCOS Native API Request (dict: siehe dcos_context/schema.py)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        HTTP-Statuscode des Request
+    """
+    success = True
+    api_url = url + "/acs/api/v1/groups"
+    for gid in param:
+        msg = "DC/OS Loesche User Group " + gid
+        logging.info(msg)
+        status = delete(param={"description": gid}, url=api_url + "/" + gid, token=token)
+
+        if status not in ["204"]:
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def create_acl(rid, url, token):
+    """
+    DCOS ACL Resource anlegen
+
+    Args:
+        rid = Resource ID (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        True/False
+    """
+    return put_resource(plan.Resource(rid, "/" + schema.encode_rid(rid)), url, token)
+
+
+def grant_acl(rid, gid, action, url, token):
+    """
+    DCOS ACL Action an User Gruppe vergeben
+
+    Args:
+        rid = Resource ID (string)
+        gid = User Gruppen Name (string)
+        action = Action, z.B. read oder full (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        True/False
+    """
+    path = "/" + schema.encode_rid(rid) + "/groups/" + gid + "/" + action
+    return put_grant(plan.Grant(rid, gid, action, path), url, token)
+
+
+def put_resource(resource, url, token):
+    """
+    DCOS ACL Resource aus einem Plan anlegen
+
+    Args:
+        resource = Resource (plan.Resource)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        True/False
+    """
+    status = put(param={"description": "string"}, url=url + "/acs/api/v1/acls" + resource.path, token=token)
+
+    if status not in ["201", "409"]:
+        logging.error("DC/OS Anlegen ACL " + resource.rid)
+        return False
+
+    return True
+
+
+def put_grant(grant, url, token):
+    """
+    DCOS ACL Grant aus einem Plan vergeben
+
+    Args:
+        grant = Grant (plan.Grant)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        True/False
+    """
+    status = put(param={}, url=url + "/acs/api/v1/acls" + grant.path, token=token)
+
+    if status not in ["204", "409"]:
+        logging.error("DC/OS Vergabe " + grant.action + " auf " + grant.rid + " fuer Group " + grant.gid)
+        return False
+
+    return True
+
+
+def apply_plan(acl_plan, url, token, workers=1):
+    """
+    DCOS ACL Plan ausfuehren
+
+    Mit workers > 1 werden zuerst alle Resourcen parallel angelegt, die
+    Grants einer Resource starten sobald diese angelegt ist. Fehler beim
+    Anlegen einer Resource werden nur geloggt, das Ergebnis bestimmen
+    die Grants.
+
+    Args:
+        acl_plan = Plan (siehe dcos_context/plan.py)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+        workers = Anzahl paralleler Requests (int)
+
+    Returns:
+        True/False
+    """
+    success = True
+    if workers <= 1:
+        for resource in acl_plan.resources:
+            put_resource(resource, url, token)
+
+        for grant in acl_plan.grants:
+            if not put_grant(grant, url, token):
+                success = False
+    else:
+        grants = acl_plan.grants_by_rid()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dcos-acl") as executor:
+            resources = dict((executor.submit(put_resource, resource, url, token), resource.rid)
+                             for resource in acl_plan.resources)
+            # Grants ohne Resource im Plan koennen sofort starten
+            futures = [executor.submit(put_grant, grant, url, token)
+                       for rid in set(grants) - set(resources.values()) for grant in grants[rid]]
+            for future in as_completed(resources):
+                for grant in grants.get(resources[future], ()):
+                    futures.append(executor.submit(put_grant, grant, url, token))
+
+            for future in futures:
+                if not future.result():
+                    success = False
+
+    return success
+
+
+def create_user_group_acl(param, gid, url, token, workers=1):
+    """
+    DCOS User Gruppen ACL anlegen
+
+    Args:
+        param = DCOS Native API Request (siehe dcos_context/schema.py)
+        gid = User Gruppen Name (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+        workers = Anzahl paralleler Requests (int)
+
+    Returns:
+        True/False
+    """
+    msg = "DC/OS Anlegen Permissions fuer Group " + gid
+    logging.info(msg)
+
+    success = apply_plan(plan.compile_acls([(gid, param)]), url, token, workers=workers)
+    if not success:
+        logging.error(msg)
+
+    return success
+
+
+def revoke_acl(rid, gid, action, url, token):
+    """
+    DCOS ACL Action einer User Gruppe entziehen
+
+    Args:
+        rid = Resource ID (string)
+        gid = User Gruppen Name (string)
+        action = Action, z.B. read oder full (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        True/False
+    """
+    api_url = url + "/acs/api/v1/acls/" + schema.encode_rid(rid) + "/groups/" + gid + "/" + action
+    status = delete(param={}, url=api_url, token=token)
+
+    if status not in ["204", "404"]:
+        logging.error("DC/OS Entziehe " + action + " auf " + rid + " fuer Group " + gid)
+        return False
+
+    return True
+
+
+def read_acl_rids(url, token):
+    """
+    Vorhandene DCOS ACL Resourcen lesen
+
+    Args:
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        Resource IDs (set) oder None bei Fehler
+    """
+    status, response_output = get(url=url + "/acs/api/v1/acls", token=token)
+    if status != "200" or response_output is None:
+        logging.error("DC/OS Lesen der ACLs fehlgeschlagen")
+        return None
+
+    return set(acl["rid"] for acl in response_output.get("array", []))
+
+
+def read_group_permissions(gid, url, token):
+    """
+    Direkt vergebene Permissions einer DCOS User Gruppe lesen
+
+    Args:
+        gid = User Gruppen Name (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+
+    Returns:
+        Actions pro Resource ID (dict: rid -> set) oder None bei Fehler
+    """
+    status, response_output = get(url=url + "/acs/api/v1/groups/" + gid + "/permissions", token=token)
+    if status == "404":
+        return {}
+    if status != "200" or response_output is None:
+        logging.error("DC/OS Lesen der Permissions fuer Group " + gid + " fehlgeschlagen")
+        return None
+
+    permissions = {}
+    for permission in response_output.get("array", []):
+        actions = set(action["name"] for action in permission.get("actions", []) if not action.get("implied"))
+        if actions:
+            permissions[permission["rid"]] = actions
+
+    return permissions
+
+
+def reconcile_user_group_acl(param, gid, url, token, workers=1, rids=None, prune=False):
+    """
+    DCOS User Gruppen ACL mit dem Schema abgleichen
+
+    Liest den aktuellen Zustand einmal und fuehrt nur die fehlenden
+    PUT Requests (und mit prune die DELETE Requests fuer ueberzaehlige
+    Grants der Gruppe) aus.
+
+    Args:
+        param = DCOS Native API Request (siehe dcos_context/schema.py)
+        gid = User Gruppen Name (string)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+        workers = Anzahl paralleler Requests (int)
+        rids = Bereits gelesene Resource IDs, wird um angelegte ergaenzt (set)
+        prune = Nicht im Schema enthaltene Grants der Gruppe entziehen (bool)
+
+    Returns:
+        True/False
+    """
+    msg = "DC/OS Abgleich Permissions fuer Group " + gid
+    logging.info(msg)
+
+    if rids is None:
+        rids = read_acl_rids(url=url, token=token)
+    permissions = read_group_permissions(gid=gid, url=url, token=token)
+    if rids is None or permissions is None:
+        logging.error(msg)
+        return False
+
+    resources = [rid for rid in param if rid not in rids]
+    grants = [(rid, action) for rid, actions in param.items()
+              for action in actions if action not in permissions.get(rid, ())]
+    revokes = []
+    if prune:
+        revokes = [(rid, action) for rid, actions in permissions.items()
+                   for action in actions if action not in param.get(rid, ())]
+
+    logging.info(msg + ": " + str(len(resources)) + " Resourcen, " + str(len(grants)) + " Grants, " +
+                 str(len(revokes)) + " Revokes")
+
+    success = True
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="dcos-acl") as executor:
+        for future in [executor.submit(create_acl, rid, url, token) for rid in resources]:
+            future.result()
+        rids.update(resources)
+
+        futures = [executor.submit(grant_acl, rid, gid, action, url, token) for rid, action in grants]
+        futures += [executor.submit(revoke_acl, rid, gid, action, url, token) for rid, action in revokes]
+        for future in futures:
+            if not future.result():
+                success = False
+
+    if not success:
+        logging.error(msg)
+
+    return success
+
+
+def create_user_group_acls(param, url, token, workers=1):
+    """
+    ACLs fuer mehrere DCOS User Gruppen gemeinsam anlegen
+
+    Gemeinsam genutzte Resourcen und doppelte Grants werden nur einmal
+    angelegt (siehe plan.compile_acls).
+
+    Args:
+        param = Tupel aus User Gruppen Name und ACL Schema (list)
+        url = DCOS URL (string)
+        token = DCOS Token (string)
+        workers = Anzahl paralleler Requests (int)
+
+    Returns:
+        True/False
+    """
+    acl_plan = plan.compile_acls(param)
+    logging.info("DC/OS Anlegen Permissions: " + str(len(acl_plan.resources)) + " Resourcen, " +
+                 str(len(acl_plan.grants)) + " Grants")
+
+    return apply_plan(acl_plan, url, token, workers=workers)
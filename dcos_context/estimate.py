@@ -0,0 +1,165 @@
+import math
+import dcos_context.lazy as lazy
+
+yaml = lazy.load("yaml")
+
+# Endpoints (Methode und Pfad Template)
+DCOS_LOGIN = "POST /acs/api/v1/auth/login"
+DCOS_SERVICE_GROUP_CREATE = "POST /service/marathon/v2/groups"
+DCOS_SERVICE_GROUP_DELETE = "DELETE /service/marathon/v2/groups/{id}"
+DCOS_USER_GROUP_CREATE = "PUT /acs/api/v1/groups/{gid}"
+DCOS_USER_GROUP_DELETE = "DELETE /acs/api/v1/groups/{gid}"
+DCOS_USER_GROUP_PERMISSIONS = "GET /acs/api/v1/groups/{gid}/permissions"
+DCOS_ACLS = "GET /acs/api/v1/acls"
+DCOS_ACL_CREATE = "PUT /acs/api/v1/acls/{rid}"
+DCOS_GRANT = "PUT /acs/api/v1/acls/{rid}/groups/{gid}/{action}"
+NEXUS_EXTDIRECT = "POST /service/extdirect"
+
+# Default Latenzen in Sekunden pro Endpoint
+DEFAULT_LATENCY = {
+    DCOS_LOGIN: 0.5,
+    DCOS_SERVICE_GROUP_CREATE: 0.3,
+    DCOS_SERVICE_GROUP_DELETE: 0.3,
+    DCOS_USER_GROUP_CREATE: 0.1,
+    DCOS_USER_GROUP_DELETE: 0.1,
+    DCOS_USER_GROUP_PERMISSIONS: 0.1,
+    DCOS_ACLS: 0.3,
+    DCOS_ACL_CREATE: 0.1,
+    DCOS_GRANT: 0.1,
+    NEXUS_EXTDIRECT: 0.2
+}
+
+
+def load_latency(path):
+    """
+    Latenzen pro Endpoint aus einem YAML/JSON File laden
+
+    Das File enthaelt entweder Endpoint -> Sekunden oder ist ein mit
+    --metrics geschriebenes JSON File (Mittelwert pro Endpoint).
+
+    Args:
+        path = File (string)
+
+    Returns:
+        Latenz pro Endpoint (dict), fehlende Endpoints mit Default
+    """
+    latency = dict(DEFAULT_LATENCY)
+    if not path:
+        return latency
+
+    with open(path, 'r') as latency_file:
+        data = yaml.safe_load(latency_file) or {}
+
+    for endpoint, value in data.get("endpoints", data).items():
+        if isinstance(value, dict):
+            if value.get("count"):
+                latency[endpoint] = float(value["seconds"]) / value["count"]
+        else:
+            latency[endpoint] = float(value)
+
+    return latency
+
+
+class Estimate(object):
+    """
+    Anzahl API Calls pro Endpoint und geschaetzte Dauer
+    """
+    __slots__ = ("latency", "counts", "seconds")
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.counts = {}
+        self.seconds = 0.0
+
+    def sequential(self, endpoint, calls=1):
+        """
+        Nacheinander ausgefuehrte Calls aufnehmen
+
+        Args:
+            endpoint = Endpoint (string)
+            calls = Anzahl Calls (int)
+
+        Returns:
+            Estimate
+        """
+        return self.parallel(endpoint, calls, 1)
+
+    def parallel(self, endpoint, calls, workers):
+        """
+        Mit workers parallel ausgefuehrte Calls aufnehmen
+
+        Args:
+            endpoint = Endpoint (string)
+            calls = Anzahl Calls (int)
+            workers = Anzahl paralleler Requests (int)
+
+        Returns:
+            Estimate
+        """
+        if calls:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + calls
+            self.seconds += math.ceil(float(calls) / max(workers, 1)) * self.latency.get(endpoint, 0.0)
+        return self
+
+    def acls(self, acl_plan, workers):
+        """
+        PUT Requests eines ACL Plans aufnehmen (siehe dcos.apply_plan)
+
+        Args:
+            acl_plan = ACL Plan (plan.Plan)
+            workers = Anzahl paralleler Requests (int)
+
+        Returns:
+            Estimate
+        """
+        self.parallel(DCOS_ACL_CREATE, len(acl_plan.resources), workers)
+        return self.parallel(DCOS_GRANT, len(acl_plan.grants), workers)
+
+    def add(self, other):
+        """
+        Nach diesem Estimate ausgefuehrten Estimate anhaengen
+
+        Args:
+            other = Estimate
+
+        Returns:
+            Estimate
+        """
+        for endpoint, calls in other.counts.items():
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + calls
+        self.seconds += other.seconds
+        return self
+
+    def join(self, other):
+        """
+        Gleichzeitig zu diesem Estimate ausgefuehrten Estimate aufnehmen
+
+        Args:
+            other = Estimate
+
+        Returns:
+            Estimate
+        """
+        seconds = max(self.seconds, other.seconds)
+        self.add(other)
+        self.seconds = seconds
+        return self
+
+    def total_latency(self):
+        """
+        Summe der Latenzen aller Calls
+
+        Returns:
+            Sekunden (float)
+        """
+        return sum(calls * self.latency.get(endpoint, 0.0) for endpoint, calls in self.counts.items())
+
+    def report(self):
+        """
+        Calls pro Endpoint und geschaetzte Dauer ausgeben
+        """
+        print(" %-55s %8s %10s" % ("Endpoint", "Calls", "Latenz"))
+        for endpoint, calls in sorted(self.counts.items()):
+            print(" %-55s %8d %9.3fs" % (endpoint, calls, self.latency.get(endpoint, 0.0)))
+        print(" %-55s %8d" % ("Summe", sum(self.counts.values())))
+        print(" %-55s %8s %9.1fs" % ("Geschaetzte Dauer", "", self.seconds))
@@ -0,0 +1,151 @@
+import functools
+import dcos_context.schema as schema
+
+# Flyweight Templates pro (Umgebung, Rolle)
+_templates = {}
+
+
+class Template(object):
+    """
+    ACL Template einer Umgebung und Rolle, wird von allen Contexten geteilt
+    """
+    __slots__ = ("env", "role", "entries")
+
+    def __init__(self, env, role):
+        self.env = env
+        self.role = role
+        self.entries = schema.dcos_acl_template(env, role)
+
+    def rids(self, name):
+        """
+        Resource IDs fuer einen Context rendern
+
+        Args:
+            name = Context Name (string)
+
+        Returns:
+            Resource ID und Actions (generator of tuple)
+        """
+        for parts, actions in self.entries:
+            yield name.join(parts), actions
+
+
+def template(env, role):
+    """
+    Geteiltes Template einer Umgebung und Rolle ermitteln
+
+    Args:
+        env = Umgebung (prod, nprod)
+        role = Rolle (dev, devops)
+
+    Returns:
+        Template
+    """
+    key = (env, role)
+    if key not in _templates:
+        _templates[key] = Template(env, role)
+    return _templates[key]
+
+
+@functools.lru_cache(maxsize=None)
+def acl_counts(env, roles):
+    """
+    Anzahl ACL Resourcen und Grants eines Context ermitteln
+
+    Entspricht plan.compile_acls fuer die User Gruppen eines Context,
+    haengt aber nicht vom Context Namen ab und wird daher pro Umgebung
+    und Rollen nur einmal aus den Templates berechnet.
+
+    Args:
+        env = Umgebung (prod, nprod)
+        roles = Rollen der User Gruppen (tuple)
+
+    Returns:
+        Anzahl Resourcen und Grants (tuple)
+    """
+    rids = set()
+    grants = 0
+    for role in roles:
+        for parts, actions in template(env, role).entries:
+            rids.add(parts)
+            grants += len(set(actions))
+    return len(rids), grants
+
+
+class Context(object):
+    """
+    Soll-ACL eines Context, gespeichert als Name und Template Referenz
+    """
+    __slots__ = ("name", "template")
+
+    def __init__(self, name, env, role):
+        self.name = name
+        self.template = template(env, role)
+
+    @property
+    def gid(self):
+        """ Name der User Gruppe des Context (siehe schema.dcos_user_group) """
+        return self.template.role + "_" + self.name
+
+    def __iter__(self):
+        for rid, actions in self.template.rids(self.name):
+            for action in actions:
+                yield rid, action
+
+    def acl(self):
+        """
+        ACL als dict rendern
+
+        Returns:
+            ACL Schema (dict: rid -> actions, siehe schema.dcos_acl)
+        """
+        return schema.dcos_acl(self.name, self.template.env, self.template.role)
+
+
+class Fleet(object):
+    """
+    Soll-ACLs vieler Contexte in kompakter Form
+    """
+    __slots__ = ("contexts",)
+
+    def __init__(self):
+        self.contexts = []
+
+    def add(self, name, env, roles=("dev", "devops")):
+        """
+        Context mit seinen Rollen aufnehmen
+
+        Args:
+            name = Context Name (string)
+            env = Umgebung (prod, nprod)
+            roles = Rollen (tuple)
+        """
+        for role in roles:
+            self.contexts.append(Context(name, env, role))
+
+    def __len__(self):
+        return len(self.contexts)
+
+    def __iter__(self):
+        return iter(self.contexts)
+
+    def triples(self):
+        """
+        Alle (Context, Resource ID, Action) Tripel streamen
+
+        Returns:
+            Tripel (generator of tuple)
+        """
+        for context in self.contexts:
+            for rid, action in context:
+                yield context, rid, action
+
+    def grant_paths(self):
+        """
+        ACL Grant Pfade aller Contexte streamen
+
+        Returns:
+            Pfade relativ zu /acs/api/v1/acls (generator of string)
+        """
+        for context, rid, action in self.triples():
+            yield "/" + schema.encode_rid(rid) + "/groups/" + context.gid + "/" + action
@@ -0,0 +1,495 @@
+import atexit
+import getopt
+import os
+import sys
+import re
+import dcos_context.lazy as lazy
+import dcos_context.config as config
+import dcos_context.schema as schema
+import dcos_context.manifest as manifest
+import dcos_context.clusters as clusters
+import dcos_context.estimate as estimate
+import dcos_context.metrics as metrics
+import dcos_context.trace as trace
+import dcos_context.profiler as profiler
+import dcos_context.plan as plan
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Netzwerk Module erst bei Bedarf laden (siehe dcos_context/lazy.py)
+dcos = lazy.load("dcos_context.dcos")
+session = lazy.load("dcos_context.session")
+
+
+def usage():
+    """ Usage Message """
+    print('Usage:\n', sys.argv[0],
+          '[--verbose] [--add|remove] [--gid=GROUP_NAME] [--role=ROLE] [--name=CONTEXT_NAME] ' +
+          '[--cluster=DCOS_CLUSTER] [--cfg_dcos=CFG_FILE_DCOS] [--workers=N] [--reconcile] [--manifest=FILE] ' +
+          '[--plan] [--plan_file=FILE] [--latency=FILE] [--metrics=FILE] [--metrics_prom=FILE] [--trace=FILE] ' +
+          '[--profile=FILE]')
+    print("\nUser Gruppe zu einem DCOS Context hinzufuegen/entfernen")
+    print("\nArguments:")
+    print(" %-15s %-30s" % ("--verbose", "Verbose Modus"))
+    print(" %-15s %-30s" % ("--add", "Gruppe hinzufuegen"))
+    print(" %-15s %-30s" % ("--remove", "Gruppe entfernen"))
+    print(" %-15s %-30s" % ("--gid", "DCOS User Gruppen Name"))
+    print(" %-15s %-30s" % ("--role", "Rolle z.B. devops oder dev"))
+    print(" %-15s %-30s" % ("--name", "DCOS Service Gruppen name"))
+    print(" %-15s %-30s" % ("--remove", "Gruppe entfernen"))
+    print(" %-15s %-30s" % ("--cluster", "DCOS Cluster Name, Liste a,b oder Cluster Gruppe (siehe --cfg_dcos)"))
+    print(" %-15s %-30s" % ("--cfg_dcos", "Optional, DCOS Konfigurationsfile"))
+    print(" %-15s %-30s" % ("--workers", "Optional, Anzahl paralleler DCOS ACL Requests (Default: 1)"))
+    print(" %-15s %-30s" % ("--reconcile", "Optional, nur fehlende Permissions vergeben"))
+    print(" %-15s %-30s" % ("--manifest", "Optional, Liste aus gid, role, name statt --gid/--role/--name"))
+    print(" %-15s %-30s" % ("--plan", "Optional, nur API Calls und Dauer abschaetzen, keine Aenderungen"))
+    print(" %-15s %-30s" % ("--plan_file", "Optional, mit --plan den ACL Plan als JSON schreiben, "
+                                           "mehrere Cluster: plan.<cluster>.json"))
+    print(" %-15s %-30s" % ("--latency", "Optional, Latenzen pro Endpoint fuer --plan (YAML/JSON, --metrics File)"))
+    print(" %-15s %-30s" % ("--metrics", "Optional, Latenz, Status, Bytes pro Endpoint am Ende als JSON schreiben"))
+    print(" %-15s %-30s" % ("--metrics_prom", "Optional, dieselben Metriken als Prometheus Textfile (.prom)"))
+    print(" %-15s %-30s" % ("--trace", "Optional, Timeline der Schritte und HTTP Calls als Chrome Trace JSON"))
+    print(" %-15s %-30s" % ("--profile", "Optional, cProfile Daten als pstats File schreiben (.txt: Text Report)"))
+    print("\nExamples:")
+    print(" Anlegen:")
+    print(" ", sys.argv[0], '--add --gid="z000-demogruppe" --role="devops" --cluster="dcos_tru"')
+    print(" Loeschen:")
+    print(" ", sys.argv[0], '--remove --gid="z000-demogruppe" --role="devops" --cluster="dcos_tru"')
+    print(" Manifest:")
+    print(" ", sys.argv[0], '--add --manifest="groups.yml" --cluster="dcos_tru" --workers=16')
+    print("\n")
+    sys.exit(2)
+
+
+def main(argv=None):
+    """
+    MAIN
+
+    Args:
+        argv = Argumente, Default sys.argv[1:] (list)
+
+    Returns:
+        True/False
+    """
+
+    # Argument Handling
+    arg_cfg_dcos = "/tmp/dcos.yml"
+    arg_verbose = False
+    arg_add = False
+    arg_remove = False
+    arg_cluster = False
+    arg_context_name = False
+    arg_role = False
+    arg_gid = False
+    arg_workers = 1
+    arg_reconcile = False
+    arg_manifest = False
+    arg_plan = False
+    arg_plan_file = False
+    arg_latency = False
+    arg_metrics = False
+    arg_metrics_prom = False
+    arg_trace = False
+    arg_profile = False
+
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:] if argv is None else argv,
+            "",
+            ["help", "add", "remove", "cluster=", "name=", "gid=", "role=", "verbose", "cfg_nexus", "cfg_dcos=",
+             "workers=", "reconcile", "manifest=", "plan", "plan_file=", "latency=", "metrics=", "metrics_prom=",
+             "trace=", "profile="]
+        )
+    except getopt.GetoptError as err:
+        str(err)
+        usage()
+
+    for opt, arg in opts:
+        if opt in '--help':
+            usage()
+        elif opt in '--verbose':
+            arg_verbose = True
+        elif opt in '--add':
+            arg_add = True
+        elif opt in '--remove':
+            arg_remove = True
+        elif opt in '--cluster':
+            arg_cluster = arg
+        elif opt in '--name':
+            arg_context_name = arg
+        elif opt in '--role':
+            arg_role = arg
+        elif opt in '--gid':
+            arg_gid = arg
+        elif opt in '--cfg_dcos':
+            arg_cfg_dcos = arg
+        elif opt in '--workers':
+            try:
+                arg_workers = int(arg)
+            except ValueError:
+                usage()
+        elif opt in '--reconcile':
+            arg_reconcile = True
+        elif opt in '--manifest':
+            arg_manifest = arg
+        elif opt in '--plan':
+            arg_plan = True
+        elif opt in '--plan_file':
+            arg_plan_file = arg
+        elif opt in '--latency':
+            arg_latency = arg
+        elif opt in '--metrics':
+            arg_metrics = arg
+        elif opt in '--metrics_prom':
+            arg_metrics_prom = arg
+        elif opt in '--trace':
+            arg_trace = arg
+        elif opt in '--profile':
+            arg_profile = arg
+        else:
+            usage()
+
+    # Argument Parsing
+    if not arg_cluster:
+        usage()
+    elif arg_manifest:
+        if arg_context_name or arg_gid or arg_role or arg_reconcile:
+            usage()
+    elif not arg_context_name:
+        usage()
+    elif arg_add and arg_role not in schema.dcos_roles("prod"):
+        usage()
+    elif not arg_gid and arg_gid:
+        usage()
+    elif not arg_role and arg_role:
+        usage()
+    if (arg_remove and arg_add) or (not arg_remove and not arg_add):
+        usage()
+    if arg_workers < 1:
+        usage()
+    elif arg_plan_file and not arg_plan:
+        usage()
+
+    # Profiling, Sampling ueber DCOS_CONTEXT_PROFILE_SAMPLE=FILE
+    profiler.start(arg_profile)
+
+    # Configuration Files
+    cfg_dcos = config.load(arg_cfg_dcos)
+
+    cluster_list = clusters.resolve(arg_cluster, cfg_dcos)
+
+    # Plan
+    if arg_plan:
+        latency = estimate.load_latency(arg_latency)
+        if arg_manifest:
+            entries = list(manifest.read(arg_manifest))
+        else:
+            entries = [{"gid": arg_gid, "role": arg_role, "name": arg_context_name}]
+        total = estimate.Estimate(latency)
+        for cluster in cluster_list:
+            # Die Cluster laufen parallel
+            total.join(plan_user_group(
+                remove=arg_remove,
+                add=arg_add,
+                entries=entries,
+                api_url=cfg_dcos[cluster]["url"],
+                latency=latency,
+                workers=clusters.workers(cfg_dcos, cluster, arg_workers),
+                batch=bool(arg_manifest),
+                reconcile=arg_reconcile
+            ))
+            if arg_plan_file:
+                plan_path = arg_plan_file
+                if len(cluster_list) > 1:
+                    # Ein Plan pro Cluster, die ACLs haengen von der Umgebung ab
+                    root, ext = os.path.splitext(arg_plan_file)
+                    plan_path = root + "." + cluster + ext
+                acl_plan(arg_add, entries, cfg_dcos[cluster]["url"]).dump(plan_path)
+                print("ACL Plan geschrieben: " + plan_path)
+        print("Plan fuer Cluster: " + ", ".join(cluster_list))
+        total.report()
+        sys.exit(0)
+
+    # Logging
+    if len(cluster_list) > 1:
+        log_format = '%(asctime)s %(levelname)s [%(threadName)s] : %(message)s'
+    else:
+        log_format = '%(asctime)s %(levelname)s : %(message)s'
+
+    if arg_verbose:
+        logging.basicConfig(level=logging.DEBUG, format=log_format, datefmt='%d-%b-%y %H:%M:%S')
+    else:
+        logging.getLogger('requests.packages.urllib3.connectionpool').setLevel(logging.WARN)
+        logging.basicConfig(level=logging.INFO, format=log_format, datefmt='%d-%b-%y %H:%M:%S')
+
+    # Metrics
+    if arg_metrics or arg_metrics_prom:
+        metrics.enabled = True
+        atexit.register(metrics.dump, arg_metrics, arg_metrics_prom)
+
+    # Trace
+    if arg_trace:
+        trace.enabled = True
+        atexit.register(trace.dump, arg_trace)
+
+    # Connection Pools, Netzwerk Module vor dem Start der Threads laden
+    lazy.resolve(session, dcos, manifest.yaml)
+    for cluster in cluster_list:
+        session.pool_maxsize = max(session.pool_maxsize, clusters.workers(cfg_dcos, cluster, arg_workers))
+
+    # Tasks
+    def cluster_tasks(cluster):
+        # Configuration File Variables
+        dcos_api_url = cfg_dcos[cluster]["url"]
+        dcos_api_user = cfg_dcos[cluster]["user"]
+        dcos_api_pass = cfg_dcos[cluster]["password"]
+        workers = clusters.workers(cfg_dcos, cluster, arg_workers)
+
+        logging.info("Parameter Cluster-Name: " + cluster)
+
+        if arg_manifest:
+            logging.info("Parameter Manifest: " + arg_manifest)
+            return dcos_user_group_batch(
+                remove=arg_remove,
+                add=arg_add,
+                entries=manifest.read(arg_manifest),
+                api_user=dcos_api_user,
+                api_pass=dcos_api_pass,
+                api_url=dcos_api_url,
+                workers=workers
+            )
+        else:
+            logging.info("Parameter Context-Name: " + arg_context_name)
+            logging.info("Parameter GID: " + arg_gid)
+            return dcos_user_group(
+                remove=arg_remove,
+                add=arg_add,
+                gid=arg_gid,
+                role=arg_role,
+                context_name=arg_context_name,
+                api_user=dcos_api_user,
+                api_pass=dcos_api_pass,
+                api_url=dcos_api_url,
+                workers=workers,
+                reconcile=arg_reconcile
+            )
+
+    rsp = clusters.run(cluster_list, cluster_tasks)
+
+    if not rsp:
+        logging.error("Es ist ein Fehler aufgetreten!")
+        sys.exit(1)
+    else:
+        logging.info("Erfolgreich beendet")
+        sys.exit(0)
+
+
+def dcos_user_group(remove, add, gid, role, context_name, api_user, api_pass, api_url, workers=1,
+                    reconcile=False):
+    """
+    DCOS User Gruppe anlegen oder entfernen
+
+    Args:
+        remove = User Gruppe entferen (bool)
+        add = User Gruppe hinzufuegen (bool)
+        gid = User Gruppen Name (string)
+        role = Rolle der User Gruppe (string: dev, devops)
+        context_name = Name des DCOS Context (string)
+        api_user = DCOS API User (string)
+        api_pass = DCOS API Passwort (string)
+        api_url = DCOS API URL (string)
+        workers = Anzahl paralleler ACL Requests (int)
+        reconcile = Nur fehlende Permissions vergeben (bool)
+
+    Returns:
+        True/False (bool)
+    """
+    success = True
+    with trace.span("dcos:token", "dcos"):
+        api_token = dcos.get_token(api_url, api_user, api_pass)
+    ba_env = get_ba_env(api_url)
+
+    schema_group = {
+        gid: {
+            "role": role
+        }
+    }
+
+    # API Schema ermitteln
+    schema_acl = schema.dcos_acl(context_name, ba_env, role)
+
+    if add:
+        # Gruppe anlegen
+        with trace.span("dcos:create_user_group", "dcos", gid=gid):
+            if not dcos.create_user_group(schema_group, api_url, api_token):
+                success = False
+        if reconcile:
+            # Die Gruppe kann weiteren Contexten zugeordnet sein, daher kein prune
+            with trace.span("dcos:reconcile_user_group_acl", "dcos", gid=gid, workers=workers):
+                if not dcos.reconcile_user_group_acl(schema_acl, gid, api_url, api_token, workers=workers):
+                    success = False
+        else:
+            with trace.span("dcos:create_user_group_acl", "dcos", gid=gid, workers=workers):
+                if not dcos.create_user_group_acl(schema_acl, gid, api_url, api_token, workers=workers):
+                    success = False
+    elif remove:
+        # Gruppe loeschen
+        with trace.span("dcos:delete_user_group", "dcos", gid=gid):
+            if not dcos.delete_user_group(schema_group, api_url, api_token):
+                success = False
+    else:
+        logging.error("undefined")
+
+    return success
+
+
+def dcos_user_group_batch(remove, add, entries, api_user, api_pass, api_url, workers=1):
+    """
+    Mehrere DCOS User Gruppen mehreren Contexten zuordnen oder entfernen
+
+    Alle Gruppen und Grants werden mit einem Token und parallel
+    angelegt, gemeinsame ACL Resourcen nur einmal.
+
+    Args:
+        remove = User Gruppen entferen (bool)
+        add = User Gruppen hinzufuegen (bool)
+        entries = Eintraege mit gid, role und name (iterable of dict)
+        api_user = DCOS API User (string)
+        api_pass = DCOS API Passwort (string)
+        api_url = DCOS API URL (string)
+        workers = Anzahl paralleler Requests (int)
+
+    Returns:
+        True/False (bool)
+    """
+    success = True
+    with trace.span("dcos:token", "dcos"):
+        api_token = dcos.get_token(api_url, api_user, api_pass)
+    ba_env = get_ba_env(api_url)
+
+    schema_group = {}
+    schema_acls = []
+    for entry in entries:
+        gid = entry.get("gid")
+        role = entry.get("role")
+        context_name = entry.get("name")
+        if not gid or (add and (not role or not context_name)):
+            logging.error("Manifest Eintrag unvollstaendig: " + str(entry))
+            success = False
+            continue
+        if add and role not in schema.dcos_roles(ba_env):
+            logging.error("Manifest Eintrag mit unbekannter Rolle: " + str(entry))
+            success = False
+            continue
+        schema_group[gid] = {"role": role}
+        if add:
+            schema_acls.append((gid, schema.dcos_acl(context_name, ba_env, role)))
+
+    if add:
+        # Gruppen anlegen
+        with trace.span("dcos:create_user_groups", "dcos", groups=len(schema_group)), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dcos-group") as executor:
+            futures = [executor.submit(dcos.create_user_group, {gid: schema_group[gid]}, api_url, api_token)
+                       for gid in schema_group]
+        if not all(future.result() for future in futures):
+            success = False
+        with trace.span("dcos:create_user_group_acls", "dcos", workers=workers):
+            if not dcos.create_user_group_acls(schema_acls, api_url, api_token, workers=workers):
+                success = False
+    elif remove:
+        # Gruppen loeschen
+        with trace.span("dcos:delete_user_groups", "dcos", groups=len(schema_group)), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dcos-group") as executor:
+            futures = [executor.submit(dcos.delete_user_group, {gid: schema_group[gid]}, api_url, api_token)
+                       for gid in schema_group]
+        if not all(future.result() for future in futures):
+            success = False
+
+    return success
+
+
+def plan_user_group(remove, add, entries, api_url, latency, workers=1, batch=False, reconcile=False):
+    """
+    API Calls und Dauer ohne Netzwerkzugriff abschaetzen
+
+    Mit reconcile wird angenommen, dass alle Permissions fehlen (obere
+    Grenze).
+
+    Args:
+        remove = User Gruppen entferen (bool)
+        add = User Gruppen hinzufuegen (bool)
+        entries = Eintraege mit gid, role und name (list of dict)
+        api_url = DCOS API URL (string)
+        latency = Latenz pro Endpoint (dict: siehe estimate.load_latency)
+        workers = Anzahl paralleler Requests (int)
+        batch = Gruppen parallel wie dcos_user_group_batch (bool)
+        reconcile = Nur fehlende Permissions vergeben (bool)
+
+    Returns:
+        estimate.Estimate
+    """
+    ba_env = get_ba_env(api_url)
+    entries = [entry for entry in entries if entry.get("gid")]
+    group_workers = workers if batch else 1
+
+    result = estimate.Estimate(latency).sequential(estimate.DCOS_LOGIN)
+    if add:
+        entries = _plan_entries(entries, ba_env)
+        gids = set(entry["gid"] for entry in entries)
+        result.parallel(estimate.DCOS_USER_GROUP_CREATE, len(gids), group_workers)
+        if reconcile:
+            result.sequential(estimate.DCOS_ACLS, len(entries))
+            result.sequential(estimate.DCOS_USER_GROUP_PERMISSIONS, len(entries))
+        result.acls(acl_plan(add, entries, api_url), workers)
+    elif remove:
+        gids = set(entry["gid"] for entry in entries)
+        result.parallel(estimate.DCOS_USER_GROUP_DELETE, len(gids), group_workers)
+
+    return result
+
+
+def acl_plan(add, entries, api_url):
+    """
+    ACL Operationen der User Gruppen ohne Netzwerkzugriff kompilieren
+
+    Args:
+        add = User Gruppen hinzufuegen (bool), beim Entfernen ist der Plan leer
+        entries = Eintraege mit gid, role und name (list of dict)
+        api_url = DCOS API URL (string)
+
+    Returns:
+        plan.Plan
+    """
+    if not add:
+        return plan.Plan()
+    ba_env = get_ba_env(api_url)
+    return plan.compile_acls(
+        (entry["gid"], schema.dcos_acl(entry["name"], ba_env, entry["role"]))
+        for entry in _plan_entries(entries, ba_env)
+    )
+
+
+def _plan_entries(entries, ba_env):
+    """ Unvollstaendige Eintraege und unbekannte Rollen werden nicht bearbeitet """
+    return [entry for entry in entries
+            if entry.get("gid") and entry.get("name") and entry.get("role") in schema.dcos_roles(ba_env)]
+
+
+def get_ba_env(url):
+    """
+    BA Environment ermitteln
+
+    Args:
+        url: URL (string: http://...)
+
+    Returns:
+        prod, nprod
+    """
+    if re.match(r".+[eis]dst\.[eis]baintern\.de.*", url) \
+            or re.match(r".+iirzi\.de.*", url):
+        ba_env = "nprod"
+    else:
+        ba_env = "prod"
+
+    return ba_env
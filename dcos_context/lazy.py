@@ -0,0 +1,59 @@
+import importlib
+import types
+
+
+def load(name):
+    """
+    Modul erst beim ersten Attributzugriff importieren
+
+    Damit zahlen --help, Argumentfehler und --plan nicht die Importzeit
+    von requests und yaml. Der Import beim ersten Zugriff ist threadsicher,
+    Netzwerk Module sollten trotzdem vor dem Start von Threads mit resolve
+    geladen werden, damit die Importzeit nicht in den ersten Request faellt.
+
+    Args:
+        name = Modulname, z.B. dcos_context.dcos (string)
+
+    Returns:
+        Modul (LazyModule)
+    """
+    return LazyModule(name)
+
+
+def resolve(*modules):
+    """
+    Lazy Module sofort im aktuellen Thread laden
+
+    Args:
+        modules = Module (siehe load)
+    """
+    for module in modules:
+        if isinstance(module, LazyModule):
+            module._module()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Platzhalter, der Attributzugriffe an das importierte Modul weitergibt
+    """
+
+    def __init__(self, name):
+        super(LazyModule, self).__init__(name)
+        object.__setattr__(self, "_loaded", None)
+
+    def _module(self):
+        module = object.__getattribute__(self, "_loaded")
+        if module is None:
+            # import_module ist threadsicher und liefert nur fertig geladene Module
+            module = importlib.import_module(self.__name__)
+            object.__setattr__(self, "_loaded", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._module(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._module(), attr, value)
+
+    def __dir__(self):
+        return dir(self._module())
@@ -0,0 +1,37 @@
+import json
+import dcos_context.lazy as lazy
+
+yaml = lazy.load("yaml")
+
+
+def read(path):
+    """
+    Manifest Eintraege streamen
+
+    Unterstuetzt JSON Lines (.jsonl, ein Eintrag pro Zeile) und YAML/JSON.
+    Bei YAML wird jedes Dokument (getrennt durch ---) einzeln gelesen und
+    kann ein Eintrag, eine Liste von Eintraegen oder ein Dict mit dem Key
+    contexts sein. Grosse Manifeste sollten einen Eintrag pro Zeile bzw.
+    Dokument enthalten, damit der Speicherbedarf konstant bleibt.
+
+    Args:
+        path = Manifest File (string)
+
+    Returns:
+        Eintraege (generator of dict)
+    """
+    with open(path, 'r') as manifest:
+        if path.endswith(".jsonl"):
+            for line in manifest:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        for document in yaml.safe_load_all(manifest):
+            if isinstance(document, dict) and "contexts" in document:
+                document = document["contexts"]
+            if isinstance(document, list):
+                for entry in document:
+                    yield entry
+            elif document:
+                yield document
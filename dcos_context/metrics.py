@@ -0,0 +1,241 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+# Messung aktiv (siehe --metrics/--metrics_prom)
+enabled = False
+
+# Histogramm Grenzen in Sekunden
+buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Pfad Templates, Namen und IDs werden zusammengefasst (siehe dcos_context/estimate.py)
+_TEMPLATES = [
+    (re.compile(r"/acs/api/v1/acls/[^/]+/groups/[^/]+/[^/]+$"), "/acs/api/v1/acls/{rid}/groups/{gid}/{action}"),
+    (re.compile(r"/acs/api/v1/acls/[^/]+$"), "/acs/api/v1/acls/{rid}"),
+    (re.compile(r"/acs/api/v1/groups/[^/]+/permissions$"), "/acs/api/v1/groups/{gid}/permissions"),
+    (re.compile(r"/acs/api/v1/groups/[^/]+$"), "/acs/api/v1/groups/{gid}"),
+    (re.compile(r"/service/marathon/v2/groups/.+$"), "/service/marathon/v2/groups/{id}")
+]
+
+_endpoints = {}
+_lock = threading.Lock()
+
+
+def endpoint(method, url):
+    """
+    Endpoint aus Methode und URL ermitteln
+
+    Args:
+        method = HTTP Methode (string)
+        url = URL (string)
+
+    Returns:
+        Methode und Pfad Template, z.B. PUT /acs/api/v1/acls/{rid} (string)
+    """
+    path = urlsplit(url).path
+    for pattern, template in _TEMPLATES:
+        match = pattern.search(path)
+        if match:
+            path = path[:match.start()] + template
+            break
+
+    return method.upper() + " " + path
+
+
+def record(method, url, status, seconds, sent=0, received=0, retries=0):
+    """
+    HTTP Request erfassen
+
+    Args:
+        method = HTTP Methode (string)
+        url = URL (string)
+        status = HTTP-Statuscode oder error (string)
+        seconds = Dauer inkl. Body (float)
+        sent = Gesendete Bytes (int)
+        received = Empfangene Bytes (int)
+        retries = Wiederholungen auf HTTP Ebene (int)
+    """
+    name = endpoint(method, url)
+    with _lock:
+        entry = _endpoints.get(name)
+        if entry is None:
+            entry = _endpoints[name] = {
+                "count": 0,
+                "seconds": 0.0,
+                "buckets": [0] * (len(buckets) + 1),
+                "status": {},
+                "retries": 0,
+                "bytes_sent": 0,
+                "bytes_received": 0
+            }
+        entry["count"] += 1
+        entry["seconds"] += seconds
+        entry["buckets"][_bucket(seconds)] += 1
+        entry["status"][status] = entry["status"].get(status, 0) + 1
+        entry["retries"] += retries
+        entry["bytes_sent"] += sent
+        entry["bytes_received"] += received
+
+
+def retry(name, count=1):
+    """
+    Wiederholung eines Requests erfassen, z.B. beim Readiness Polling
+
+    Args:
+        name = Endpoint (string: siehe endpoint)
+        count = Anzahl Wiederholungen (int)
+    """
+    if not enabled:
+        return
+    with _lock:
+        entry = _endpoints.get(name)
+        if entry is not None:
+            entry["retries"] += count
+
+
+def snapshot():
+    """
+    Erfasste Werte kopieren
+
+    Returns:
+        Werte pro Endpoint (dict)
+    """
+    with _lock:
+        return json.loads(json.dumps(_endpoints))
+
+
+def to_dict():
+    """
+    Erfasste Werte mit kumulierten Histogrammen und Quantilen
+
+    Returns:
+        Metriken (dict)
+    """
+    endpoints = {}
+    for name, entry in sorted(snapshot().items()):
+        cumulative = 0
+        histogram = {}
+        for le, count in zip([str(le) for le in buckets] + ["+Inf"], entry["buckets"]):
+            cumulative += count
+            histogram[le] = cumulative
+        entry["buckets"] = histogram
+        for quantile in (0.5, 0.95, 0.99):
+            entry["p" + str(int(quantile * 100))] = _quantile(histogram, entry["count"], quantile)
+        endpoints[name] = entry
+
+    return {"timestamp": int(time.time()), "endpoints": endpoints}
+
+
+def dump_json(path):
+    """
+    Metriken als JSON File schreiben (siehe auch estimate.load_latency)
+
+    Args:
+        path = File (string)
+    """
+    _write(path, json.dumps(to_dict(), indent=2, sort_keys=True) + "\n")
+
+
+def dump_prometheus(path):
+    """
+    Metriken im Format des Prometheus Textfile Collectors schreiben
+
+    Args:
+        path = File (string, Endung .prom)
+    """
+    data = to_dict()
+    prefix = "dcos_context_http_"
+    lines = [
+        "# HELP " + prefix + "request_duration_seconds HTTP Request Dauer pro Endpoint",
+        "# TYPE " + prefix + "request_duration_seconds histogram"
+    ]
+    for name, entry in data["endpoints"].items():
+        labels = _labels(name)
+        for le, count in entry["buckets"].items():
+            lines.append(prefix + "request_duration_seconds_bucket{" + labels + ',le="' + le + '"} ' + str(count))
+        lines.append(prefix + "request_duration_seconds_sum{" + labels + "} " + repr(entry["seconds"]))
+        lines.append(prefix + "request_duration_seconds_count{" + labels + "} " + str(entry["count"]))
+
+    lines += [
+        "# HELP " + prefix + "responses_total HTTP Antworten pro Endpoint und Statuscode",
+        "# TYPE " + prefix + "responses_total counter"
+    ]
+    for name, entry in data["endpoints"].items():
+        for status, count in sorted(entry["status"].items()):
+            lines.append(prefix + "responses_total{" + _labels(name) + ',status="' + status + '"} ' + str(count))
+
+    for metric, key, text in (("retries_total", "retries", "Wiederholungen pro Endpoint"),
+                              ("sent_bytes_total", "bytes_sent", "Gesendete Bytes pro Endpoint"),
+                              ("received_bytes_total", "bytes_received", "Empfangene Bytes pro Endpoint")):
+        lines.append("# HELP " + prefix + metric + " " + text)
+        lines.append("# TYPE " + prefix + metric + " counter")
+        for name, entry in data["endpoints"].items():
+            lines.append(prefix + metric + "{" + _labels(name) + "} " + str(entry[key]))
+
+    lines += [
+        "# HELP dcos_context_last_run_timestamp_seconds Zeitpunkt des letzten Laufs",
+        "# TYPE dcos_context_last_run_timestamp_seconds gauge",
+        "dcos_context_last_run_timestamp_seconds " + str(data["timestamp"])
+    ]
+    _write(path, "\n".join(lines) + "\n")
+
+
+def dump(json_path=None, prom_path=None):
+    """
+    Metriken in die angegebenen Files schreiben, z.B. per atexit
+
+    Args:
+        json_path = JSON File (string)
+        prom_path = Prometheus Textfile (string)
+    """
+    if json_path:
+        dump_json(json_path)
+    if prom_path:
+        dump_prometheus(prom_path)
+
+
+def reset():
+    """
+    Erfasste Werte loeschen
+    """
+    with _lock:
+        _endpoints.clear()
+
+
+def _bucket(seconds):
+    """ Index des Histogramm Buckets """
+    for index, le in enumerate(buckets):
+        if seconds <= le:
+            return index
+    return len(buckets)
+
+
+def _quantile(histogram, count, quantile):
+    """ Quantil als obere Grenze des Buckets (None fuer +Inf) """
+    if not count:
+        return None
+    for le, cumulative in histogram.items():
+        if cumulative >= quantile * count:
+            return None if le == "+Inf" else float(le)
+    return None
+
+
+def _labels(name):
+    """ Prometheus Labels fuer einen Endpoint """
+    method, path = name.split(" ", 1)
+    path = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return 'method="' + method + '",endpoint="' + path + '"'
+
+
+def _write(path, content):
+    """ File atomar schreiben, der Textfile Collector liest sonst halbe Files """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".metrics")
+    with os.fdopen(fd, "w") as metrics_file:
+        metrics_file.write(content)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
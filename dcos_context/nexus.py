@@ -0,0 +1,806 @@
+import string
+import logging
+import random
+import itertools
+import threading
+import time
+import dcos_context.schema as schema
+import dcos_context.session as session
+import dcos_context.metrics as metrics
+import dcos_context.trace as trace
+
+# Debug
+debug = False
+
+# Readiness Polling (Sekunden)
+poll_initial = 0.05
+poll_max = 1.0
+poll_timeout = 10.0
+
+# ExtDirect Transaction IDs
+_tid = itertools.count(1)
+_tid_lock = threading.Lock()
+
+
+def next_tid():
+    """
+    Eindeutige ExtDirect Transaction ID vergeben
+
+    Returns:
+        Transaction ID (int)
+    """
+    with _tid_lock:
+        return next(_tid)
+
+
+def post_json(url, user, password, data):
+    """
+    HTTP Post Request
+
+    Args:
+        url = API URL (string)
+        user = API Username (string)
+        password = API Password (string)
+        data = Native API Call (dict)
+
+    Returns:
+        ok/failed (string)
+    """
+    api_url = url + "/service/extdirect"
+    auth_values = (user, password)
+    response = session.get(api_url).post(api_url, json=data, auth=auth_values)
+    response_output = response.json()
+    response_success = response_output["result"]["success"]
+
+    if response_success:
+        return "ok"
+    else:
+        return "failed"
+
+
+def post_batch(url, user, password, data):
+    """
+    Mehrere ExtDirect Calls in einem HTTP Post Request senden
+
+    Nexus arbeitet die Calls eines Batch in der uebergebenen Reihenfolge
+    ab, die Ergebnisse werden ueber die tid den Calls zugeordnet.
+
+    Args:
+        url = API URL (string)
+        user = API Username (string)
+        password = API Password (string)
+        data = Native API Calls mit eindeutiger tid (list)
+
+    Returns:
+        ok/failed pro Call in der Reihenfolge von data (list)
+    """
+    if not data:
+        return []
+
+    api_url = url + "/service/extdirect"
+    auth_values = (user, password)
+    response = session.get(api_url).post(api_url, json=data, auth=auth_values)
+    response_output = response.json()
+    if isinstance(response_output, dict):
+        response_output = [response_output]
+
+    results = {}
+    for rsp in response_output:
+        rsp_result = rsp.get("result") or {}
+        results[rsp.get("tid")] = "ok" if rsp_result.get("success") else "failed"
+
+    return [results.get(api_call["tid"], "failed") for api_call in data]
+
+
+def read_items(action, method, user, password, url):
+    """
+    Vorhandene Nexus Objekte mit einem Listing Call lesen
+
+    Args:
+        action = ExtDirect Action, z.B. coreui_Role (string)
+        method = ExtDirect Methode, z.B. read (string)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        Objekte (list) oder None bei Fehler
+    """
+    api_call = {
+        "action": action,
+        "method": method,
+        "data": None,
+        "type": "rpc",
+        "tid": next_tid()
+    }
+    api_url = url + "/service/extdirect"
+    response = session.get(api_url).post(api_url, json=api_call, auth=(user, password))
+    response_result = response.json().get("result") or {}
+    if not response_result.get("success"):
+        return None
+
+    return response_result.get("data") or []
+
+
+def read_names(action, method, user, password, url, key="id"):
+    """
+    Namen vorhandener Nexus Objekte lesen
+
+    Args:
+        action = ExtDirect Action, z.B. coreui_Role (string)
+        method = ExtDirect Methode, z.B. read (string)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+        key = Attribut mit dem Objektnamen (string)
+
+    Returns:
+        Objektnamen (set)
+    """
+    items = read_items(action, method, user, password, url) or []
+    return set(item[key] for item in items)
+
+
+def wait_for(check, msg):
+    """
+    Mit exponentiellem Backoff warten bis check() erfuellt ist
+
+    Args:
+        check = Funktion ohne Argumente, liefert True/False (function)
+        msg = Beschreibung fuer das Logging (string)
+
+    Returns:
+        True/False
+    """
+    delay = poll_initial
+    deadline = time.monotonic() + poll_timeout
+    while not check():
+        if time.monotonic() + delay > deadline:
+            logging.warning("NEXUS Timeout beim Warten auf " + msg)
+            return False
+        logging.debug("NEXUS Warte auf " + msg)
+        metrics.retry(metrics.endpoint("POST", "/service/extdirect"))
+        with trace.span("nexus:sleep", "nexus", wait=msg):
+            time.sleep(delay)
+        delay = min(delay * 2, poll_max)
+
+    return True
+
+
+def wait_for_repos(param, user, password, url):
+    """
+    Warten bis alle Repositories (und damit ihre Privileges) sichtbar sind
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    repos = set(param)
+    return wait_for(
+        lambda: repos <= read_names("coreui_Repository", "readReferences", user, password, url, key="name"),
+        "Repositories " + ", ".join(sorted(repos))
+    )
+
+
+def wait_for_roles(param, user, password, url):
+    """
+    Warten bis alle Rollen sichtbar sind
+
+    Args:
+        param = Rollen Namen (list oder dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    roles = set(param)
+    return wait_for(
+        lambda: roles <= read_names("coreui_Role", "read", user, password, url),
+        "Rollen " + ", ".join(sorted(roles))
+    )
+
+
+def repo_create_call(repo_name, repo):
+    """
+    ExtDirect Call zum Anlegen eines Repository
+
+    Args:
+        repo_name = Repository Name (string)
+        repo = Repository Schema siehe schema.nexus (dict)
+
+    Returns:
+        Native API Call (dict)
+    """
+    repo_type = repo["type"]
+    if repo_type == "docker":
+        # Docker repository
+        repo_port = repo["port"]
+
+        api_call = {
+            "action": "coreui_Repository",
+            "method": "create",
+            "data": [
+                {
+                    "attributes": {
+                        "docker": {
+                            "httpsPort": repo_port,
+                            "forceBasicAuth": "true",
+                            "v1Enabled": "true"
+                        },
+                        "storage": {
+                            "blobStoreName": "default",
+                            "strictContentTypeValidation": "true",
+                            "writePolicy": "ALLOW"
+                        },
+                        "cleanup": {
+                            "policyName": "None"
+                        }
+                    },
+                    "name": repo_name,
+                    "format": "",
+                    "type": "",
+                    "url": "",
+                    "online": "true",
+                    "undefined": [
+                        "false",
+                        "true"
+                    ],
+                    "recipe": "docker-hosted"
+                }
+            ],
+            "type": "rpc",
+            "tid": next_tid()
+        }
+    elif repo_type == "raw":
+        # Raw Repository
+        api_call = {
+            "action": "coreui_Repository",
+            "method": "create",
+            "data": [
+                {
+                    "attributes": {
+                        "storage": {
+                            "blobStoreName": "default",
+                            "strictContentTypeValidation": "false",
+                            "writePolicy": "ALLOW"
+                        },
+                        "cleanup": {
+                            "policyName": "None"
+                        }
+                    },
+                    "name": repo_name,
+                    "format": "",
+                    "type": "",
+                    "url": "",
+                    "online": "true",
+                    "recipe": "raw-hosted"
+                }
+            ],
+            "type": "rpc",
+            "tid": next_tid()
+        }
+
+    else:
+        raise Exception('Nexus Repository type unkown')
+
+    return api_call
+
+
+def repo_delete_call(repo_name):
+    """
+    ExtDirect Call zum Loeschen eines Repository
+
+    Args:
+        repo_name = Repository Name (string)
+
+    Returns:
+        Native API Call (dict)
+    """
+    return {
+        "action": "coreui_Repository",
+        "method": "remove",
+        "data": [repo_name],
+        "type": "rpc",
+        "tid": next_tid()
+    }
+
+
+def role_create_call(role_name, role):
+    """
+    ExtDirect Call zum Anlegen einer Rolle
+
+    Args:
+        role_name = Rollen Name (string)
+        role = Rollen Schema siehe schema.nexus (dict)
+
+    Returns:
+        Native API Call (dict)
+    """
+    return {
+        "action": "coreui_Role",
+        "method": "create",
+        "data": [
+            {
+                "version": "",
+                "source": "default",
+                "id": role_name,
+                "name": role_name,
+                "description": role_name,
+                "privileges": role["privileges"],
+                "roles": role["contained_roles"]
+            }
+        ],
+        "type": "rpc",
+        "tid": next_tid()
+    }
+
+
+def role_delete_call(role_name):
+    """
+    ExtDirect Call zum Loeschen einer Rolle
+
+    Args:
+        role_name = Rollen Name (string)
+
+    Returns:
+        Native API Call (dict)
+    """
+    return {
+        "action": "coreui_Role",
+        "method": "remove",
+        "data": [role_name],
+        "type": "rpc",
+        "tid": next_tid()
+    }
+
+
+def user_create_call(user_name, nexus_user):
+    """
+    ExtDirect Call zum Anlegen eines Users mit zufaelligem Passwort
+
+    Args:
+        user_name = User Name (string)
+        nexus_user = User Schema siehe schema.nexus (dict)
+
+    Returns:
+        Native API Call (dict)
+    """
+    allchar = string.ascii_letters + string.digits
+    user_pass = "".join(random.choice(allchar) for x in range(random.randint(12, 16)))
+
+    return {
+        "action": "coreui_User",
+        "method": "create",
+        "data": [
+            {
+                "userId": user_name,
+                "version": "",
+                "firstName": user_name,
+                "lastName": user_name,
+                "email": user_name + "@no.email",
+                "status": "active",
+                "roles": nexus_user["role"],
+                "password": user_pass
+            }
+        ],
+        "type": "rpc",
+        "tid": next_tid()
+    }
+
+
+def user_delete_call(user_name):
+    """
+    ExtDirect Call zum Loeschen eines Users
+
+    Args:
+        user_name = User Name (string)
+
+    Returns:
+        Native API Call (dict)
+    """
+    return {
+        "action": "coreui_User",
+        "method": "remove",
+        "data": [user_name, "default"],
+        "type": "rpc",
+        "tid": next_tid()
+    }
+
+
+def create_repo(param, user, password, url):
+    """
+    Nexus Repository anlegen
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    for repo_name in param:
+        repo_type = param[repo_name]["type"]
+        api_call = repo_create_call(repo_name, param[repo_name])
+
+        msg = "NEXUS Anlegen " + repo_type + " Repository " + repo_name
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        logging.info(msg)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def delete_repo(param, user, password, url):
+    """
+    Nexus Repository loeschen
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    for repo_name in param:
+        repo_type = param[repo_name]["type"]
+        api_call = repo_delete_call(repo_name)
+
+        msg = "NEXUS Loesche " + repo_type + " Repository " + repo_name
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        logging.info(msg)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def create_role(param, user, password, url):
+    """
+    Nexus Rolle anlegen
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    created = []
+    for role_name in sorted(param):
+        api_call = role_create_call(role_name, param[role_name])
+
+        # Nur auf Rollen warten, die in diesem Lauf angelegt wurden
+        contained = [role for role in param[role_name]["contained_roles"] if role in created]
+        if contained:
+            wait_for_roles(param=contained, user=user, password=password, url=url)
+
+        msg = "NEXUS Anlegen Role " + role_name
+        logging.info(msg)
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+        else:
+            created.append(role_name)
+
+    return success
+
+
+def delete_role(param, user, password, url):
+    """
+    Nexus Repository loeschen
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    for role_name in sorted(param):
+        api_call = role_delete_call(role_name)
+
+        msg = "NEXUS Loesche Role " + role_name
+        logging.info(msg)
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def create_user(users, user, password, url):
+    """
+    Nexus User anlegen
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    for user_name in users:
+        api_call = user_create_call(user_name, users[user_name])
+
+        msg = "NEXUS Anlegen User " + user_name
+        logging.info(msg)
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def delete_user(users, user, password, url):
+    """
+    Nexus User loeschen
+
+    Args:
+        users = Nexus User (array)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    for user_name in users:
+        api_call = user_delete_call(user_name)
+
+        msg = "NEXUS Loesche User " + user_name
+        logging.info(msg)
+        result = post_json(url=url, user=user, password=password, data=api_call)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def create_batch(params, user, password, url):
+    """
+    Nexus Repositories, Rollen und User mehrerer Contexte mit einem
+    Request pro Abhaengigkeitsstufe anlegen
+
+    Die Privileges der Rollen verweisen auf die Repositories, Rollen auf
+    enthaltene Rollen und User auf Rollen. Wie beim einzelnen Anlegen
+    wird vor der naechsten Stufe gewartet, bis die Objekte sichtbar sind.
+    Nach einer fehlgeschlagenen Stufe wird abgebrochen.
+
+    Args:
+        params = Schemas siehe schema.nexus (list)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    repos = {}
+    roles = {}
+    users = {}
+    for param in params:
+        repos.update(param["repo"])
+        roles.update(param["role"])
+        users.update(param["user"])
+
+    if repos:
+        calls = [("NEXUS Anlegen " + repos[repo_name]["type"] + " Repository " + repo_name,
+                  repo_create_call(repo_name, repos[repo_name])) for repo_name in repos]
+        if not run_batch(calls=calls, user=user, password=password, url=url):
+            return False
+        if not wait_for_repos(param=repos, user=user, password=password, url=url):
+            return False
+
+    for level in schema.nexus_role_levels(roles):
+        calls = [("NEXUS Anlegen Role " + role_name, role_create_call(role_name, roles[role_name]))
+                 for role_name in level]
+        if not run_batch(calls=calls, user=user, password=password, url=url):
+            return False
+        if not wait_for_roles(param=level, user=user, password=password, url=url):
+            return False
+
+    if not users:
+        return True
+    calls = [("NEXUS Anlegen User " + user_name, user_create_call(user_name, users[user_name]))
+             for user_name in users]
+    return run_batch(calls=calls, user=user, password=password, url=url)
+
+
+def delete_batch(params, user, password, url):
+    """
+    Nexus Repositories, Rollen und User mehrerer Contexte in einem
+    Request loeschen
+
+    Args:
+        params = Schemas siehe schema.nexus (list)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    calls = []
+    for param in params:
+        for repo_name in param["repo"]:
+            msg = "NEXUS Loesche " + param["repo"][repo_name]["type"] + " Repository " + repo_name
+            calls.append((msg, repo_delete_call(repo_name)))
+    for param in params:
+        for role_name in sorted(param["role"]):
+            calls.append(("NEXUS Loesche Role " + role_name, role_delete_call(role_name)))
+    for param in params:
+        for user_name in param["user"]:
+            calls.append(("NEXUS Loesche User " + user_name, user_delete_call(user_name)))
+
+    return run_batch(calls=calls, user=user, password=password, url=url)
+
+
+def run_batch(calls, user, password, url):
+    """
+    ExtDirect Calls als Batch senden und Ergebnisse pro Call auswerten
+
+    Args:
+        calls = Tupel aus Log Meldung und Native API Call (list)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    success = True
+    results = post_batch(url=url, user=user, password=password, data=[api_call for msg, api_call in calls])
+    for (msg, api_call), result in zip(calls, results):
+        logging.info(msg)
+        if result != "ok":
+            logging.error(msg)
+            success = False
+
+    return success
+
+
+def reconcile(param, user, password, url, create=True):
+    """
+    Nexus Repositories, Rollen und User mit dem Schema abgleichen
+
+    Liest Repositories, Rollen und User mit je einem Listing Call und
+    fuehrt nur die noetigen create/update (create=True) bzw. remove
+    (create=False) Calls aus.
+
+    Args:
+        param = Schema siehe schema.nexus (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+        create = Anlegen/Aktualisieren oder Loeschen (bool)
+
+    Returns:
+        True/False
+    """
+    repos = read_items("coreui_Repository", "read", user, password, url)
+    roles = read_items("coreui_Role", "read", user, password, url)
+    users = read_items("coreui_User", "read", user, password, url)
+    if repos is None or roles is None or users is None:
+        logging.error("NEXUS Lesen der Repositories, Rollen und User auf " + url + " fehlgeschlagen")
+        return False
+
+    repos = dict((repo["name"], repo) for repo in repos)
+    roles = dict((role["id"], role) for role in roles)
+    users = dict((nexus_user["userId"], nexus_user) for nexus_user in users)
+
+    success = True
+    if not create:
+        if not delete_repo(dict((name, spec) for name, spec in param["repo"].items() if name in repos),
+                           user, password, url):
+            success = False
+        if not delete_role(dict((name, spec) for name, spec in param["role"].items() if name in roles),
+                           user, password, url):
+            success = False
+        if not delete_user([name for name in param["user"] if name in users], user, password, url):
+            success = False
+        return success
+
+    # Repositories
+    new_repos = dict((name, spec) for name, spec in param["repo"].items() if name not in repos)
+    if new_repos:
+        # Die Rollen verweisen auf die Repositories, nach einem Fehler wird abgebrochen
+        if not create_repo(new_repos, user, password, url) or not wait_for_repos(new_repos, user, password, url):
+            return False
+    for repo_name, repo in param["repo"].items():
+        # Ports kommen als String (--port_nexus) oder int (Manifest, Nexus API)
+        if repo_name in repos and repo["type"] == "docker" and \
+                str((repos[repo_name].get("attributes") or {}).get("docker", {}).get("httpsPort")) != str(repo["port"]):
+            api_call = repo_create_call(repo_name, repo)
+            api_call["method"] = "update"
+            if not _post_logged("NEXUS Aktualisiere docker Repository " + repo_name, api_call,
+                                user, password, url):
+                success = False
+
+    # Rollen
+    new_roles = dict((name, spec) for name, spec in param["role"].items() if name not in roles)
+    if new_roles:
+        if not create_role(new_roles, user, password, url) or not wait_for_roles(new_roles, user, password, url):
+            return False
+    for role_name, role in sorted(param["role"].items()):
+        current = roles.get(role_name)
+        if current is not None and (set(current.get("privileges") or []) != set(role["privileges"]) or
+                                    set(current.get("roles") or []) != set(role["contained_roles"])):
+            api_call = role_create_call(role_name, role)
+            api_call["method"] = "update"
+            api_call["data"][0]["version"] = current.get("version", "")
+            if not _post_logged("NEXUS Aktualisiere Role " + role_name, api_call, user, password, url):
+                success = False
+
+    # User
+    new_users = dict((name, spec) for name, spec in param["user"].items() if name not in users)
+    if new_users:
+        if not create_user(new_users, user, password, url):
+            success = False
+    for user_name, nexus_user in param["user"].items():
+        current = users.get(user_name)
+        if current is not None and set(current.get("roles") or []) != set(nexus_user["role"]):
+            data = dict(current)
+            data["roles"] = nexus_user["role"]
+            api_call = {
+                "action": "coreui_User",
+                "method": "update",
+                "data": [data],
+                "type": "rpc",
+                "tid": next_tid()
+            }
+            if not _post_logged("NEXUS Aktualisiere User " + user_name, api_call, user, password, url):
+                success = False
+
+    return success
+
+
+def _post_logged(msg, api_call, user, password, url):
+    """
+    Einzelnen ExtDirect Call senden und Ergebnis loggen
+
+    Args:
+        msg = Log Meldung (string)
+        api_call = Native API Call (dict)
+        user = API Username (string)
+        password = API Password (string)
+        url = API URL (string)
+
+    Returns:
+        True/False
+    """
+    logging.info(msg)
+    if post_json(url=url, user=user, password=password, data=api_call) != "ok":
+        logging.error(msg)
+        return False
+
+    return True
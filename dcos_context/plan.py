@@ -0,0 +1,105 @@
+import json
+
+import dcos_context.schema as schema
+
+from collections import namedtuple
+
+# ACL Resource anlegen: PUT /acs/api/v1/acls<path>
+Resource = namedtuple("Resource", ["rid", "path"])
+
+# ACL Action vergeben: PUT /acs/api/v1/acls<path>
+Grant = namedtuple("Grant", ["rid", "gid", "action", "path"])
+
+
+class Plan(object):
+    """
+    Flache, deduplizierte Liste der DCOS ACL Operationen
+
+    Zuerst werden alle Resourcen angelegt, danach die Grants. Die URL
+    Pfade sind bereits maskiert.
+    """
+    __slots__ = ("resources", "grants")
+
+    def __init__(self, resources=None, grants=None):
+        self.resources = resources or []
+        self.grants = grants or []
+
+    def __len__(self):
+        return len(self.resources) + len(self.grants)
+
+    def grants_by_rid(self):
+        """
+        Grants nach Resource ID gruppieren
+
+        Returns:
+            Grants pro Resource ID (dict: rid -> list)
+        """
+        grants = {}
+        for grant in self.grants:
+            grants.setdefault(grant.rid, []).append(grant)
+        return grants
+
+    def to_dict(self):
+        """
+        Plan serialisieren
+
+        Returns:
+            Plan (dict)
+        """
+        return {
+            "resources": [resource._asdict() for resource in self.resources],
+            "grants": [grant._asdict() for grant in self.grants]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Plan deserialisieren
+
+        Args:
+            data = Plan (dict: siehe to_dict)
+
+        Returns:
+            Plan
+        """
+        return cls(
+            [Resource(**resource) for resource in data.get("resources", [])],
+            [Grant(**grant) for grant in data.get("grants", [])]
+        )
+
+    def dump(self, path):
+        """
+        Plan als JSON File schreiben
+
+        Args:
+            path = File (string)
+        """
+        with open(path, 'w') as plan_file:
+            json.dump(self.to_dict(), plan_file, indent=2)
+
+
+def compile_acls(acls):
+    """
+    ACL Schemas mehrerer User Gruppen in einen Plan uebersetzen
+
+    Gemeinsam genutzte Resourcen und doppelte Grants werden nur einmal
+    aufgenommen, jede Resource ID wird nur einmal maskiert.
+
+    Args:
+        acls = Tupel aus User Gruppen Name und ACL Schema (iterable)
+
+    Returns:
+        Plan
+    """
+    resources = {}
+    grants = {}
+    for gid, acl in acls:
+        for rid, actions in acl.items():
+            resource = resources.get(rid)
+            if resource is None:
+                resource = resources[rid] = Resource(rid, "/" + schema.encode_rid(rid))
+            for action in actions:
+                if (rid, gid, action) not in grants:
+                    grants[(rid, gid, action)] = Grant(rid, gid, action, resource.path + "/groups/" + gid + "/" + action)
+
+    return Plan(list(resources.values()), list(grants.values()))
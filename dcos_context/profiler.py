@@ -0,0 +1,197 @@
+import atexit
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+
+# Sampling Profiler ueber Umgebungsvariablen, Ausgabe File bzw. Intervall in Sekunden
+SAMPLE_ENV = "DCOS_CONTEXT_PROFILE_SAMPLE"
+INTERVAL_ENV = "DCOS_CONTEXT_PROFILE_INTERVAL"
+
+# Zuordnung der Samples, geprueft wird vom innersten Frame nach aussen
+_NETWORK = ("socket.py", "ssl.py", os.path.join("http", "client.py"), os.path.join("urllib3", ""),
+            "selectors.py")
+_IDLE = (("threading.py", ("wait", "acquire", "join", "_wait_for_tstate_lock")),
+         (os.path.join("concurrent", "futures", ""), ("wait", "result", "as_completed", "_worker")),
+         ("queue.py", ("get",)))
+_MODULES = ("dcos", "nexus", "schema")
+
+_profiles = []
+_lock = threading.Lock()
+
+
+def start(profile_path=None):
+    """
+    Profiling fuer den Lauf starten, die Ergebnisse werden bei Exit geschrieben
+
+    Args:
+        profile_path = cProfile/pstats File (--profile), None = kein cProfile (string)
+    """
+    if profile_path:
+        profile = cProfile.Profile()
+        _profiles.append(profile)
+        # Bis Python 3.11 bekommen Threads (Pools, Cluster) einen eigenen Profiler,
+        # ab 3.12 (sys.monitoring) erfasst ein Profiler bereits alle Threads
+        if sys.version_info < (3, 12):
+            threading.setprofile(_thread_profile)
+        profile.enable()
+        atexit.register(dump_profile, profile_path)
+
+    sample_path = os.environ.get(SAMPLE_ENV)
+    if sample_path:
+        sampler = Sampler(float(os.environ.get(INTERVAL_ENV) or 0.005))
+        sampler.start()
+        atexit.register(sampler.dump, sample_path)
+
+
+def dump_profile(path):
+    """
+    cProfile Daten aller Threads als pstats File schreiben
+
+    Endet das File auf .txt, wird der pstats Report (nach kumulierter
+    Zeit sortiert) als Text geschrieben.
+
+    Args:
+        path = File (string)
+    """
+    threading.setprofile(None)
+    with _lock:
+        profiles = list(_profiles)
+    for profile in profiles:
+        profile.disable()
+
+    stats = pstats.Stats(profiles[0])
+    for profile in profiles[1:]:
+        try:
+            stats.add(profile)
+        except TypeError:
+            # Thread ohne erfasste Aufrufe
+            pass
+
+    if path.endswith(".txt"):
+        with open(path, 'w') as profile_file:
+            stats.stream = profile_file
+            stats.sort_stats("cumulative").print_stats(50)
+    else:
+        stats.dump_stats(path)
+
+
+def _thread_profile(frame, event, arg):
+    """ Profiler fuer einen neuen Thread anlegen (siehe threading.setprofile) """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Anderes Profiling Tool aktiv, der Thread laeuft ohne eigenen Profiler
+        sys.setprofile(None)
+        return
+    with _lock:
+        _profiles.append(profile)
+
+
+class Sampler(threading.Thread):
+    """
+    Sampling Profiler, ordnet die Stacks aller Threads periodisch
+    dcos_context/dcos, dcos_context/nexus, dcos_context/schema, Netzwerk, Warten oder Sonstiges zu
+    """
+
+    def __init__(self, interval):
+        super(Sampler, self).__init__(name="profiler", daemon=True)
+        self.interval = interval
+        self.samples = 0
+        self.categories = {}
+        self.functions = {}
+        self.started = time.monotonic()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            own = threading.get_ident()
+            frames = sys._current_frames()
+            with _lock:
+                self.samples += 1
+                for ident, frame in frames.items():
+                    if ident == own:
+                        continue
+                    category = classify(frame)
+                    self.categories[category] = self.categories.get(category, 0) + 1
+                    function = (category, os.path.basename(frame.f_code.co_filename) + ":" + frame.f_code.co_name)
+                    self.functions[function] = self.functions.get(function, 0) + 1
+
+    def to_dict(self):
+        """
+        Samples pro Kategorie und haeufigste Funktionen
+
+        Returns:
+            Ergebnis (dict)
+        """
+        with _lock:
+            categories = dict(self.categories)
+            functions = dict(self.functions)
+            samples = self.samples
+        busy = sum(count for category, count in categories.items() if category != "idle") or 1
+
+        result = {
+            "interval": self.interval,
+            "samples": samples,
+            "duration": round(time.monotonic() - self.started, 3),
+            "categories": {}
+        }
+        for category, count in sorted(categories.items(), key=lambda item: -item[1]):
+            top = sorted(((name, hits) for (cat, name), hits in functions.items() if cat == category),
+                         key=lambda item: -item[1])[:10]
+            result["categories"][category] = {
+                "samples": count,
+                "seconds": round(count * self.interval, 3),
+                "share": round(float(count) / busy, 4) if category != "idle" else None,
+                "top": dict(top)
+            }
+
+        return result
+
+    def dump(self, path):
+        """
+        Sampler stoppen und Ergebnis als JSON File schreiben
+
+        Args:
+            path = File (string)
+        """
+        self._stop_event.set()
+        self.join(1)
+        with open(path, 'w') as sample_file:
+            json.dump(self.to_dict(), sample_file, indent=2)
+
+
+def classify(frame):
+    """
+    Stack eines Threads einer Kategorie zuordnen
+
+    Warten (Locks, Futures) wird am innersten Frame erkannt, sonst zaehlt
+    der innerste Frame aus dem HTTP Stack (Netzwerk) oder aus dcos_context/dcos,
+    dcos_context/nexus bzw. dcos_context/schema.
+
+    Args:
+        frame = Innerster Frame des Threads
+
+    Returns:
+        network, idle, dcos_context/dcos, dcos_context/nexus, dcos_context/schema oder other (string)
+    """
+    filename = frame.f_code.co_filename
+    for part, functions in _IDLE:
+        if part in filename and frame.f_code.co_name in functions:
+            return "idle"
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if any(part in filename for part in _NETWORK):
+            return "network"
+        if os.path.basename(os.path.dirname(filename)) == "dcos_context":
+            module = os.path.splitext(os.path.basename(filename))[0]
+            if module in _MODULES:
+                return "dcos_context/" + module
+        frame = frame.f_back
+
+    return "other"
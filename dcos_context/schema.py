@@ -0,0 +1,420 @@
+import functools
+
+from collections.abc import Mapping
+
+#
+# Params
+#
+
+# Platzhalter fuer den Context Namen in den Templates
+PLACEHOLDER = "{name}"
+
+# Anzahl gecachter Contexte pro Schema Teil
+CACHE_SIZE = 4096
+
+# User Group ACL Templates pro Umgebung und Rolle
+_DCOS_ACL = {
+    "prod": {
+        "dev": {
+            "dcos:adminrouter:ops:historyservice": ["full"],
+            "dcos:adminrouter:ops:mesos": ["full"],
+            "dcos:adminrouter:ops:networking": ["full"],
+            "dcos:adminrouter:ops:slave": ["full"],
+            "dcos:adminrouter:ops:system-health": ["full"],
+            "dcos:adminrouter:service:marathon": ["full"],
+            "dcos:adminrouter:service:metronome": ["full"],
+            "dcos:mesos:agent:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:framework:role:slave_public": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:task:app_id:/{name}": ["read"],
+            "dcos:mesos:master:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:master:framework:role:slave_public": ["read"],
+            "dcos:mesos:master:task:app_id:/{name}": ["read"],
+            "dcos:secrets:default:/{name}": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}": ["read"]
+        },
+        "devops": {
+            "dcos:adminrouter:ops:historyservice": ["full"],
+            "dcos:adminrouter:ops:mesos": ["full"],
+            "dcos:adminrouter:ops:metadata": ["full"],
+            "dcos:adminrouter:ops:networking": ["full"],
+            "dcos:adminrouter:package": ["full"],
+            "dcos:adminrouter:ops:slave": ["full"],
+            "dcos:adminrouter:ops:system-health": ["full"],
+            "dcos:adminrouter:secrets": ["full"],
+            "dcos:adminrouter:service:marathon": ["full"],
+            "dcos:adminrouter:service:metronome": ["full"],
+            "dcos:mesos:agent:endpoint:path:/monitor/statistics": ["read"],
+            "dcos:mesos:agent:executor:app_id:{name}": ["read"],
+            "dcos:mesos:agent:flags": ["read"],
+            "dcos:mesos:agent:framework:role:*": ["read"],
+            "dcos:mesos:agent:framework:role:slave_public": ["read"],
+            "dcos:mesos:agent:log": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:task:app_id:/{name}": ["read"],
+            "dcos:mesos:master:endpoint:path": ["read"],
+            "dcos:mesos:master:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:master:framework:role:*": ["read"],
+            "dcos:mesos:master:framework:role:slave_public": ["read"],
+            "dcos:mesos:master:log": ["read"],
+            "dcos:mesos:master:task:app_id:/infosysbub": ["read"],
+            "dcos:secrets:list:default:/": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/preprod": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/prod": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}infosysbub/preprod": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/prod": ["create", "delete", "read", "update"]
+        }
+    },
+    "nprod": {
+        "dev": {
+            "dcos:adminrouter:ops:historyservice": ["full"],
+            "dcos:adminrouter:ops:mesos": ["full"],
+            "dcos:adminrouter:ops:metadata": ["full"],
+            "dcos:adminrouter:ops:networking": ["full"],
+            "dcos:adminrouter:ops:slave": ["full"],
+            "dcos:adminrouter:ops:system-health": ["full"],
+            "dcos:adminrouter:service:marathon": ["full"],
+            "dcos:adminrouter:service:metronome": ["full"],
+            "dcos:mesos:agent:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:framework:role:slave_public": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/dev": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/lpt": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/pen": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/rc": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/scrub": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}/uat": ["read"],
+            "dcos:mesos:agent:task:app_id:/{name}": ["read"],
+            "dcos:mesos:master:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:master:framework:role:slave_public": ["read"],
+            "dcos:mesos:master:task:app_id:/{name}": ["read"],
+            "dcos:secrets:default:/{name}/dev": ["create", "delete", "read", "update"],
+            "dcos:secrets:default:/{name}/scrub": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/dev": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/lpt": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}/pen": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}/rc": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}/scrub": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/uat": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/dev": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/lpt": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/pen": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/rc": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/scrub": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/uat": ["read"]
+        },
+        "devops": {
+            "dcos:adminrouter:ops:historyservice": ["full"],
+            "dcos:adminrouter:ops:mesos": ["full"],
+            "dcos:adminrouter:ops:metadata": ["full"],
+            "dcos:adminrouter:ops:networking": ["full"],
+            "dcos:adminrouter:package": ["full"],
+            "dcos:adminrouter:ops:slave": ["full"],
+            "dcos:adminrouter:ops:system-health": ["full"],
+            "dcos:adminrouter:secrets": ["full"],
+            "dcos:adminrouter:service:marathon": ["full"],
+            "dcos:adminrouter:service:metronome": ["full"],
+            "dcos:mesos:agent:endpoint:path:/monitor/statistics": ["read"],
+            "dcos:mesos:agent:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:flags": ["read"],
+            "dcos:mesos:agent:framework:role:*": ["read"],
+            "dcos:mesos:agent:framework:role:slave_public": ["read"],
+            "dcos:mesos:agent:log": ["read"],
+            "dcos:mesos:agent:sandbox:app_id:/{name}": ["read"],
+            "dcos:mesos:agent:task:app_id:/{name}": ["read"],
+            "dcos:mesos:master:endpoint:path": ["read"],
+            "dcos:mesos:master:executor:app_id:/{name}": ["read"],
+            "dcos:mesos:master:framework:role:*": ["read"],
+            "dcos:mesos:master:framework:role:slave_public": ["read"],
+            "dcos:mesos:master:log": ["read"],
+            "dcos:mesos:master:task:app_id:/{name}": ["read"],
+            "dcos:secrets:list:default:/": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}": ["read"],
+            "dcos:service:metronome:metronome:jobs:/{name}/uat": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/scrub": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/rc": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/pen": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/lpt": ["create", "delete", "read", "update"],
+            "dcos:service:metronome:metronome:jobs:/{name}/dev": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}": ["read"],
+            "dcos:service:marathon:marathon:services:/{name}/uat": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/scrub": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/rc": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/pen": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/lpt": ["create", "delete", "read", "update"],
+            "dcos:service:marathon:marathon:services:/{name}/dev": ["create", "delete", "read", "update"]
+        }
+    }
+}
+
+
+def _compile(template):
+    """
+    ACL Template in Teilstrings und Actions zerlegen
+
+    Args:
+        template = ACL Template (dict: rid -> actions)
+
+    Returns:
+        Tupel aus (Teilstrings der rid, Actions) (tuple)
+    """
+    return tuple((tuple(rid.split(PLACEHOLDER)), tuple(actions)) for rid, actions in template.items())
+
+
+# Einmal kompilierte ACL Templates
+_DCOS_ACL_COMPILED = dict(
+    (env, dict((role, _compile(template)) for role, template in roles.items()))
+    for env, roles in _DCOS_ACL.items()
+)
+
+
+def nexus(name, docker_port):
+    """
+    Schema fuer Nexus
+
+    Args:
+        name = Context Name
+        docker_port = Portnummer fuer das Nexus Docker Repo
+
+    Returns:
+        API Schema (dict)
+    """
+    schema = {
+        # User Schema
+        "user": {
+            name + "_dev": {
+                "role": [name + "-dev"]
+            },
+            name + "_devops": {
+                "role": [name + "-devops"]
+            }
+        },
+        # Repository Schema
+        "repo": {
+            name: {
+                "type": "docker",
+                "port": docker_port
+            },
+            name + "-raw": {
+                "type": "raw"
+            }
+        },
+        # Rollen ACLs
+        "role": {
+            name + "-dev": {
+                "privileges": [
+                    "nx-repository-view-docker-" + name + "-browse",
+                    "nx-repository-view-docker-" + name + "-read",
+                    "nx-repository-view-raw-" + name + "-raw-browse",
+                    "nx-repository-view-raw-" + name + "-raw-read"
+                ],
+                "contained_roles": []
+            },
+            name + "-devops": {
+                "privileges": [
+                    "nx-repository-admin-docker-" + name + "-*",
+                    "nx-repository-admin-raw-" + name + "-raw-*",
+                    "nx-repository-view-docker-" + name + "-*",
+                    "nx-repository-view-raw-" + name + "-raw-*"
+                ],
+                "contained_roles": [name + "-dev"]
+            }
+        }
+    }
+    return schema
+
+
+def nexus_role_levels(roles):
+    """
+    Nexus Rollen nach enthaltenen Rollen in Stufen einteilen
+
+    Enthaltene Rollen aus roles stehen in einer frueheren Stufe, die
+    Rollen einer Stufe koennen zusammen angelegt werden.
+
+    Args:
+        roles = Rollen Schema siehe nexus (dict)
+
+    Returns:
+        Rollen Namen pro Stufe (list of list)
+    """
+    levels = []
+    done = set()
+    pending = sorted(roles)
+    while pending:
+        level = [name for name in pending
+                 if all(role in done or role not in roles for role in roles[name]["contained_roles"])]
+        if not level:
+            # Zyklus, die restlichen Rollen in einer Stufe
+            level = pending
+        levels.append(level)
+        done.update(level)
+        pending = [name for name in pending if name not in done]
+    return levels
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def dcos(name):
+    """
+    Schema fuer DCOS
+
+    Die User Group ACLs werden erst beim Zugriff auf Umgebung und Rolle
+    gerendert (siehe dcos_acl). Das Ergebnis wird gecached und darf
+    nicht veraendert werden.
+
+    Args:
+        name = Context Name
+
+    Returns:
+        API Schema (dict)
+    """
+    schema = {
+        # Service Group
+        "service_group": dcos_service_group(name),
+        # User Group
+        "user_group": dcos_user_group(name),
+        # User Group ACL
+        "user_group_acl": _AclEnvs(name)
+    }
+    return schema
+
+
+def dcos_service_group(name):
+    """
+    Schema fuer die DCOS Service Gruppe
+
+    Args:
+        name = Context Name
+
+    Returns:
+        API Schema (dict)
+    """
+    return {
+        "id": "/" + name,
+        "groups": [
+            {"id": "/" + name + "/dev"},
+            {"id": "/" + name + "/lpt"},
+            {"id": "/" + name + "/pen"},
+            {"id": "/" + name + "/rc"},
+            {"id": "/" + name + "/scrub"},
+            {"id": "/" + name + "/uat"},
+        ]
+    }
+
+
+def dcos_user_group(name):
+    """
+    Schema fuer die DCOS User Gruppen
+
+    Args:
+        name = Context Name
+
+    Returns:
+        API Schema (dict)
+    """
+    return {
+        "dev_" + name: {
+            "role": "dev"
+        },
+        "devops_" + name: {
+            "role": "devops"
+        }
+    }
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def dcos_acl(name, env, role):
+    """
+    User Group ACL eines Context fuer eine Umgebung und Rolle rendern
+
+    Das Ergebnis wird gecached und darf nicht veraendert werden.
+
+    Args:
+        name = Context Name
+        env = Umgebung (prod, nprod)
+        role = Rolle (dev, devops)
+
+    Returns:
+        ACL Schema (dict: rid -> actions)
+    """
+    return dict((name.join(parts), list(actions)) for parts, actions in _DCOS_ACL_COMPILED[env][role])
+
+
+class _AclEnvs(Mapping):
+    """ User Group ACLs eines Context pro Umgebung, lazy gerendert """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getitem__(self, env):
+        if env not in _DCOS_ACL_COMPILED:
+            raise KeyError(env)
+        return _AclRoles(self._name, env)
+
+    def __iter__(self):
+        return iter(_DCOS_ACL_COMPILED)
+
+    def __len__(self):
+        return len(_DCOS_ACL_COMPILED)
+
+
+class _AclRoles(Mapping):
+    """ User Group ACLs eines Context pro Rolle einer Umgebung, lazy gerendert """
+
+    def __init__(self, name, env):
+        self._name = name
+        self._env = env
+
+    def __getitem__(self, role):
+        if role not in _DCOS_ACL_COMPILED[self._env]:
+            raise KeyError(role)
+        return dcos_acl(self._name, self._env, role)
+
+    def __iter__(self):
+        return iter(_DCOS_ACL_COMPILED[self._env])
+
+    def __len__(self):
+        return len(_DCOS_ACL_COMPILED[self._env])
+
+
+def dcos_roles(env):
+    """
+    Rollen mit ACL Template einer Umgebung
+
+    Args:
+        env = Umgebung (prod, nprod)
+
+    Returns:
+        Rollen (tuple)
+    """
+    return tuple(_DCOS_ACL_COMPILED[env])
+
+
+def dcos_acl_template(env, role):
+    """
+    Kompiliertes ACL Template einer Umgebung und Rolle
+
+    Args:
+        env = Umgebung (prod, nprod)
+        role = Rolle (dev, devops)
+
+    Returns:
+        Tupel aus (Teilstrings der rid, Actions), der Context Name wird
+        zwischen den Teilstrings eingesetzt (tuple)
+    """
+    return _DCOS_ACL_COMPILED[env][role]
+
+
+def encode_rid(rid):
+    """
+    Resource ID fuer die DCOS ACL URL maskieren ('/' doppelt encodiert)
+
+    Args:
+        rid = Resource ID (string)
+
+    Returns:
+        Maskierte Resource ID (string)
+    """
+    return rid.replace("/", "%252F")
@@ -0,0 +1,96 @@
+import threading
+import time
+import requests
+import dcos_context.metrics as metrics
+import dcos_context.trace as trace
+
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from urllib.parse import urlsplit
+
+# Connection Pool
+pool_connections = 4
+pool_maxsize = 16
+pool_block = True
+max_retries = 0
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+class Session(requests.Session):
+    """
+    requests.Session, die jeden Request bei aktiver Messung bzw.
+    Aufzeichnung erfasst (siehe dcos_context/metrics.py und dcos_context/trace.py)
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        if not metrics.enabled and not trace.enabled:
+            return super(Session, self).request(method, url, *args, **kwargs)
+
+        with trace.span(metrics.endpoint(method, url), "http", url=url) as span_args:
+            start = time.perf_counter()
+            try:
+                response = super(Session, self).request(method, url, *args, **kwargs)
+            except requests.RequestException:
+                if metrics.enabled:
+                    metrics.record(method, url, "error", time.perf_counter() - start)
+                raise
+            span_args["status"] = response.status_code
+
+        if metrics.enabled:
+            retries = getattr(response.raw, "retries", None)
+            metrics.record(
+                method, url, str(response.status_code), time.perf_counter() - start,
+                sent=len(response.request.body or b""),
+                received=len(response.content),
+                retries=len(retries.history) if retries is not None else 0
+            )
+        return response
+
+
+def get(url):
+    """
+    Gepoolte HTTP Session fuer einen Cluster ermitteln
+
+    Die Session wird pro Schema/Host/Port nur einmal angelegt, damit
+    TCP Verbindungen (keep-alive) und TLS Sessions zwischen den
+    Requests wiederverwendet werden.
+
+    Args:
+        url = URL oder Basis URL des Clusters (string)
+
+    Returns:
+        requests.Session
+    """
+    parts = urlsplit(url)
+    key = parts.scheme + "://" + parts.netloc
+
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            if not _sessions:
+                # DC/OS wird ohne Zertifikatspruefung angesprochen (siehe dcos.ssl_verify)
+                requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+            session = Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+
+    return session
+
+
+def close():
+    """
+    Alle gepoolten Sessions schliessen
+    """
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
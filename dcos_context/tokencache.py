@@ -0,0 +1,135 @@
+import base64
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+# Cache File, leer = Cache deaktiviert
+path = os.environ.get(
+    "DCOS_CONTEXT_TOKEN_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "dcos_context", "tokens.json")
+)
+
+# Token wird so viele Sekunden vor Ablauf erneuert
+refresh_margin = 300
+
+_tokens = {}
+_lock = threading.Lock()
+
+
+def expiry(token):
+    """
+    Ablaufzeitpunkt aus dem JWT exp Claim lesen
+
+    Args:
+        token = DCOS Token (string)
+
+    Returns:
+        Unix Timestamp (int) oder None
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        return None
+
+
+def get(url, user):
+    """
+    Gueltigen Token aus dem Cache lesen
+
+    Args:
+        url = DCOS URL (string)
+        user = DCOS User (string)
+
+    Returns:
+        Token (string) oder None
+    """
+    key = url + " " + user
+    with _lock:
+        entry = _tokens.get(key)
+        if entry is None and path:
+            entry = _load().get(key)
+
+    if entry is None:
+        return None
+    if entry["exp"] is not None and entry["exp"] - refresh_margin <= time.time():
+        return None
+
+    with _lock:
+        _tokens[key] = entry
+    return entry["token"]
+
+
+def put(url, user, token):
+    """
+    Token im Cache ablegen, Tokens ohne exp Claim nur im Prozess
+
+    Args:
+        url = DCOS URL (string)
+        user = DCOS User (string)
+        token = DCOS Token (string)
+    """
+    exp = expiry(token)
+    key = url + " " + user
+    with _lock:
+        _tokens[key] = {"token": token, "exp": exp}
+        if exp is None or not path:
+            return
+        cache = _load()
+        cache[key] = _tokens[key]
+        now = time.time()
+        _save(dict((k, v) for k, v in cache.items() if v["exp"] > now))
+
+
+def delete(url, user):
+    """
+    Token aus dem Cache entfernen, z.B. nachdem DC/OS ihn abgelehnt hat
+
+    Args:
+        url = DCOS URL (string)
+        user = DCOS User (string)
+    """
+    key = url + " " + user
+    with _lock:
+        _tokens.pop(key, None)
+        if not path:
+            return
+        cache = _load()
+        if cache.pop(key, None) is not None:
+            _save(cache)
+
+
+def _load():
+    """
+    Cache File lesen
+
+    Returns:
+        Cache (dict)
+    """
+    try:
+        with open(path, "r") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(cache):
+    """
+    Cache File atomar und nur fuer den Owner lesbar schreiben
+
+    Args:
+        cache = Cache (dict)
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tokens")
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(tmp_path, path)
+    except OSError as err:
+        logging.warning("DC/OS Token Cache nicht schreibbar: " + str(err))
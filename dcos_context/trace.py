@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+import time
+
+# Aufzeichnung aktiv (siehe --trace)
+enabled = False
+
+_events = []
+_threads = {}
+_lock = threading.Lock()
+_origin = time.perf_counter()
+
+
+class _Span(object):
+    """
+    Zeitabschnitt, wird beim Verlassen als Chrome Trace Event erfasst
+    """
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if enabled:
+            self.start = _now()
+        return self.args
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if self.start is None:
+            return False
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        event = {
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": self.start,
+            "dur": _now() - self.start,
+            "pid": os.getpid(),
+            "tid": _thread(),
+            "args": self.args
+        }
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def span(name, cat="step", **args):
+    """
+    Zeitabschnitt fuer die Timeline erfassen
+
+    Der Abschnitt wird in der Zeile (tid) des ausfuehrenden Threads
+    angezeigt, parallele Requests erscheinen dadurch in eigenen Zeilen.
+    Die zurueckgegebenen args koennen im with Block ergaenzt werden.
+
+    Args:
+        name = Name des Abschnitts (string)
+        cat = Kategorie, z.B. nexus, dcos oder http (string)
+        args = Zusaetzliche Angaben fuer die Anzeige
+
+    Returns:
+        Context Manager
+    """
+    return _Span(name, cat, args)
+
+
+def dump(path):
+    """
+    Trace als Chrome Trace Event JSON schreiben (chrome://tracing, Perfetto)
+
+    Args:
+        path = File (string)
+    """
+    with _lock:
+        data = {"traceEvents": list(_events), "displayTimeUnit": "ms"}
+    with open(path, 'w') as trace_file:
+        json.dump(data, trace_file)
+
+
+def _now():
+    """ Mikrosekunden seit dem Import """
+    return int((time.perf_counter() - _origin) * 1000000)
+
+
+def _thread():
+    """ Kurze Thread ID, beim ersten Auftreten mit Thread Namen erfassen """
+    ident = threading.get_ident()
+    with _lock:
+        tid = _threads.get(ident)
+        if tid is None:
+            tid = _threads[ident] = len(_threads) + 1
+            _events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": threading.current_thread().name}
+            })
+    return tid
@@ -0,0 +1,23 @@
+import pytest
+
+import dcos_context.config as config
+import dcos_context.session as session
+import dcos_context.tokencache as tokencache
+
+from bench.emulator import Emulator
+
+
+@pytest.fixture(autouse=True)
+def no_cache_files(monkeypatch):
+    """ Token und Config Cache Files des Users nicht verwenden """
+    monkeypatch.setattr(tokencache, "path", "")
+    monkeypatch.setattr(tokencache, "_tokens", {})
+    monkeypatch.setattr(config, "path", "")
+
+
+@pytest.fixture
+def emulator():
+    """ Lokaler DC/OS und Nexus Emulator (siehe bench/emulator.py) """
+    with Emulator() as emulator:
+        yield emulator
+    session.close()
@@ -0,0 +1,51 @@
+import logging
+import os
+
+import pytest
+
+import dcos_context.config as config
+import dcos_context.clusters as clusters
+
+CONFIG = """
+dcos_a: {url: "https://a.example", user: api, password: 2024-01-01, workers: 4}
+dcos_b: {url: "https://b.example", user: api, password: secret}
+dcos_all: [dcos_a, dcos_b]
+"""
+
+
+@pytest.fixture
+def cfg_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "path", str(tmp_path / "cache"))
+    path = tmp_path / "dcos.yml"
+    path.write_text(CONFIG)
+    return str(path)
+
+
+def test_load_cached(cfg_path, monkeypatch, caplog):
+    with caplog.at_level(logging.DEBUG):
+        parsed = config.load(cfg_path)
+    assert "als String gespeichert" in caplog.text
+    assert len(os.listdir(config.path)) == 1
+
+    # Cache Treffer ohne YAML Parser
+    monkeypatch.setattr(config, "yaml", None)
+    cached = config.load(cfg_path)
+    assert clusters.resolve("dcos_all", cached) == ["dcos_a", "dcos_b"]
+    assert clusters.workers(cached, "dcos_a", 1) == 4
+    # Nur die benoetigten Eintraege werden ausgepackt
+    assert set(cached._values) == {"dcos_all", "dcos_a"}
+    assert dict(cached) == dict(parsed)
+    assert cached["dcos_a"]["password"] == "2024-01-01"
+
+
+def test_load_changed(cfg_path):
+    assert config.load(cfg_path)["dcos_b"]["password"] == "secret"
+
+    with open(cfg_path, "a") as cfg_file:
+        cfg_file.write("dcos_c: {url: \"https://c.example\", user: api, password: other}\n")
+    assert config.load(cfg_path)["dcos_c"]["password"] == "other"
+
+
+def test_load_without_cache(cfg_path, monkeypatch):
+    monkeypatch.setattr(config, "path", "")
+    assert config.load(cfg_path)["dcos_a"]["password"] == "2024-01-01"
@@ -0,0 +1,118 @@
+import pytest
+
+import dcos_context.clusters as clusters
+import dcos_context.context as context
+import dcos_context.estimate as estimate
+
+from bench.emulator import Emulator
+
+
+def write_manifest(tmp_path):
+    path = tmp_path / "contexts.yml"
+    path.write_text("- {name: ctx_a, port: 30001, cluster: a}\n- {name: ctx_all, port: 30002}\n"
+                    "- {name: ctx_c, port: 30003, cluster: c}\n")
+    return str(path)
+
+
+def cfg(urls):
+    cfg_dcos = dict((name, {"url": url, "user": "u", "password": "p"}) for name, url in urls.items())
+    cfg_nexus = dict((name, {"url": [url], "user": "u", "password": "p"}) for name, url in urls.items())
+    return cfg_dcos, cfg_nexus
+
+
+def test_manifest_owner():
+    assert context._manifest_owner({"name": "x"}, "a", ["a", "b"])
+    assert context._manifest_owner({"name": "x"}, "b", ["a", "b"])
+    assert context._manifest_owner({"name": "x", "cluster": "a"}, "a", ["a", "b"])
+    assert not context._manifest_owner({"name": "x", "cluster": "a"}, "b", ["a", "b"])
+    # Cluster ausserhalb der Liste: nur der erste Lauf
+    assert context._manifest_owner({"name": "x", "cluster": "c"}, "a", ["a", "b"])
+    assert not context._manifest_owner({"name": "x", "cluster": "c"}, "b", ["a", "b"])
+    assert context._manifest_owner({"name": "x", "cluster": "c"}, "a", None)
+
+
+def test_plan_cluster_list(tmp_path):
+    manifest = write_manifest(tmp_path)
+    cfg_dcos, cfg_nexus = cfg({"a": "https://a.example", "b": "https://b.example", "c": "https://c.example"})
+    total = estimate.Estimate(estimate.DEFAULT_LATENCY)
+    for cluster in ("a", "b"):
+        total.join(context.plan_cluster(manifest, None, None, cluster, cfg_dcos, cfg_nexus, True, False,
+                                        estimate.DEFAULT_LATENCY, cluster_list=["a", "b"]))
+
+    # ctx_a und ctx_c einmal, ctx_all auf a und b
+    assert total.counts[estimate.DCOS_SERVICE_GROUP_CREATE] == 4
+
+
+def test_manifest_tasks_cluster_list(tmp_path, emulator):
+    manifest = write_manifest(tmp_path)
+    with Emulator() as emulator_b, Emulator() as emulator_c:
+        cfg_dcos, cfg_nexus = cfg({"a": emulator.url, "b": emulator_b.url, "c": emulator_c.url})
+        for cluster in ("a", "b"):
+            assert context.manifest_tasks(manifest, cluster, cfg_dcos, cfg_nexus, True, False,
+                                          cluster_list=["a", "b"])
+
+        service_groups = "POST /service/marathon/v2/groups"
+        assert emulator.stats()["requests"][service_groups] == 2
+        assert emulator_b.stats()["requests"][service_groups] == 1
+        assert emulator_c.stats()["requests"][service_groups] == 1
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"batch": True},
+    {"parallel": True},
+    {"use_dag": True, "workers": 8},
+    {"reconcile": True, "workers": 4}
+])
+def test_create_delete(emulator, options):
+    cfg_dcos, cfg_nexus = cfg({"a": emulator.url})
+    args = dict(context_name="ctx", port_nexus="30001", cluster="a", cfg_dcos=cfg_dcos, cfg_nexus=cfg_nexus)
+
+    assert context.context_tasks(create=True, delete=False, **args, **options)
+    state = emulator.state
+    assert state.service_groups
+    assert state.groups == {"dev_ctx", "devops_ctx"}
+    assert all(state.acls[rid] for rid in state.acls)
+    assert all(state.nexus.values())
+
+    assert context.context_tasks(create=False, delete=True, **args, **options)
+    assert not state.service_groups
+    assert not state.groups
+    assert not any(state.nexus.values())
+
+
+def test_reconcile_idempotent(emulator):
+    cfg_dcos, cfg_nexus = cfg({"a": emulator.url})
+    args = dict(context_name="ctx", port_nexus="30001", cluster="a", cfg_dcos=cfg_dcos, cfg_nexus=cfg_nexus,
+                create=True, delete=False, workers=4, reconcile=True)
+    assert context.context_tasks(**args)
+    before = emulator.stats()["requests"]
+
+    assert context.context_tasks(**args)
+    after = emulator.stats()["requests"]
+    changed = dict((endpoint, after[endpoint] - before.get(endpoint, 0)) for endpoint in after
+                   if after[endpoint] != before.get(endpoint, 0))
+    # Keine ACL Writes: Gruppen anlegen endet mit 409, sonst nur Lesezugriffe (3 Nexus Reads)
+    assert changed == {
+        "POST /service/marathon/v2/groups": 1,
+        "PUT /acs/api/v1/groups/{gid}": 2,
+        "GET /acs/api/v1/acls": 1,
+        "GET /acs/api/v1/groups/{gid}/permissions": 2,
+        "POST /service/extdirect": 3
+    }
+
+
+def test_manifest_clusters_threads(tmp_path, emulator):
+    path = tmp_path / "contexts.jsonl"
+    path.write_text("".join('{"name": "ctx%02d", "port": %d}\n' % (index, 30000 + index) for index in range(8)))
+    with Emulator() as emulator_b:
+        cfg_dcos, cfg_nexus = cfg({"a": emulator.url, "b": emulator_b.url})
+
+        def cluster_tasks(cluster):
+            return context.manifest_tasks(str(path), cluster, cfg_dcos, cfg_nexus, True, False, jobs=4,
+                                          cluster_list=["a", "b"], workers=4, use_dag=True)
+
+        assert clusters.run(["a", "b"], cluster_tasks)
+        for state in (emulator.state, emulator_b.state):
+            assert len(state.groups) == 16
+            assert len(state.nexus["coreui_Repository"]) == 16
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import dcos_context.dag as dag
+
+
+def recorder(order, lock, name, result=True, delay=0.0):
+    def func():
+        time.sleep(delay)
+        with lock:
+            order.append(name)
+        return result
+    return func
+
+
+def test_dependency_order():
+    order = []
+    lock = threading.Lock()
+    steps = [
+        dag.Step("grant", "dcos_grant", recorder(order, lock, "grant"), ("group", "acl")),
+        dag.Step("group", "dcos_group", recorder(order, lock, "group", delay=0.02), ()),
+        dag.Step("acl", "dcos_acl", recorder(order, lock, "acl"), ())
+    ]
+
+    assert dag.run(steps, workers=4) == {"group": True, "acl": True, "grant": True}
+    assert order[-1] == "grant"
+
+
+def test_workers_bound():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def func():
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return True
+
+    steps = [dag.Step("step%d" % index, "test", func, ()) for index in range(12)]
+    assert all(dag.run(steps, workers=3).values())
+    assert max(peak) == 3
+
+
+def test_failure_skips_dependents():
+    calls = []
+
+    def fail():
+        raise RuntimeError("kaputt")
+
+    steps = [
+        dag.Step("group", "dcos_group", fail, ()),
+        dag.Step("grant", "dcos_grant", lambda: calls.append("grant") or True, ("group",)),
+        dag.Step("revoke", "dcos_grant", lambda: calls.append("revoke") or True, ("grant",)),
+        dag.Step("repo", "nexus_repo", lambda: True, ())
+    ]
+
+    assert dag.run(steps, workers=2) == {"group": False, "grant": False, "revoke": False, "repo": True}
+    assert calls == []
+
+
+def test_cycle():
+    steps = [
+        dag.Step("a", "test", lambda: True, ("b",)),
+        dag.Step("b", "test", lambda: True, ("a",))
+    ]
+
+    assert dag.run(steps, workers=2) == {"a": False, "b": False}
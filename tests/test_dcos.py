@@ -0,0 +1,57 @@
+import time
+
+import dcos_context.dcos as dcos
+import dcos_context.tokencache as tokencache
+
+from bench.emulator import Emulator
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_token_cached(emulator):
+    token = dcos.get_token(emulator.url, "u", "p")
+
+    assert dcos.get_token(emulator.url, "u", "p") == token
+    assert emulator.stats()["requests"]["POST /acs/api/v1/auth/login"] == 1
+
+
+def test_revoked_token_renewed(emulator, tmp_path, monkeypatch):
+    monkeypatch.setattr(tokencache, "path", str(tmp_path / "tokens.json"))
+    token = dcos.get_token(emulator.url, "u", "p")
+    emulator.state.tokens.clear()
+
+    # Parallele Requests mit dem abgelehnten Token loggen nur einmal neu ein
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda index: dcos.create_user_group({"grp%d" % index: {"role": "dev"}}, emulator.url, token),
+            range(8)
+        ))
+    assert all(results)
+    assert emulator.stats()["requests"]["POST /acs/api/v1/auth/login"] == 2
+
+    new_token = tokencache.get(emulator.url, "u")
+    assert new_token != token
+    assert new_token in emulator.state.tokens
+    monkeypatch.setattr(tokencache, "_tokens", {})
+    assert tokencache.get(emulator.url, "u") == new_token
+
+
+def test_token_delete(tmp_path, monkeypatch):
+    monkeypatch.setattr(tokencache, "path", str(tmp_path / "tokens.json"))
+    token = "x." + "eyJleHAiOiA0MTAyNDQ0ODAwfQ" + ".y"
+    tokencache.put("https://dcos.example", "u", token)
+    assert tokencache.get("https://dcos.example", "u") == token
+
+    tokencache.delete("https://dcos.example", "u")
+    assert tokencache.get("https://dcos.example", "u") is None
+
+
+def test_logins_per_cluster_parallel():
+    with Emulator(latency=0.3) as emulator_a, Emulator(latency=0.3) as emulator_b:
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tokens = list(executor.map(lambda url: dcos.get_token(url, "u", "p"), [emulator_a.url, emulator_b.url]))
+        elapsed = time.monotonic() - started
+
+    assert all(tokens)
+    # Nacheinander waeren es mindestens 0.6 Sekunden
+    assert elapsed < 0.55
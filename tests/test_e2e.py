@@ -0,0 +1,44 @@
+import sys
+import time
+
+import pytest
+import requests
+
+import bench.e2e as e2e
+
+from bench.e2e import percentile
+from bench.emulator import Emulator
+
+
+def test_percentile_nearest_rank():
+    assert percentile(list(range(1, 11)), 0.50) == 5
+    assert percentile(list(range(1, 9)), 0.50) == 4
+    assert percentile(list(range(1, 101)), 0.95) == 95
+    assert percentile(list(range(1, 101)), 0.99) == 99
+    assert percentile(list(range(1, 101)), 0.07) == 7
+    assert percentile([3.0], 0.99) == 3.0
+    assert percentile([], 0.5) is None
+
+
+def test_emulator_response_time():
+    with Emulator() as emulator:
+        with requests.Session() as http:
+            # Antwort mit Body (401 JSON), ohne TCP_NODELAY ~40 ms durch verzoegertes ACK
+            http.get(emulator.url + "/acs/api/v1/groups/grp_a")
+            started = time.perf_counter()
+            for index in range(10):
+                response = http.get(emulator.url + "/acs/api/v1/groups/grp_a")
+            elapsed = time.perf_counter() - started
+            assert response.content
+
+    assert elapsed / 10 < 0.02
+
+
+@pytest.mark.parametrize("option", ["--contexts=1,x", "--latency=fast", "--workers=x", "--jobs=", "--tolerance=x"])
+def test_usage_on_invalid_number(monkeypatch, capsys, option):
+    monkeypatch.setattr(sys, "argv", ["e2e.py", option])
+
+    with pytest.raises(SystemExit) as exit_info:
+        e2e.main()
+    assert exit_info.value.code == 2
+    assert "Usage:" in capsys.readouterr().out
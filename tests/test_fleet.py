@@ -0,0 +1,24 @@
+import dcos_context.fleet as fleet
+import dcos_context.plan as plan
+import dcos_context.schema as schema
+
+
+def test_triples_match_schema():
+    state = fleet.Fleet()
+    state.add("ctx", "prod")
+
+    expected = set()
+    for role in ("dev", "devops"):
+        for rid, actions in schema.dcos_acl("ctx", "prod", role).items():
+            expected.update((role + "_ctx", rid, action) for action in actions)
+    assert set((context.gid, rid, action) for context, rid, action in state.triples()) == expected
+
+
+def test_acl_counts_match_plan():
+    for env in ("prod", "nprod"):
+        user_groups = schema.dcos_user_group("ctx")
+        acl_plan = plan.compile_acls(
+            (gid, schema.dcos_acl("ctx", env, user_groups[gid]["role"])) for gid in user_groups
+        )
+        roles = tuple(sorted(group["role"] for group in user_groups.values()))
+        assert fleet.acl_counts(env, roles) == (len(acl_plan.resources), len(acl_plan.grants))
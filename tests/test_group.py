@@ -0,0 +1,53 @@
+import dcos_context.dcos as dcos
+import dcos_context.estimate as estimate
+import dcos_context.group as group
+
+
+def test_manifest_unknown_role(emulator):
+    entries = [
+        {"gid": "grp_a", "role": "devops", "name": "ctx_a"},
+        {"gid": "grp_b", "role": "bogus", "name": "ctx_b"},
+        {"gid": "grp_c", "role": "dev", "name": "ctx_c"}
+    ]
+
+    assert not group.dcos_user_group_batch(False, True, entries, "u", "p", emulator.url, workers=4)
+    assert emulator.state.groups == {"grp_a", "grp_c"}
+
+
+def test_plan_unknown_role():
+    entries = [
+        {"gid": "grp_a", "role": "devops", "name": "ctx_a"},
+        {"gid": "grp_b", "role": "bogus", "name": "ctx_b"}
+    ]
+
+    result = group.plan_user_group(False, True, entries, "https://dcos.example", estimate.DEFAULT_LATENCY,
+                                   batch=True)
+    assert result.counts[estimate.DCOS_USER_GROUP_CREATE] == 1
+
+
+def test_reconcile_idempotent(emulator):
+    args = dict(remove=False, add=True, gid="grp_a", role="dev", context_name="ctx_a", api_user="u", api_pass="p",
+                api_url=emulator.url, workers=4, reconcile=True)
+    assert group.dcos_user_group(**args)
+    grants = emulator.stats()["requests"]["PUT /acs/api/v1/acls/{rid}/groups/{gid}/{action}"]
+
+    assert group.dcos_user_group(**args)
+    assert emulator.stats()["requests"]["PUT /acs/api/v1/acls/{rid}/groups/{gid}/{action}"] == grants
+
+
+def test_api_errors(emulator):
+    args = dict(gid="grp_a", role="dev", context_name="ctx_a", api_user="u", api_pass="p", api_url=emulator.url,
+                workers=4)
+    # Token vorab holen, danach antwortet der Emulator nur noch mit 503
+    dcos.get_token(emulator.url, "u", "p")
+    emulator.error_rate = 1.0
+
+    assert not group.dcos_user_group(remove=False, add=True, **args)
+    assert not group.dcos_user_group(remove=False, add=True, reconcile=True, **args)
+    assert not group.dcos_user_group(remove=True, add=False, **args)
+    assert not emulator.state.groups
+
+
+def test_remove_unknown_group(emulator):
+    assert not group.dcos_user_group(remove=True, add=False, gid="grp_a", role="dev", context_name="ctx_a",
+                                     api_user="u", api_pass="p", api_url=emulator.url)
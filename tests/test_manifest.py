@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import dcos_context.manifest as manifest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Eigener Interpreter, damit yaml beim ersten Zugriff aus den Threads geladen wird
+THREADED_READ = """
+import sys
+import dcos_context.manifest as manifest
+from concurrent.futures import ThreadPoolExecutor
+
+assert "yaml" not in sys.modules
+with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = [executor.submit(lambda: list(manifest.read(sys.argv[1]))) for index in range(8)]
+print(sorted(len(future.result()) for future in futures))
+"""
+
+
+def test_read_yaml_documents(tmp_path):
+    path = tmp_path / "contexts.yml"
+    path.write_text("contexts:\n  - {name: a, port_nexus: 1}\n  - {name: b, port_nexus: 2}\n"
+                    "---\n{name: c, port_nexus: 3}\n")
+
+    assert [entry["name"] for entry in manifest.read(str(path))] == ["a", "b", "c"]
+
+
+def test_read_jsonl(tmp_path):
+    path = tmp_path / "contexts.jsonl"
+    path.write_text('{"name": "a", "port_nexus": 1}\n\n{"name": "b", "port_nexus": 2}\n')
+
+    assert [entry["name"] for entry in manifest.read(str(path))] == ["a", "b"]
+
+
+def test_read_yaml_from_threads(tmp_path):
+    path = tmp_path / "contexts.yml"
+    path.write_text("- {name: a, port_nexus: 1}\n- {name: b, port_nexus: 2}\n")
+
+    for run in range(5):
+        result = subprocess.run([sys.executable, "-c", THREADED_READ, str(path)], cwd=ROOT,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == str([2] * 8)
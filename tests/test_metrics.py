@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import dcos_context.context as context
+import dcos_context.metrics as metrics
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_endpoint_templates():
+    assert metrics.endpoint("put", "https://a.example/acs/api/v1/acls/dcos:x/groups/dev_a/read") == \
+        "PUT /acs/api/v1/acls/{rid}/groups/{gid}/{action}"
+    assert metrics.endpoint("GET", "https://a.example/acs/api/v1/groups/dev_a/permissions") == \
+        "GET /acs/api/v1/groups/{gid}/permissions"
+    assert metrics.endpoint("DELETE", "https://a.example/service/marathon/v2/groups/ctx/app") == \
+        "DELETE /service/marathon/v2/groups/{id}"
+
+
+def test_quantiles(recording):
+    for seconds in [0.004] * 90 + [0.2] * 10:
+        metrics.record("GET", "https://a.example/acs/api/v1/groups/dev_a", "200", seconds)
+
+    entry = metrics.to_dict()["endpoints"]["GET /acs/api/v1/groups/{gid}"]
+    assert entry["count"] == 100
+    assert entry["status"] == {"200": 100}
+    assert entry["p50"] == 0.005
+    assert entry["p95"] == 0.25
+    assert entry["buckets"]["+Inf"] == 100
+
+
+def test_dump(recording, tmp_path):
+    metrics.record("PUT", "https://a.example/acs/api/v1/acls/dcos:x", "201", 0.02, sent=10, received=5)
+    metrics.record("PUT", "https://a.example/acs/api/v1/acls/dcos:x", "error", 30.0)
+    json_path, prom_path = str(tmp_path / "metrics.json"), str(tmp_path / "metrics.prom")
+    metrics.dump(json_path, prom_path)
+
+    with open(json_path) as json_file:
+        assert json.load(json_file)["endpoints"]["PUT /acs/api/v1/acls/{rid}"]["p99"] is None
+    with open(prom_path) as prom_file:
+        lines = prom_file.read().splitlines()
+    labels = 'method="PUT",endpoint="/acs/api/v1/acls/{rid}"'
+    assert "dcos_context_http_request_duration_seconds_count{" + labels + "} 2" in lines
+    assert "dcos_context_http_responses_total{" + labels + ',status="error"} 1' in lines
+    assert "dcos_context_http_sent_bytes_total{" + labels + "} 10" in lines
+
+
+def test_context_requests(recording, emulator):
+    cfg_dcos = {"a": {"url": emulator.url, "user": "u", "password": "p"}}
+    cfg_nexus = {"a": {"url": [emulator.url], "user": "u", "password": "p"}}
+    assert context.context_tasks(create=True, delete=False, context_name="ctx", port_nexus="30001", cluster="a",
+                                 cfg_dcos=cfg_dcos, cfg_nexus=cfg_nexus, workers=4)
+
+    endpoints = metrics.to_dict()["endpoints"]
+    for name, count in emulator.stats()["requests"].items():
+        if name.startswith(("PUT /acs", "POST /service")):
+            assert endpoints[name]["count"] == count
@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+
+import dcos_context.context as context
+import dcos_context.nexus as nexus
+import dcos_context.schema as schema
+
+from bench.emulator import Emulator
+
+
+def test_reconcile_port_type(emulator, caplog):
+    assert nexus.reconcile(schema.nexus("c1", 30001), "u", "p", emulator.url)
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        assert nexus.reconcile(schema.nexus("c1", "30001"), "u", "p", emulator.url)
+    assert not [record for record in caplog.records if "Aktualisiere" in record.getMessage()]
+
+
+def test_reconcile_port_change(emulator, caplog):
+    assert nexus.reconcile(schema.nexus("c1", "30001"), "u", "p", emulator.url)
+
+    with caplog.at_level(logging.INFO):
+        assert nexus.reconcile(schema.nexus("c1", "30002"), "u", "p", emulator.url)
+    assert "NEXUS Aktualisiere docker Repository c1" in caplog.text
+
+
+def test_role_levels():
+    assert schema.nexus_role_levels(schema.nexus("c1", 30001)["role"]) == [["c1-dev"], ["c1-devops"]]
+    roles = {"a": {"contained_roles": ["b", "external"]}, "b": {"contained_roles": []}, "c": {"contained_roles": []}}
+    assert schema.nexus_role_levels(roles) == [["b", "c"], ["a"]]
+
+
+def test_create_batch_waits(monkeypatch):
+    monkeypatch.setattr(nexus, "poll_initial", 0.01)
+    # Der Emulator lehnt Rollen und User ab, deren Repositories bzw. Rollen noch nicht sichtbar sind
+    with Emulator(visibility_delay=0.05) as emulator:
+        assert nexus.create_batch([schema.nexus("c1", 30001), schema.nexus("c2", 30002)], "u", "p", emulator.url)
+        assert len(emulator.state.nexus["coreui_User"]) == 4
+
+
+def test_create_batch_stops_on_error(emulator, monkeypatch):
+    monkeypatch.setattr(nexus, "wait_for", lambda check, msg: pytest.fail("wait nach Fehler: " + msg))
+    nexus.post_json(emulator.url, "u", "p", nexus.repo_create_call("c1", schema.nexus("c1", 30001)["repo"]["c1"]))
+
+    assert not nexus.create_batch([schema.nexus("c1", 30001)], "u", "p", emulator.url)
+    assert not emulator.state.nexus["coreui_Role"]
+
+
+def test_instance_tasks_stop_on_error(emulator, monkeypatch):
+    monkeypatch.setattr(nexus, "wait_for", lambda check, msg: pytest.fail("wait nach Fehler: " + msg))
+    nexus.post_json(emulator.url, "u", "p", nexus.repo_create_call("c1", schema.nexus("c1", 30001)["repo"]["c1"]))
+
+    assert not context.nexus_instance_tasks(schema.nexus("c1", 30001), True, False, emulator.url, "u", "p")
+    assert not emulator.state.nexus["coreui_User"]
+
+
+def test_reconcile_stops_on_error(emulator, monkeypatch):
+    monkeypatch.setattr(nexus, "create_repo", lambda param, user, password, url: False)
+    monkeypatch.setattr(nexus, "wait_for", lambda check, msg: pytest.fail("wait nach Fehler: " + msg))
+
+    assert not nexus.reconcile(schema.nexus("c1", 30001), "u", "p", emulator.url)
+    assert not emulator.state.nexus["coreui_Role"]
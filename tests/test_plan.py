@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+import dcos_context.group as group
+import dcos_context.plan as plan
+import dcos_context.schema as schema
+
+
+def compile_context(name="ctx_a", ba_env="prod"):
+    return plan.compile_acls([("dev_" + name, schema.dcos_acl(name, ba_env, "dev")),
+                              ("devops_" + name, schema.dcos_acl(name, ba_env, "devops"))])
+
+
+def test_dict_round_trip(tmp_path):
+    acl_plan = compile_context()
+    path = str(tmp_path / "plan.json")
+    acl_plan.dump(path)
+
+    with open(path) as plan_file:
+        loaded = plan.Plan.from_dict(json.load(plan_file))
+    assert loaded.resources == acl_plan.resources
+    assert loaded.grants == acl_plan.grants
+    assert loaded.to_dict() == acl_plan.to_dict()
+
+
+def test_shared_resources():
+    acl_plan = compile_context()
+    paths = dict((resource.rid, resource.path) for resource in acl_plan.resources)
+
+    assert len(paths) == len(acl_plan.resources)
+    assert all(grant.path == paths[grant.rid] + "/groups/" + grant.gid + "/" + grant.action
+               for grant in acl_plan.grants)
+
+
+def test_group_plan_file(tmp_path, capsys):
+    cfg_dcos = tmp_path / "dcos.yml"
+    cfg_dcos.write_text("a: {url: 'https://a.example', user: u, password: p}\n"
+                        "b: {url: 'https://b.example', user: u, password: p}\n")
+    path = str(tmp_path / "plan.json")
+
+    with pytest.raises(SystemExit) as exit_info:
+        group.main(["--add", "--gid=grp_a", "--role=dev", "--name=ctx_a", "--cluster=a,b", "--plan",
+                    "--cfg_dcos=" + str(cfg_dcos), "--plan_file=" + path])
+    assert exit_info.value.code == 0
+
+    expected = group.acl_plan(True, [{"gid": "grp_a", "role": "dev", "name": "ctx_a"}], "https://a.example")
+    for cluster in ("a", "b"):
+        with open(str(tmp_path / ("plan." + cluster + ".json"))) as plan_file:
+            assert plan.Plan.from_dict(json.load(plan_file)).grants == expected.grants
+    assert "ACL Plan geschrieben" in capsys.readouterr().out
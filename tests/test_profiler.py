@@ -0,0 +1,32 @@
+import os
+import pstats
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_cfg(tmp_path, url):
+    cfg_dcos = tmp_path / "con.yml"
+    cfg_dcos.write_text("a: {url: '%s', user: u, password: p}\n" % url)
+    cfg_nexus = tmp_path / "nexus.yml"
+    cfg_nexus.write_text("a: {url: ['%s'], user: u, password: p}\n" % url)
+    return str(cfg_dcos), str(cfg_nexus)
+
+
+def test_profile_thread_pool(tmp_path, emulator):
+    cfg_dcos, cfg_nexus = write_cfg(tmp_path, emulator.url)
+    profile_path = str(tmp_path / "run.pstats")
+    env = dict(os.environ, DCOS_CONTEXT_TOKEN_CACHE="", DCOS_CONTEXT_CONFIG_CACHE="")
+
+    result = subprocess.run([sys.executable, "mgt-context.py", "--create", "--cluster=a", "--name=ctx",
+                             "--port_nexus=30001", "--parallel", "--workers=4", "--cfg_dcos=" + cfg_dcos,
+                             "--cfg_nexus=" + cfg_nexus, "--profile=" + profile_path],
+                            cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+    # Aufrufe aus den Pool Threads sind im Profil enthalten
+    functions = pstats.Stats(profile_path).stats
+    assert any(os.path.basename(filename) == "dcos.py" and name == "_send" for filename, line, name in functions)
+    assert emulator.state.groups == {"dev_ctx", "devops_ctx"}
+
@@ -0,0 +1,56 @@
+import json
+import threading
+
+import pytest
+
+import dcos_context.trace as trace
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    monkeypatch.setattr(trace, "enabled", True)
+    monkeypatch.setattr(trace, "_events", [])
+    monkeypatch.setattr(trace, "_threads", {})
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(trace, "_events", [])
+    with trace.span("step"):
+        pass
+
+    assert trace._events == []
+
+
+def test_span_error(recording):
+    with pytest.raises(KeyError):
+        with trace.span("create_acl", cat="dcos", rid="dcos:x") as args:
+            args["status"] = 201
+            raise KeyError("x")
+
+    name, event = trace._events
+    assert name["ph"] == "M"
+    assert event["name"] == "create_acl"
+    assert event["args"] == {"rid": "dcos:x", "status": 201, "error": "KeyError"}
+
+
+def test_dump_threads(recording, tmp_path):
+    # Threads gleichzeitig am Leben halten, sonst wird die Thread ID wiederverwendet
+    barrier = threading.Barrier(3)
+
+    def worker():
+        with trace.span("step"):
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker, name="worker-%d" % index) for index in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    path = str(tmp_path / "trace.json")
+    trace.dump(path)
+
+    with open(path) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+    names = dict((event["tid"], event["args"]["name"]) for event in events if event["ph"] == "M")
+    assert sorted(names.values()) == ["worker-0", "worker-1", "worker-2"]
+    assert sorted(event["tid"] for event in events if event["ph"] == "X") == sorted(names)